@@ -0,0 +1,135 @@
+"""
+수집 기사 한 건의 메모리 표현
+
+기간 백필은 수만 건을 한꺼번에 들고 있으므로 기사마다 dict(키 6~7개)를 두는 대신 __slots__ 객체를 쓴다.
+  - source(언론사 도메인/피드 이름)는 sys.intern으로 같은 문자열 하나를 공유
+  - originallink가 link와 같으면 따로 보관하지 않음
+  - 발행 시각은 수집 단계에서 이미 파싱한 KST 시각을 epoch 초(int)로 한 번만 저장하고,
+    'published' 문자열은 필요할 때 RFC 2822 형식으로 만든다 (파싱하지 못한 원문만 그대로 보관)
+
+기존 코드가 dict로 다루던 방식(get, [], [] = , dict(article), json 직렬화)을 그대로 지원하므로
+체크포인트/저장소/프롬프트 같은 경계에서만 dict로 바뀐다.
+"""
+import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from timestamps import parse_kst
+
+KST = timezone(timedelta(hours=9))
+
+FIELDS = ("title", "link", "published", "summary", "source", "originallink")
+
+_UNPARSED = object()
+
+
+class Article:
+    __slots__ = ("title", "summary", "source", "link", "_originallink", "_published", "_timestamp", "dup_count")
+
+    def __init__(self, title, link, summary="", source="", originallink="", published="", published_at=None,
+                 dup_count=None):
+        """
+        Args:
+            published (str): 원문 발행 시각 문자열 (published_at이 있으면 보관하지 않음)
+            published_at (datetime): 이미 파싱한 발행 시각 (aware)
+        """
+        self.title = title
+        self.summary = summary
+        self.source = sys.intern(source) if source else ""
+        self.link = link
+        self._originallink = None if originallink == link else originallink
+        if published_at is not None:
+            self._published = None
+            self._timestamp = int(published_at.timestamp())
+        else:
+            self._published = published or ""
+            self._timestamp = _UNPARSED if published else None
+        self.dup_count = dup_count
+
+    @classmethod
+    def from_dict(cls, data):
+        if isinstance(data, cls):
+            return data
+        return cls(
+            data.get("title", ""), data.get("link", ""), summary=data.get("summary", ""),
+            source=data.get("source", ""), originallink=data.get("originallink", ""),
+            published=data.get("published", ""), dup_count=data.get("dup_count"),
+        )
+
+    def replace(self, **changes):
+        """일부 필드만 바꾼 복사본 (dict를 거치지 않고 slot 값을 그대로 옮김)"""
+        clone = object.__new__(type(self))
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        for key, value in changes.items():
+            clone[key] = value
+        return clone
+
+    @property
+    def originallink(self):
+        return self.link if self._originallink is None else self._originallink
+
+    @originallink.setter
+    def originallink(self, value):
+        self._originallink = None if value == self.link else value
+
+    @property
+    def timestamp(self):
+        """발행 시각 epoch 초 (알 수 없으면 None). 원문 문자열만 있으면 처음 접근할 때 한 번 파싱"""
+        if self._timestamp is _UNPARSED:
+            dt = parse_kst(self._published)
+            self._timestamp = int(dt.timestamp()) if dt is not None else None
+        return self._timestamp
+
+    @property
+    def published_at(self):
+        """KST 발행 시각 (aware datetime, 알 수 없으면 None)"""
+        ts = self.timestamp
+        return datetime.fromtimestamp(ts, KST) if ts is not None else None
+
+    @property
+    def published(self):
+        if self._published is not None:
+            return self._published
+        return format_datetime(datetime.fromtimestamp(self._timestamp, KST))
+
+    @published.setter
+    def published(self, value):
+        self._published = value or ""
+        self._timestamp = _UNPARSED if value else None
+
+    # dict 호환 인터페이스 -------------------------------------------------
+
+    def keys(self):
+        return FIELDS if self.dup_count is None else FIELDS + ("dup_count",)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def __getitem__(self, key):
+        if key not in self.keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in FIELDS and key != "dup_count":
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.keys() else default
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.keys()]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"Article({self.title!r}, {self.link!r})"
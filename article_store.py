@@ -0,0 +1,216 @@
+"""
+SQLite 기사 저장소
+
+수집기가 기사를 upsert하고, 중복 제거 단계는 "최근 N일 안에 이미 수집/요약한 기사"를
+URL·정규화 제목 인덱스로 조회해서 제외한다 (과거 기사 전체를 메모리에 올리지 않음).
+
+collected_day: 그 기사를 처음 수집한 리포트 대상 날짜 (YYYY-MM-DD)
+summarized_on: 그 기사가 요약 입력으로 들어간 리포트 날짜 (없으면 NULL)
+
+watermarks: 수집 데몬이 키워드/피드별로 마지막으로 본 발행 시각 (다음 폴링은 그 이후분만 조회)
+"""
+import os
+import re
+import sqlite3
+from datetime import datetime, timezone, timedelta
+
+from article import Article
+from timestamps import parse_kst
+
+KST = timezone(timedelta(hours=9))
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB_PATH = os.path.join(BASE_DIR, ".cache", "articles.sqlite3")
+
+_SQL_CHUNK = 500  # SQLite 바인딩 변수 개수 제한 회피용
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url           TEXT PRIMARY KEY,
+    title         TEXT NOT NULL,
+    title_key     TEXT NOT NULL,
+    summary       TEXT,
+    source        TEXT,
+    link          TEXT,
+    published     TEXT,
+    pub_day       TEXT,
+    collected_day TEXT NOT NULL,
+    last_seen     TEXT NOT NULL,
+    summarized_on TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_articles_pub_day ON articles(pub_day);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
+CREATE INDEX IF NOT EXISTS idx_articles_title_key ON articles(title_key);
+CREATE INDEX IF NOT EXISTS idx_articles_collected_day ON articles(collected_day);
+CREATE TABLE IF NOT EXISTS watermarks (
+    source    TEXT PRIMARY KEY,
+    published TEXT NOT NULL,
+    updated   TEXT NOT NULL
+);
+"""
+
+
+def article_key(article):
+    """기사 식별 키 (원문 URL > 네이버 링크 > 제목)"""
+    key = (article.get("originallink") or article.get("link") or "").strip()
+    if not key:
+        # url이 없으면 제목 기반으로라도 키 생성
+        key = f"title::{article.get('title','')}"
+    return key
+
+
+def title_key(title):
+    """제목 정규화 키 (공백/문장부호/대소문자 차이 무시) — 다음날 재송고된 같은 기사 판별용"""
+    return re.sub(r"[\W_]+", "", (title or "").lower())
+
+
+def _pub_day(published):
+    dt = parse_kst(published)
+    return dt.date().isoformat() if dt is not None else None
+
+
+def _article_pub_day(article):
+    if isinstance(article, Article):
+        published_at = article.published_at
+        return published_at.date().isoformat() if published_at else None
+    return _pub_day(article.get("published", ""))
+
+
+def open_store(path=DEFAULT_DB_PATH):
+    """저장소 열기 (없으면 생성)"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def upsert_articles(conn, articles, collected_day):
+    """
+    기사 저장. 이미 있는 URL이면 last_seen만 갱신하고 collected_day는 더 이른 날짜를 유지
+
+    Args:
+        collected_day (str): 이번 실행의 리포트 대상 날짜 'YYYY-MM-DD'
+    """
+    now = datetime.now(KST).isoformat(timespec="seconds")
+    rows = [
+        (
+            article_key(a),
+            a.get("title", ""),
+            title_key(a.get("title", "")),
+            a.get("summary", ""),
+            a.get("source", ""),
+            a.get("link", ""),
+            a.get("published", ""),
+            _article_pub_day(a),
+            collected_day,
+            now,
+        )
+        for a in articles
+    ]
+    with conn:
+        conn.executemany(
+            """
+            INSERT INTO articles (url, title, title_key, summary, source, link, published, pub_day, collected_day, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                last_seen = excluded.last_seen,
+                collected_day = MIN(articles.collected_day, excluded.collected_day)
+            """,
+            rows,
+        )
+    return len(rows)
+
+
+def _known(conn, column, values, since_day, before_day, summarized_only):
+    values = list({v for v in values if v})
+    found = set()
+    if summarized_only:
+        day_filter = "summarized_on >= ? AND summarized_on < ?"
+    else:
+        day_filter = "collected_day >= ? AND collected_day < ?"
+
+    for i in range(0, len(values), _SQL_CHUNK):
+        chunk = values[i:i + _SQL_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        cur = conn.execute(
+            f"SELECT DISTINCT {column} FROM articles WHERE {column} IN ({placeholders}) AND {day_filter}",
+            (*chunk, since_day, before_day),
+        )
+        found.update(row[0] for row in cur)
+    return found
+
+
+def known_urls(conn, keys, since_day, before_day, summarized_only=True):
+    """[since_day, before_day) 사이에 이미 수집(또는 요약)된 URL 키 집합"""
+    return _known(conn, "url", keys, since_day, before_day, summarized_only)
+
+
+def known_title_keys(conn, keys, since_day, before_day, summarized_only=True):
+    """[since_day, before_day) 사이에 이미 수집(또는 요약)된 정규화 제목 집합"""
+    return _known(conn, "title_key", keys, since_day, before_day, summarized_only)
+
+
+def exclusion_window(report_day, days):
+    """리포트 날짜 기준 직전 N일 구간 (since_day, before_day)"""
+    day = datetime.strptime(report_day, "%Y-%m-%d").date()
+    return (day - timedelta(days=days)).isoformat(), day.isoformat()
+
+
+def mark_summarized(conn, articles, report_day):
+    """요약 입력으로 사용된 기사 표시"""
+    with conn:
+        conn.executemany(
+            "UPDATE articles SET summarized_on = ? WHERE url = ? AND (summarized_on IS NULL OR summarized_on < ?)",
+            [(report_day, article_key(a), report_day) for a in articles],
+        )
+
+
+def count_articles(conn):
+    """저장된 기사 수"""
+    return conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+
+def get_watermark(conn, source):
+    """source('naver:<키워드>' / 'rss:<피드>')의 마지막 발행 시각 (aware datetime, 없으면 None)"""
+    row = conn.execute("SELECT published FROM watermarks WHERE source = ?", (source,)).fetchone()
+    return datetime.fromisoformat(row[0]) if row else None
+
+
+def set_watermark(conn, source, published):
+    """워터마크 갱신 (기존 값보다 최신일 때만)"""
+    current = get_watermark(conn, source)
+    if current is not None and current >= published:
+        return
+    with conn:
+        conn.execute(
+            """
+            INSERT INTO watermarks (source, published, updated) VALUES (?, ?, ?)
+            ON CONFLICT(source) DO UPDATE SET published = excluded.published, updated = excluded.updated
+            """,
+            (source, published.isoformat(), datetime.now(KST).isoformat(timespec="seconds")),
+        )
+
+
+def load_articles(conn, pub_day, sources=None):
+    """KST 발행일 기준으로 저장된 기사 조회 (수집 단계와 같은 Article)"""
+    sql = "SELECT * FROM articles WHERE pub_day = ?"
+    params = [pub_day]
+    if sources:
+        sql += f" AND source IN ({','.join('?' * len(sources))})"
+        params.extend(sources)
+    sql += " ORDER BY rowid"  # 수집(삽입) 순서 유지
+
+    out = []
+    for row in conn.execute(sql, params):
+        url = row["url"]
+        out.append(Article(
+            row["title"],
+            row["link"] or url,
+            summary=row["summary"] or "",
+            source=row["source"],
+            originallink="" if url.startswith("title::") else url,
+            published=row["published"],
+        ))
+    return out
@@ -0,0 +1,98 @@
+"""
+유사 기사 판정 엔진 검증 + 처리 시간 비교
+
+    python benchmarks/bench_dedup.py                    # 100 / 600 / 3000건 × 시드 3개
+    python benchmarks/bench_dedup.py --sizes 100 --seeds 0
+
+합성 기사(synthetic.make_articles, 시드 고정)에 대해
+  - dense / sparse 엔진의 남길 기사가 기존 방식(n×n cosine 행렬 + 이중 루프, 아래 _reference_keep)과
+    정확히 같은지
+  - minhash 엔진의 차이(남긴 기사 대칭차 / 기준 남긴 기사 수)가 dedup.MINHASH_TOLERANCE 이하인지
+를 확인한다. 하나라도 어긋나면 종료 코드 1.
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from dedup import MINHASH_TOLERANCE, find_near_duplicates  # noqa: E402
+from synthetic import make_articles  # noqa: E402
+
+DEFAULT_SIZES = [100, 600, 3000]
+DEFAULT_SEEDS = [0, 1, 2]
+THRESHOLD = 0.72
+
+
+def _reference_keep(docs, threshold=THRESHOLD):
+    """엔진 도입 전 remove_duplicates_tfidf의 판정 (그대로 옮김)"""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    tfidf_matrix = TfidfVectorizer(min_df=1, ngram_range=(1, 2)).fit_transform(docs)
+    sim = cosine_similarity(tfidf_matrix)
+
+    keep = []
+    removed = set()
+    for i in range(len(docs)):
+        if i in removed:
+            continue
+        keep.append(i)
+        for j in range(i + 1, len(docs)):
+            if sim[i][j] >= threshold:
+                removed.add(j)
+    return keep
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def check(size, seed):
+    """(통과 여부, 출력 줄)"""
+    articles = make_articles(size, seed=seed)
+    docs = [(a["title"] + " " + a["summary"]).strip() for a in articles]
+
+    expected, reference_seconds = _timed(lambda: _reference_keep(docs))
+    parts = [f"기준 {len(expected)}개 {reference_seconds * 1000:7.1f}ms"]
+    ok = True
+    for engine in ("dense", "sparse", "minhash"):
+        (keep, _, _, _), seconds = _timed(lambda: find_near_duplicates(docs, threshold=THRESHOLD, engine=engine))
+        if engine == "minhash":
+            diff = len(set(keep) ^ set(expected)) / max(1, len(expected))
+            passed = diff <= MINHASH_TOLERANCE
+            mark = f"차이 {diff:.1%}"
+        else:
+            passed = keep == expected
+            mark = "같음" if passed else f"다름 ({len(keep)}개)"
+        ok = ok and passed
+        parts.append(f"{engine} {seconds * 1000:7.1f}ms {'✓' if passed else '✗'} {mark}")
+    return ok, f"  {size:>5}건 시드 {seed}: " + " | ".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="유사 기사 판정 엔진 검증")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="기사 수")
+    parser.add_argument("--seeds", type=int, nargs="+", default=DEFAULT_SEEDS, help="합성 데이터 시드")
+    args = parser.parse_args()
+
+    print(f"🔍 유사 기사 판정 엔진 검증 (threshold {THRESHOLD}, minhash 허용 차이 {MINHASH_TOLERANCE:.0%})")
+    failures = 0
+    for size in args.sizes:
+        for seed in args.seeds:
+            ok, line = check(size, seed)
+            print(line)
+            failures += not ok
+    if failures:
+        print(f"❌ {failures}개 조합에서 기준과 다른 결과")
+        sys.exit(1)
+    print("  ✓ dense/sparse는 기존 방식과 같은 기사를 남기고, minhash는 허용 범위 안")
+
+
+if __name__ == "__main__":
+    main()
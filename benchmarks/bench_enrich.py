@@ -0,0 +1,233 @@
+"""
+본문 보강(enrich.py) 로컬 HTTP 서버 점검
+
+    python benchmarks/bench_enrich.py                 # 기사 200건, 요청당 지연 50ms
+    python benchmarks/bench_enrich.py --articles 500 --delay 0.1
+
+127.0.0.1에 합성 기사 페이지(메뉴/관련 기사 링크/광고 + 본문, 일부는 EUC-KR)를 띄우고
+실제 HttpClient로 enrich_articles를 돌려
+  - 추출한 본문이 페이지에 넣은 본문과 같은지
+  - 도메인별 동시 요청 수가 제한을 넘지 않는지 (127.0.0.1 / localhost 두 호스트, 클라이언트 쪽에서
+    get 호출부터 응답을 닫을 때까지를 센다 — 서버 쪽 핸들러는 클라이언트가 끊은 뒤에도 잠시 살아 있어 부정확)
+  - 연결이 본문을 읽는 도중 끊겨도 그 기사만 실패로 처리되고 실행은 계속되는지
+  - 404·HTML 아닌 응답은 실패로, 크기 제한을 넘은 페이지는 잘린 앞부분으로 처리되는지
+  - 순차(fetch 1개, 추출 인라인) 대비 병렬 처리 시간
+  - 두 번째 실행이 캐시만으로 끝나는지 (요청 0회)
+를 확인한다. 하나라도 어기면 종료 코드 1.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from article import Article  # noqa: E402
+from enrich import FullTextCache, enrich_articles  # noqa: E402
+from http_client import HttpClient  # noqa: E402
+from synthetic import _sentence  # noqa: E402
+
+PER_DOMAIN = 2
+BIG_PAGE_BYTES = 3 * 1024 * 1024
+MAX_BYTES = 1024 * 1024
+
+_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="{charset}"><title>{title}</title>
+<script>var ad = "{noise}";</script><style>.x {{ color: red; }}</style></head>
+<body>
+<header><nav><ul>{menu}</ul></nav></header>
+<div class="wrap">
+  <div class="ad"><a href="/ad">{noise}</a></div>
+  <article><h1>{title}</h1>
+    <div id="articleBody" class="article_body">{body}</div>
+  </article>
+  <aside><h3>많이 본 뉴스</h3><ul>{related}</ul></aside>
+</div>
+<footer>Copyright ⓒ 합성 뉴스. 무단 전재 및 재배포 금지. {noise}</footer>
+</body></html>"""
+
+
+def make_page(i, rng):
+    """(HTML bytes, Content-Type, 본문 문단 목록)"""
+    paragraphs = [" ".join(_sentence(rng, 10) for _ in range(3)) for _ in range(rng.randint(3, 8))]
+    # 본문 형식 두 가지: <p> 문단 / <br><br>로 나눈 텍스트 (국내 언론사에 흔함)
+    if i % 2:
+        body = "".join(f"<p>{p}</p>" for p in paragraphs)
+    else:
+        body = "<br><br>".join(paragraphs)
+    charset = "euc-kr" if i % 5 == 0 else "utf-8"
+    html = _PAGE.format(
+        charset=charset, title=f"합성 기사 {i}", noise=_sentence(rng, 6),
+        menu="".join(f'<li><a href="/s/{k}">섹션 {k}</a></li>' for k in range(12)),
+        related="".join(f'<li><a href="/article/{k}">{_sentence(rng, 8)}</a></li>' for k in range(10)),
+        body=body,
+    )
+    return html.encode(charset), f"text/html; charset={charset}" if i % 3 else "text/html", paragraphs
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+        time.sleep(server.delay)
+        if self.path.startswith("/article/"):
+            body, content_type, _ = server.pages[int(self.path.rsplit("/", 1)[1])]
+            self._send(200, content_type, body)
+        elif self.path == "/big":
+            self._send(200, "text/html", b"<html><body><p>" + b"a" * BIG_PAGE_BYTES + b"</p></body></html>")
+        elif self.path == "/file.pdf":
+            self._send(200, "application/pdf", b"%PDF-1.4")
+        elif self.path == "/reset":
+            # 헤더와 본문 일부만 보내고 연결을 끊음 (본문 읽기 중 ChunkedEncodingError/ConnectionError)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", "100000")
+            self.end_headers()
+            self.wfile.write(b"<html><body><p>")
+            self.wfile.flush()
+            self.close_connection = True
+            self.connection.shutdown(2)
+        else:
+            self._send(404, "text/html", b"not found")
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 크기 제한으로 클라이언트가 먼저 끊음
+
+
+class _CountingClient:
+    """HttpClient 래퍼: 호스트별로 get 호출부터 응답을 닫을 때까지 동시에 열린 요청 수의 최댓값을 센다"""
+
+    def __init__(self, client):
+        self._client = client
+        self._lock = threading.Lock()
+        self._active = {}
+        self.max_active = {}
+
+    def _leave(self, host):
+        with self._lock:
+            self._active[host] -= 1
+
+    def get(self, url, **kwargs):
+        host = urlparse(url).hostname
+        with self._lock:
+            self._active[host] = self._active.get(host, 0) + 1
+            self.max_active[host] = max(self.max_active.get(host, 0), self._active[host])
+        try:
+            response = self._client.get(url, **kwargs)
+        except BaseException:
+            self._leave(host)
+            raise
+        close = response.close
+        closed = []
+
+        def _close():
+            close()
+            if not closed:
+                closed.append(True)
+                self._leave(host)
+
+        response.close = _close
+        return response
+
+    def read_limited(self, response, max_bytes):
+        return self._client.read_limited(response, max_bytes)
+
+
+def start_server(n, delay):
+    rng = random.Random(7)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.pages = [make_page(i, rng) for i in range(n)]
+    server.delay = delay
+    server.lock = threading.Lock()
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_articles(server):
+    port = server.server_address[1]
+    articles = []
+    for i in range(len(server.pages)):
+        host = "127.0.0.1" if i % 2 else "localhost"
+        url = f"http://{host}:{port}/article/{i}"
+        articles.append(Article(f"합성 기사 {i}", url, summary="리드 문장…", source=host, originallink=url))
+    for path in ("/big", "/file.pdf", "/missing", "/reset"):
+        url = f"http://127.0.0.1:{port}{path}"
+        articles.append(Article(path, url, summary="리드 문장…", source="127.0.0.1", originallink=url))
+    return articles
+
+
+def run(server, cache_dir, fetch_workers, extract_workers):
+    articles = make_articles(server)
+    requests_before = server.requests
+    client = _CountingClient(HttpClient(max_retries=0))
+    _, stats = enrich_articles(articles, client=client, cache=FullTextCache(cache_dir) if cache_dir else None,
+                               fetch_workers=fetch_workers, per_domain=PER_DOMAIN, extract_workers=extract_workers,
+                               max_bytes=MAX_BYTES, summary_chars=100_000)
+    stats["requests"] = server.requests - requests_before
+    stats["max_active"] = dict(client.max_active)
+    return articles, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="본문 보강 로컬 HTTP 서버 점검")
+    parser.add_argument("--articles", type=int, default=200, help="기사 페이지 수")
+    parser.add_argument("--delay", type=float, default=0.05, help="요청당 서버 지연(초)")
+    args = parser.parse_args()
+
+    server = start_server(args.articles, args.delay)
+    failures = 0
+
+    def check(ok, message):
+        nonlocal failures
+        print(f"  {'✓' if ok else '✗'} {message}")
+        failures += not ok
+
+    serial_articles, serial = run(server, None, fetch_workers=1, extract_workers=0)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        articles, parallel = run(server, cache_dir, fetch_workers=16, extract_workers=None)
+        _, cached = run(server, cache_dir, fetch_workers=16, extract_workers=None)
+
+    expected = ["\n".join(paragraphs) for _, _, paragraphs in server.pages]
+    matched = sum(1 for article, text in zip(articles, expected) if article["summary"] == text)
+    serial_matched = sum(1 for article, text in zip(serial_articles, expected) if article["summary"] == text)
+    print(f"📄 기사 {args.articles}건 + 예외 케이스 4건 (요청당 {args.delay * 1000:.0f}ms)")
+    check(matched == args.articles, f"본문 일치 {matched}/{args.articles}")
+    check(serial_matched == matched, f"순차 실행과 결과 동일 ({serial_matched}건)")
+    check(parallel["failed"] == 3 and parallel["truncated"] == 1,
+          f"실패 {parallel['failed']}건(기대 3, 본문 읽기 중 끊김 포함), 크기 제한 {parallel['truncated']}건(기대 1)")
+    check(max(parallel["max_active"].values()) <= PER_DOMAIN,
+          f"도메인별 최대 동시 요청 {parallel['max_active']} (제한 {PER_DOMAIN})")
+    check(cached["requests"] == 0 and cached["cached"] == parallel["targets"],
+          f"두 번째 실행 요청 {cached['requests']}회, 캐시 {cached['cached']}/{parallel['targets']}건")
+    speedup = serial["seconds"] / parallel["seconds"] if parallel["seconds"] else float("inf")
+    print(f"  ⏱️  순차 {serial['seconds']:.2f}초 → 병렬 {parallel['seconds']:.2f}초 ({speedup:.1f}배), "
+          f"캐시 {cached['seconds']:.2f}초")
+
+    server.shutdown()
+    if failures:
+        print(f"❌ 점검 실패 {failures}건")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+기사 메모리 표현 비교 (dict vs article.Article)
+
+    python benchmarks/bench_memory.py                  # 5일 × 4000건 = 2만 건
+    python benchmarks/bench_memory.py --days 10 --per-day 5000 --min-saving 0.25
+
+합성 네이버 검색 응답(여러 날짜)을 JSON으로 한 번 직렬화한 뒤, 매번 새로 파싱해서
+  - dict: 이전 수집 코드처럼 기사마다 키 6개짜리 dict
+  - Article: main._naver_item_to_article (__slots__, source intern, 파싱된 발행 시각)
+로 만들고, 원본 응답을 버린 뒤 남은 메모리(tracemalloc)를 비교한다.
+절감 비율이 --min-saving보다 작으면 종료 코드 1.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import main as pipeline  # noqa: E402
+from synthetic import naver_timeline  # noqa: E402
+from timestamps import parse_kst  # noqa: E402
+
+LAST_DAY = "2026-10-01"
+
+
+def _as_dict(item):
+    """Article 도입 전 _naver_item_to_article과 같은 dict"""
+    originallink = item.get("originallink") or ""
+    return {
+        "title": pipeline._clean_html(item.get("title", "")),
+        "link": item.get("link") or originallink,
+        "published": item.get("pubDate", ""),
+        "summary": pipeline._clean_html(item.get("description", ""))[:500],
+        "source": urlparse(originallink).netloc or "네이버뉴스",
+        "originallink": originallink,
+    }
+
+
+def _as_article(item):
+    pub_date_str = item.get("pubDate", "")
+    return pipeline._naver_item_to_article(item, pub_date_str, parse_kst(pub_date_str))
+
+
+def make_payload(days, per_day):
+    """날짜별 네이버 응답 items를 JSON 문자열로 (측정 때마다 새 문자열 객체로 파싱되도록)"""
+    last = datetime.strptime(LAST_DAY, "%Y-%m-%d")
+    items = []
+    for k in range(days):
+        day = (last - timedelta(days=k)).strftime("%Y-%m-%d")
+        items.extend(naver_timeline(per_day, day=day, seed=k, newer=0, older=0))
+    return json.dumps(items, ensure_ascii=False)
+
+
+def retained_bytes(payload, build):
+    """payload를 파싱해 build로 변환하고 원본을 버린 뒤 남은 바이트 수와 기사 수"""
+    gc.collect()
+    tracemalloc.start()
+    items = json.loads(payload)
+    articles = [build(item) for item in items]
+    del items
+    parse_kst.cache_clear()  # 발행 시각 메모는 기사 수와 무관한 고정 크기(CACHE_SIZE)라 제외
+    gc.collect()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return current, len(articles)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 메모리 표현 비교")
+    parser.add_argument("--days", type=int, default=5, help="수집 일수")
+    parser.add_argument("--per-day", type=int, default=4000, help="하루 기사 수")
+    parser.add_argument("--min-saving", type=float, default=0.2, help="최소 절감 비율 (미달 시 실패)")
+    args = parser.parse_args()
+
+    payload = make_payload(args.days, args.per_day)
+    # Article 쪽 첫 측정에 import 비용이 섞이지 않도록 한 번 먼저 실행
+    _as_article(json.loads(payload)[0])
+
+    dict_bytes, count = retained_bytes(payload, _as_dict)
+    article_bytes, _ = retained_bytes(payload, _as_article)
+    saving = 1 - article_bytes / dict_bytes
+
+    print(f"📦 기사 {count}건 ({args.days}일 × {args.per_day}건)")
+    print(f"  dict     {dict_bytes / 1e6:8.1f}MB ({dict_bytes / count:6.0f} B/건)")
+    print(f"  Article  {article_bytes / 1e6:8.1f}MB ({article_bytes / count:6.0f} B/건)")
+    mark = "✓" if saving >= args.min_saving else "✗"
+    print(f"  {mark} 절감 {saving * 100:.1f}% (기준 {args.min_saving * 100:.0f}%)")
+    if saving < args.min_saving:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
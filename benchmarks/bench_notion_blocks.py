@@ -0,0 +1,104 @@
+"""
+notion_blocks 변환기 골든 검증 + 처리량 벤치마크
+
+    python benchmarks/bench_notion_blocks.py                 # 골든 비교 후 벤치마크
+    python benchmarks/bench_notion_blocks.py --update-golden # reports/*.txt 기준 골든 파일 갱신
+
+골든 파일(benchmarks/golden/notion_blocks/*.json)은 reports/ 의 실제 리포트를
+변환한 결과로, 변환기를 고칠 때 출력이 달라지지 않았는지 확인하는 기준이다.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from notion_blocks import markdown_to_notion_blocks  # noqa: E402
+
+REPORTS_GLOB = os.path.join(ROOT, "reports", "daily_report_*.txt")
+GOLDEN_DIR = os.path.join(ROOT, "benchmarks", "golden", "notion_blocks")
+
+
+def _golden_path(report_path):
+    name = os.path.basename(report_path).replace(".txt", ".json")
+    return os.path.join(GOLDEN_DIR, name)
+
+
+def check_golden(update=False):
+    failures = 0
+    for path in sorted(glob.glob(REPORTS_GLOB)):
+        with open(path, "r", encoding="utf-8") as f:
+            blocks = markdown_to_notion_blocks(f.read())
+        golden_path = _golden_path(path)
+
+        if update:
+            os.makedirs(GOLDEN_DIR, exist_ok=True)
+            with open(golden_path, "w", encoding="utf-8") as f:
+                json.dump(blocks, f, ensure_ascii=False, indent=1)
+            print(f"  ✎ {os.path.basename(golden_path)} ({len(blocks)} 블록)")
+            continue
+
+        try:
+            with open(golden_path, "r", encoding="utf-8") as f:
+                expected = json.load(f)
+        except OSError:
+            print(f"  ? {os.path.basename(path)}: 골든 파일 없음")
+            failures += 1
+            continue
+
+        if blocks == expected:
+            print(f"  ✓ {os.path.basename(path)} ({len(blocks)} 블록)")
+        else:
+            print(f"  ✗ {os.path.basename(path)}: 골든과 다름")
+            failures += 1
+    return failures
+
+
+def bench(days_list, repeat):
+    reports = []
+    for path in sorted(glob.glob(REPORTS_GLOB)):
+        with open(path, "r", encoding="utf-8") as f:
+            reports.append(f.read())
+    if not reports:
+        print("  reports/ 에 리포트가 없습니다.")
+        return
+
+    for days in days_list:
+        # 여러 날짜 리포트를 이어붙인 큰 문서
+        text = "\n".join(reports[i % len(reports)] for i in range(days))
+        size_mb = len(text.encode("utf-8")) / (1024 * 1024)
+
+        best = float("inf")
+        blocks = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            blocks = markdown_to_notion_blocks(text)
+            best = min(best, time.perf_counter() - started)
+
+        print(f"  {days:>4}일치 {size_mb:6.2f}MB → {len(blocks):>6} 블록 | "
+              f"{best * 1000:8.1f}ms | {size_mb / best:6.1f} MB/s | {len(blocks) / best:9.0f} 블록/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Notion 블록 변환기 골든 검증/벤치마크")
+    parser.add_argument("--update-golden", action="store_true", help="골든 파일 다시 생성")
+    parser.add_argument("--days", type=int, nargs="+", default=[1, 7, 30, 365], help="이어붙일 리포트 일수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    print("🔎 골든 비교")
+    failures = check_golden(update=args.update_golden)
+    if failures:
+        print(f"❌ 골든 불일치 {failures}건")
+        sys.exit(1)
+
+    print("\n⏱️  처리량")
+    bench(args.days, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
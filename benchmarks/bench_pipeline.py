@@ -0,0 +1,277 @@
+"""
+파이프라인 단계별 오프라인 벤치마크
+
+네이버/RSS/OpenAI/Notion을 benchmarks/fakes.py의 대역으로 바꾸고, 합성 기사
+100건 ~ 5만 건으로 각 단계를 측정한 뒤 저장된 기준(benchmarks/baseline.json)과 비교한다.
+
+    python benchmarks/bench_pipeline.py                        # 기본 크기로 측정 후 기준과 비교
+    python benchmarks/bench_pipeline.py --sizes 100 1000 10000 50000  # 5만 건까지 (수 분 소요)
+    python benchmarks/bench_pipeline.py --only dedup_tfidf     # 일부 단계만
+    python benchmarks/bench_pipeline.py --save-baseline        # 현재 결과를 기준으로 저장
+    python benchmarks/bench_pipeline.py --record 2026-10-01    # 실제 API 응답을 fixtures/recorded/에 기록
+
+fixtures/recorded/ 가 있으면 기록된 네이버/RSS 응답을 재생하는 수집 벤치마크도 함께 돈다.
+결과 건수(result)가 기준과 다르면 동작이 바뀐 것이므로 항상 실패로 처리하고,
+시간은 --tolerance 배를 넘으면 경고(--strict이면 실패)로 처리한다.
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import main as pipeline  # noqa: E402
+from fakes import FakeHttpClient, FakeNotion, FakeOpenAI, RecordingHttpClient, ReplayHttpClient  # noqa: E402
+from fakes import naver_route, static_route  # noqa: E402
+from notion_blocks import markdown_to_notion_blocks, parse_inline_formatting  # noqa: E402
+from notion_publisher import publish_report  # noqa: E402
+from stream_dedup import StreamingDedup  # noqa: E402
+from synthetic import make_articles, make_report, naver_timeline, rss_xml  # noqa: E402
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+RECORDED_DIR = os.path.join(ROOT, "benchmarks", "fixtures", "recorded")
+REPORTS_DIR = os.path.join(ROOT, "reports")
+
+DAY = "2026-10-01"
+DEFAULT_SIZES = [100, 1000, 10000]
+RSS_MAX_ITEMS = 200
+NOISE_FLOOR_SECONDS = 0.005  # 이보다 짧은 측정은 배수 비교가 의미 없어 느려짐 판정에서 제외
+
+
+def _recorded_summary():
+    """FakeOpenAI가 돌려줄 요약: reports/의 가장 최근 실제 리포트"""
+    names = sorted(name for name in os.listdir(REPORTS_DIR) if name.endswith(".txt")) if os.path.isdir(REPORTS_DIR) else []
+    if not names:
+        return "# 요약\n- 기록된 리포트가 없습니다."
+    with open(os.path.join(REPORTS_DIR, names[-1]), "r", encoding="utf-8") as f:
+        return f.read().strip().strip("=").strip()
+
+
+@contextlib.contextmanager
+def _patched(client):
+    """main의 HTTP 클라이언트/API 키/QPS를 벤치마크용으로 교체"""
+    saved = (pipeline.get_client, pipeline.NAVER_MAX_QPS, os.environ.get("NAVER_CLIENT_ID"), os.environ.get("NAVER_CLIENT_SECRET"))
+    pipeline.get_client = lambda: client
+    pipeline.NAVER_MAX_QPS = 1_000_000
+    os.environ["NAVER_CLIENT_ID"] = os.environ.get("NAVER_CLIENT_ID") or "bench"
+    os.environ["NAVER_CLIENT_SECRET"] = os.environ.get("NAVER_CLIENT_SECRET") or "bench"
+    try:
+        yield
+    finally:
+        pipeline.get_client, pipeline.NAVER_MAX_QPS = saved[0], saved[1]
+        for name, value in (("NAVER_CLIENT_ID", saved[2]), ("NAVER_CLIENT_SECRET", saved[3])):
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _synthetic_http(size):
+    per_keyword = math.ceil(size / len(pipeline.NAVER_KEYWORDS))
+    items_by_keyword = {
+        keyword: naver_timeline(per_keyword, day=DAY, seed=k)
+        for k, keyword in enumerate(pipeline.NAVER_KEYWORDS)
+    }
+    # 실제 피드는 수백 건을 넘지 않으므로 피드당 건수는 상한을 둔다
+    per_feed = max(1, min(RSS_MAX_ITEMS, size // len(pipeline.RSS_FEEDS)))
+    routes = {pipeline.NAVER_NEWS_URL: naver_route(items_by_keyword)}
+    for k, (source, url) in enumerate(pipeline.RSS_FEEDS.items()):
+        routes[url] = static_route(rss_xml(make_articles(per_feed, day=DAY, seed=100 + k), title=source))
+    return FakeHttpClient(routes)
+
+
+def build_cases(size):
+    """크기 하나에 대한 (이름, 실행 함수) 목록. 실행 함수는 결과 건수를 반환"""
+    articles = make_articles(size, day=DAY, seed=size)
+    unique = pipeline.dedup_by_url(articles)
+    report = make_report(unique)
+    report_lines = [line for line in report.split("\n") if line.strip()]
+    blocks = markdown_to_notion_blocks(report)
+    http = _synthetic_http(size)
+    summary = _recorded_summary()
+
+    def collect_naver():
+        with _patched(http):
+            return len(pipeline.collect_news_from_naver(target_date=DAY, max_concurrency=4))
+
+    def collect_rss():
+        with _patched(http):
+            return len(pipeline.collect_news_from_rss(target_date=DAY, use_cache=False))
+
+    def summarize():
+        client = FakeOpenAI(summary)
+        pipeline.summarize_news(unique, mode="map-reduce", client=client, max_in_flight=4)
+        return client.calls
+
+    def dedup_stream():
+        # 네이버 한 페이지(100건) 단위로 도착한다고 보고 URL/유사 기사 중복을 온라인으로 제거
+        stream = StreamingDedup()
+        for start in range(0, len(articles), pipeline.NAVER_DISPLAY):
+            stream.add([dict(a) for a in articles[start:start + pipeline.NAVER_DISPLAY]])
+        return len(stream.unique)
+
+    def notion_publish():
+        notion = FakeNotion()
+        publish_report(notion, "bench-db", "벤치마크", DAY, blocks)
+        return notion.calls
+
+    def notion_republish():
+        # notion-client 3.x 대역(databases.query 없음)으로 같은 날짜를 두 번 게시 → 첫 페이지가 보관돼야 함
+        notion = FakeNotion(data_sources=True)
+        publish_report(notion, "bench-db", "벤치마크", DAY, blocks)
+        _, replaced = publish_report(notion, "bench-db", "벤치마크", DAY, blocks)
+        return notion.calls if replaced and len(notion._archived) == 1 else -1
+
+    return [
+        ("collect_naver", collect_naver),
+        ("collect_rss", collect_rss),
+        ("dedup_url", lambda: len(pipeline.dedup_by_url(articles))),
+        ("dedup_tfidf", lambda: len(pipeline.remove_duplicates_tfidf(unique))),
+        ("dedup_stream", dedup_stream),
+        ("parse_inline", lambda: sum(len(parse_inline_formatting(line)) for line in report_lines)),
+        ("notion_blocks", lambda: len(markdown_to_notion_blocks(report))),
+        ("summarize_map_reduce", summarize),
+        ("notion_publish", notion_publish),
+        ("notion_republish", notion_republish),
+    ]
+
+
+def build_recorded_cases():
+    """fixtures/recorded/ 의 실제 응답 재생 (기록이 없으면 빈 목록)"""
+    meta_path = os.path.join(RECORDED_DIR, "meta.json")
+    if not os.path.exists(meta_path):
+        return []
+    with open(meta_path, "r", encoding="utf-8") as f:
+        day = json.load(f)["date"]
+    http = ReplayHttpClient(RECORDED_DIR)
+
+    def collect_naver():
+        with _patched(http):
+            return len(pipeline.collect_news_from_naver(target_date=day, max_concurrency=4))
+
+    def collect_rss():
+        with _patched(http):
+            return len(pipeline.collect_news_from_rss(target_date=day, use_cache=False))
+
+    return [("collect_naver", collect_naver), ("collect_rss", collect_rss)]
+
+
+def record(day):
+    """실제 API로 수집하며 응답을 fixtures/recorded/ 에 저장 (NAVER_CLIENT_ID/SECRET 필요)"""
+    from http_client import get_client
+
+    pipeline.load_dotenv()
+    recorder = RecordingHttpClient(get_client(), RECORDED_DIR)
+    saved = pipeline.get_client
+    pipeline.get_client = lambda: recorder
+    try:
+        naver = pipeline.collect_news_from_naver(target_date=day)
+        rss = pipeline.collect_news_from_rss(target_date=day, use_cache=False)
+    finally:
+        pipeline.get_client = saved
+    with open(os.path.join(RECORDED_DIR, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"date": day, "naver": len(naver), "rss": len(rss)}, f, ensure_ascii=False)
+    print(f"📼 기록 완료: {RECORDED_DIR} (네이버 {len(naver)}건, RSS {len(rss)}건)")
+
+
+def measure(fn, repeat):
+    """repeat회 실행 중 최단 시간과 결과 (stdout은 버림)"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("results", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파이프라인 단계별 오프라인 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="합성 기사 건수")
+    parser.add_argument("--only", nargs="+", default=None, help="측정할 단계 이름")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument("--tolerance", type=float, default=1.3, help="기준 대비 허용 배수")
+    parser.add_argument("--strict", action="store_true", help="시간 회귀도 실패로 처리")
+    parser.add_argument("--save-baseline", action="store_true", help="현재 결과를 기준으로 저장")
+    parser.add_argument("--record", metavar="YYYY-MM-DD", default=None, help="실제 API 응답 기록 후 종료")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record)
+        return
+
+    baseline = load_baseline()
+    results = {}
+    mismatches = 0
+    regressions = 0
+
+    groups = [(str(size), build_cases(size)) for size in args.sizes]
+    recorded = build_recorded_cases()
+    if recorded:
+        groups.append(("recorded", recorded))
+
+    for label, cases in groups:
+        print(f"\n⏱️  {label}건" if label != "recorded" else "\n⏱️  기록된 응답 재생")
+        for name, fn in cases:
+            if args.only and name not in args.only:
+                continue
+            seconds, result = measure(fn, args.repeat)
+            key = f"{name}/{label}"
+            results[key] = {"seconds": round(seconds, 5), "result": result}
+
+            note = ""
+            base = baseline.get(key)
+            if base:
+                ratio = seconds / base["seconds"] if base["seconds"] else 1.0
+                note = f" | 기준 대비 {ratio:5.2f}배"
+                if base["result"] != result:
+                    note += f" ✗ 결과 {base['result']} → {result}"
+                    mismatches += 1
+                elif ratio > args.tolerance and seconds > NOISE_FLOOR_SECONDS:
+                    note += " ⚠️ 느려짐"
+                    regressions += 1
+            print(f"  {name:<22} {seconds * 1000:10.1f}ms | 결과 {result:>7}{note}")
+
+    if args.save_baseline:
+        save_baseline({**baseline, **results})
+        print(f"\n💾 기준 저장: {BASELINE_PATH}")
+        return
+
+    if mismatches or (args.strict and regressions):
+        print(f"\n❌ 결과 불일치 {mismatches}건, 느려짐 {regressions}건")
+        sys.exit(1)
+    if regressions:
+        print(f"\n⚠️  느려짐 {regressions}건 (허용 {args.tolerance}배 초과)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+CLI 시작 시간 점검
+
+    python benchmarks/bench_startup.py                # 예산(기본 0.5초) 초과 시 종료 코드 1
+    python benchmarks/bench_startup.py --budget 0.3 --runs 10
+
+새 프로세스로 `python main.py --help`를 여러 번 실행해 인터프리터 시작부터
+인자 파싱까지의 시간(중앙값)을 재고, `import main`만으로 무거운 의존성
+(main.HEAVY_IMPORTS: sklearn, openai 등)이 로딩되지 않는지 확인한다.
+둘 중 하나라도 어기면 실패로 끝나므로 스케줄러 배포 전 점검에 쓸 수 있다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_PATH = os.path.join(ROOT, "main.py")
+
+STARTUP_BUDGET_SECONDS = 0.5
+
+_CHECK_IMPORTS = (
+    "import json, sys\n"
+    "import main\n"
+    "print(json.dumps([m for m, _ in main.HEAVY_IMPORTS if m in sys.modules]))\n"
+)
+
+
+def measure_startup(runs):
+    """`main.py --help` 실행 시간 목록 (초)"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, MAIN_PATH, "--help"], cwd=ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def eagerly_loaded_modules():
+    """import main 직후 이미 로딩된 무거운 의존성 목록"""
+    output = subprocess.run([sys.executable, "-c", _CHECK_IMPORTS], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI 시작 시간 점검")
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_SECONDS, help="허용 시간(초, 중앙값 기준)")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수")
+    args = parser.parse_args()
+
+    failures = 0
+
+    loaded = eagerly_loaded_modules()
+    if loaded:
+        print(f"  ✗ import main 시점에 로딩된 무거운 의존성: {', '.join(loaded)}")
+        failures += 1
+    else:
+        print("  ✓ import main 시점에 무거운 의존성 없음")
+
+    timings = measure_startup(args.runs)
+    median = statistics.median(timings)
+    mark = "✓" if median <= args.budget else "✗"
+    print(f"  {mark} 시작 → 인자 파싱 중앙값 {median * 1000:.0f}ms "
+          f"(최소 {min(timings) * 1000:.0f}ms, 최대 {max(timings) * 1000:.0f}ms, 예산 {args.budget * 1000:.0f}ms)")
+    if median > args.budget:
+        failures += 1
+
+    if failures:
+        print(f"❌ 시작 시간 점검 실패 {failures}건")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+발행 시각 파싱 비교 (dateutil vs timestamps.parse_kst)
+
+    python benchmarks/bench_timestamps.py              # 17키워드 × 10페이지 × 100건 규모
+    python benchmarks/bench_timestamps.py --items 50000
+
+합성 네이버 pubDate(RFC 822, 키워드 간 겹침을 흉내내 같은 기사가 평균 3번 나옴)와
+RSS에서 보이는 여러 형식(ISO 8601, GMT, 요일 없는 형식 등)을 섞어
+  - 모든 문자열에 대해 dateutil과 같은 KST 시각을 돌려주는지
+  - dateutil 대비 처리 시간 (메모 없이 / LRU 메모 포함)
+를 확인한다. 결과가 하나라도 다르면 종료 코드 1.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import warnings
+from datetime import timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import timestamps  # noqa: E402
+from synthetic import naver_timeline  # noqa: E402
+
+KST = timezone(timedelta(hours=9))
+
+RSS_SAMPLES = [
+    "Wed, 01 Oct 2026 09:30:00 GMT",
+    "Wed, 1 Oct 2026 9:30:00 +0000",
+    "01 Oct 2026 18:30:00 +0900",
+    "Wed, 01 Oct 2026 18:30 +0900",
+    "2026-10-01T09:30:00Z",
+    "2026-10-01T18:30:00+09:00",
+    "2026-10-01 18:30:00",
+    "2026-10-01T18:30:00.123456+09:00",
+    "Wed, 01 Oct 2026 05:30:00 EDT",
+    "2026.10.01 18:30",
+]
+
+
+def _dateutil_kst(value):
+    from dateutil import parser as date_parser
+
+    try:
+        dt = date_parser.parse(value)
+    except Exception:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=KST)
+    return dt.astimezone(KST)
+
+
+def make_values(n, repeat=3):
+    pool = []
+    day = 0
+    while len(pool) < n // repeat:
+        items = naver_timeline(1000, day=f"2026-09-{30 - day % 28:02d}", seed=day, newer=0, older=0)
+        pool.extend(item["pubDate"] for item in items)
+        day += 1
+    values = random.Random(0).choices(pool[:max(1, n // repeat)], k=n)
+    # RSS 형식은 전체의 약 5%
+    for i in range(0, n, 20):
+        values[i] = RSS_SAMPLES[(i // 20) % len(RSS_SAMPLES)]
+    return values
+
+
+def timed(fn, values):
+    started = time.perf_counter()
+    results = [fn(value) for value in values]
+    return results, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발행 시각 파싱 비교")
+    parser.add_argument("--items", type=int, default=17000, help="파싱할 문자열 수")
+    args = parser.parse_args()
+
+    values = make_values(args.items)
+    warnings.simplefilter("ignore")  # dateutil의 UnknownTimezoneWarning (EDT 등)
+    _dateutil_kst(values[0])  # import 비용 제외
+
+    expected, dateutil_seconds = timed(_dateutil_kst, values)
+    uncached, uncached_seconds = timed(timestamps.parse_kst.__wrapped__, values)
+    timestamps.parse_kst.cache_clear()
+    cached, cached_seconds = timed(timestamps.parse_kst, values)
+    info = timestamps.cache_info()
+
+    mismatches = [(v, e, u, c) for v, e, u, c in zip(values, expected, uncached, cached) if not e == u == c]
+    distinct = len(set(values))
+    print(f"🕒 발행 시각 {len(values)}건 (서로 다른 문자열 {distinct}개)")
+    print(f"  dateutil      {dateutil_seconds * 1000:8.1f}ms")
+    print(f"  빠른 경로     {uncached_seconds * 1000:8.1f}ms ({dateutil_seconds / uncached_seconds:.1f}배)")
+    print(f"  + LRU 메모    {cached_seconds * 1000:8.1f}ms ({dateutil_seconds / cached_seconds:.1f}배, "
+          f"적중 {info.hits}/{info.hits + info.misses})")
+    if mismatches:
+        for value, e, u, c in mismatches[:5]:
+            print(f"  ✗ {value!r}: dateutil={e} 빠른 경로={u} 메모={c}")
+        print(f"❌ 결과 불일치 {len(mismatches)}건")
+        sys.exit(1)
+    print("  ✓ 모든 문자열에서 dateutil과 같은 결과")
+
+
+if __name__ == "__main__":
+    main()
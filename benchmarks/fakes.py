@@ -0,0 +1,259 @@
+"""
+벤치마크용 외부 서비스 대역
+
+  - FakeHttpClient: http_client.HttpClient 대신 URL별 핸들러로 응답 (네이버 검색 API, RSS)
+  - RecordingHttpClient / ReplayHttpClient: 실제 응답을 benchmarks/fixtures/recorded/ 에 저장하고 재생
+  - FakeOpenAI: 기록해 둔 요약(reports/의 실제 리포트)을 돌려주는 chat.completions
+  - FakeNotion: notion_client.Client와 같은 메서드를 가진 메모리 구현 (호출 수 집계)
+"""
+import hashlib
+import itertools
+import json
+import os
+import threading
+from types import SimpleNamespace
+from urllib.parse import urlencode, urlparse
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"", headers=None, url=""):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = url
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=16384):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+
+class FakeHttpClient:
+    """
+    Args:
+        routes (dict): {url: handler(params, headers) → FakeResponse}
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def get(self, url, params=None, headers=None, limiter=None, **kwargs):
+        if limiter is not None:
+            limiter.acquire()
+        handler = self.routes.get(url)
+        response = handler(params or {}, headers or {}) if handler else FakeResponse(404)
+        response.url = url
+        with self._lock:
+            stat = self._stats.setdefault(urlparse(url).netloc, {"requests": 0, "bytes": 0})
+            stat["requests"] += 1
+            stat["bytes"] += len(response.content)
+        return response
+
+    def read_limited(self, response, max_bytes, chunk_size=16384):
+        return response.content[:max_bytes], len(response.content) > max_bytes
+
+    def host_stats(self):
+        with self._lock:
+            return {host: dict(stat) for host, stat in self._stats.items()}
+
+    def summary_lines(self):
+        return []
+
+
+def naver_route(items_by_keyword):
+    """네이버 뉴스 검색 API 핸들러 (query/start/display 페이지 단위로 잘라 응답)"""
+    def handler(params, headers):
+        items = items_by_keyword.get(params.get("query"), [])
+        start = int(params.get("start", 1))
+        display = int(params.get("display", 10))
+        body = {
+            "lastBuildDate": "Thu, 01 Oct 2026 23:59:59 +0900",
+            "total": len(items),
+            "start": start,
+            "display": display,
+            "items": items[start - 1:start - 1 + display],
+        }
+        return FakeResponse(200, json.dumps(body, ensure_ascii=False).encode("utf-8"))
+    return handler
+
+
+def static_route(content, headers=None):
+    def handler(params, request_headers):
+        return FakeResponse(200, content, headers=dict(headers or {}))
+    return handler
+
+
+def _record_key(url, params):
+    query = urlencode(sorted((params or {}).items()))
+    return hashlib.sha1(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+
+class RecordingHttpClient:
+    """실제 클라이언트 응답을 그대로 돌려주면서 directory에 저장 (인증 헤더는 저장하지 않음)"""
+
+    def __init__(self, client, directory):
+        self.client = client
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        response = self.client.get(url, params=params, headers=headers, **kwargs)
+        if response.status_code == 200:
+            key = _record_key(url, params)
+            with open(os.path.join(self.directory, f"{key}.body"), "wb") as f:
+                f.write(response.content)
+            with open(os.path.join(self.directory, f"{key}.json"), "w", encoding="utf-8") as f:
+                json.dump({"url": url, "params": params or {}, "status": response.status_code,
+                           "content_type": response.headers.get("Content-Type")}, f, ensure_ascii=False)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+class ReplayHttpClient(FakeHttpClient):
+    """RecordingHttpClient가 저장한 응답 재생 (없는 요청은 404)"""
+
+    def __init__(self, directory):
+        super().__init__({})
+        self.directory = directory
+
+    def get(self, url, params=None, headers=None, limiter=None, **kwargs):
+        if limiter is not None:
+            limiter.acquire()
+        key = _record_key(url, params)
+        try:
+            with open(os.path.join(self.directory, f"{key}.body"), "rb") as f:
+                response = FakeResponse(200, f.read(), url=url)
+        except OSError:
+            response = FakeResponse(404, url=url)
+        with self._lock:
+            stat = self._stats.setdefault(urlparse(url).netloc, {"requests": 0, "bytes": 0})
+            stat["requests"] += 1
+            stat["bytes"] += len(response.content)
+        return response
+
+
+class FakeOpenAI:
+    """
+    chat.completions.create 대역. 항상 content를 돌려주고 usage는 글자 수로 근사
+    stream=True이면 줄 단위 조각으로 나눠 보낸다.
+    """
+
+    def __init__(self, content):
+        self.content = content
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _usage(self, messages):
+        prompt = sum(len(m["content"]) for m in messages) // 2
+        completion = len(self.content) // 2
+        usage = {"prompt_tokens": prompt, "completion_tokens": completion, "total_tokens": prompt + completion}
+        return SimpleNamespace(model_dump=lambda: dict(usage), **usage)
+
+    def _create(self, model, messages, max_tokens=None, temperature=None, stream=False, **kwargs):
+        with self._lock:
+            self.calls += 1
+        usage = self._usage(messages)
+        if not stream:
+            message = SimpleNamespace(content=self.content)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+        chunks = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=line))], usage=None)
+            for line in self.content.splitlines(keepends=True)
+        ]
+        chunks.append(SimpleNamespace(choices=[], usage=usage))
+        return iter(chunks)
+
+
+class FakeNotion:
+    """
+    notion_client.Client 대역 (페이지/블록을 메모리에 보관, calls에 API 호출 수 집계)
+
+    data_sources=True면 notion-client 3.x(Notion-Version 2025-09-03)처럼 databases.query 없이
+    databases.retrieve + data_sources.query만 제공한다.
+    """
+
+    def __init__(self, data_sources=False):
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._page_dates = {}
+        self._archived = set()
+        self._children = {}
+        self.calls = 0
+
+        if data_sources:
+            self.databases = SimpleNamespace(retrieve=self._retrieve_database)
+            self.data_sources = SimpleNamespace(query=self._query_data_source)
+        else:
+            self.databases = SimpleNamespace(query=self._query)
+        self.pages = SimpleNamespace(create=self._create_page, update=self._update_page)
+        self.blocks = SimpleNamespace(
+            children=SimpleNamespace(append=self._append, list=self._list),
+            delete=self._delete,
+        )
+
+    def _count(self):
+        with self._lock:
+            self.calls += 1
+
+    def _query(self, database_id, filter=None, page_size=None, **kwargs):
+        self._count()
+        date_str = (filter or {}).get("date", {}).get("equals")
+        results = [{"id": page_id, "archived": False}
+                   for page_id, page_date in self._page_dates.items()
+                   if page_date == date_str and page_id not in self._archived]
+        return {"results": results[:page_size or 100]}
+
+    def _retrieve_database(self, database_id):
+        self._count()
+        return {"id": database_id, "data_sources": [{"id": f"ds-{database_id}", "name": database_id}]}
+
+    def _query_data_source(self, data_source_id, filter=None, page_size=None, **kwargs):
+        return self._query(data_source_id.removeprefix("ds-"), filter=filter, page_size=page_size)
+
+    def _create_page(self, parent, properties):
+        self._count()
+        page_id = f"page-{next(self._ids)}"
+        date_property = next(value for value in properties.values() if "date" in value)
+        self._page_dates[page_id] = date_property["date"]["start"]
+        self._children[page_id] = []
+        return {"id": page_id}
+
+    def _update_page(self, page_id, properties=None, archived=None):
+        self._count()
+        if archived:
+            self._archived.add(page_id)
+        return {"id": page_id, "archived": page_id in self._archived}
+
+    def _append(self, block_id, children):
+        self._count()
+        for block in children:
+            self._children.setdefault(block_id, []).append(dict(block, id=f"block-{next(self._ids)}"))
+        return {"results": children}
+
+    def _list(self, block_id, page_size=100, start_cursor=None):
+        self._count()
+        blocks = self._children.get(block_id, [])
+        start = int(start_cursor or 0)
+        end = start + page_size
+        return {
+            "results": blocks[start:end],
+            "has_more": end < len(blocks),
+            "next_cursor": str(end) if end < len(blocks) else None,
+        }
+
+    def _delete(self, block_id):
+        self._count()
+        for blocks in self._children.values():
+            blocks[:] = [block for block in blocks if block["id"] != block_id]
+        return {"id": block_id}
@@ -0,0 +1,149 @@
+"""
+벤치마크용 합성 데이터
+
+실제 수집 결과와 비슷한 모양의 기사(dict), 네이버 검색 API 응답 항목, RSS XML을
+seed 고정으로 만든다. URL이 같은 중복(여러 키워드에 걸린 같은 기사)과 제목만
+조금 다른 유사 기사를 일정 비율로 섞어 중복 제거 단계도 실제처럼 일을 하게 한다.
+"""
+import random
+import zlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+KST = timezone(timedelta(hours=9))
+
+_SUBJECTS = [
+    "삼성전자", "SK하이닉스", "네이버", "카카오", "하나은행", "우리은행", "기업은행", "한국은행",
+    "금융위원회", "코스피", "코스닥", "원·달러 환율", "비트코인", "스테이블코인", "엔비디아", "현대차",
+    "LG에너지솔루션", "KB금융", "신한지주", "토스", "삼성증권", "미래에셋", "업비트", "금감원",
+]
+_EVENTS = [
+    "실적 발표", "목표주가 상향", "신규 서비스 출시", "금리 동결", "AI 투자 확대", "디지털자산 규제 논의",
+    "해외 진출", "배당 확대", "구조조정", "인수합병 추진", "사상 최고치", "급락", "공급 계약 체결",
+    "인력 채용", "규제 완화", "보안 사고", "클라우드 전환", "가상자산 거래 재개",
+]
+_WORDS = [
+    "투자자", "시장", "전망", "분기", "영업이익", "매출", "성장", "둔화", "반도체", "수출", "금리", "인하",
+    "발표", "계획", "확대", "축소", "정책", "정부", "규제", "대출", "예금", "플랫폼", "데이터센터", "생성형",
+    "모델", "고객", "점유율", "경쟁", "글로벌", "협력", "파트너십", "출시", "서비스", "결제", "디지털",
+    "자산", "토큰", "거래소", "상장", "공모", "채권", "외국인", "기관", "순매수", "순매도", "지수",
+    "변동성", "리스크", "관리", "연체율", "건전성", "자본", "비율", "배당", "주주", "환원", "전략", "혁신",
+]
+_SUFFIXES = [" …종합", " (상보)", "(종합2보)", " 外", " [속보]"]
+_DOMAINS = [
+    "www.hankyung.com", "www.mk.co.kr", "www.etnews.com", "biz.chosun.com", "www.sedaily.com",
+    "www.yna.co.kr", "news.einfomax.co.kr", "www.edaily.co.kr", "www.fnnews.com", "zdnet.co.kr",
+]
+
+
+def _sentence(rng, words=14):
+    return " ".join(rng.choice(_WORDS) for _ in range(words)) + "."
+
+
+def make_articles(n, day="2026-10-01", seed=0, dup_url_rate=0.1, near_dup_rate=0.15):
+    """
+    n건의 기사 dict 목록 (collect_news_from_naver 결과와 같은 필드, 발행 시각 내림차순)
+
+    Args:
+        day (str): 발행 일자 'YYYY-MM-DD' (KST, 하루 안에 고르게 분포)
+        dup_url_rate (float): 앞선 기사와 URL까지 같은 중복 비율
+        near_dup_rate (float): 앞선 기사 제목에 꼬리말만 붙인 유사 기사 비율
+    """
+    rng = random.Random(seed)
+    start = datetime.strptime(day, "%Y-%m-%d").replace(hour=23, minute=59, tzinfo=KST)
+    step = 86340.0 / max(1, n)
+    articles = []
+
+    for i in range(n):
+        published = format_datetime(start - timedelta(seconds=int(i * step)))
+        r = rng.random()
+        if articles and r < dup_url_rate:
+            article = dict(rng.choice(articles), published=published)
+        elif articles and r < dup_url_rate + near_dup_rate:
+            original = rng.choice(articles)
+            domain = rng.choice(_DOMAINS)
+            link = f"https://{domain}/article/{seed}/{i}"
+            article = {
+                "title": original["title"] + rng.choice(_SUFFIXES),
+                "link": link,
+                "published": published,
+                "summary": original["summary"],
+                "source": domain,
+                "originallink": link,
+            }
+        else:
+            domain = rng.choice(_DOMAINS)
+            link = f"https://{domain}/article/{seed}/{i}"
+            article = {
+                "title": f"{rng.choice(_SUBJECTS)}, {rng.choice(_EVENTS)}… {rng.choice(_WORDS)} "
+                         f"{rng.choice(_WORDS)} {rng.randint(1, 99)}%",
+                "link": link,
+                "published": published,
+                "summary": " ".join(_sentence(rng) for _ in range(3))[:500],
+                "source": domain,
+                "originallink": link,
+            }
+        articles.append(article)
+    return articles
+
+
+def to_naver_item(article):
+    """기사 dict → 네이버 뉴스 검색 API items[] 항목 (HTML 강조 태그/엔티티 포함)"""
+    title = article["title"]
+    first_word = title.split(" ")[0]
+    return {
+        "title": escape(title).replace(first_word, f"<b>{first_word}</b>", 1),
+        "originallink": article["originallink"],
+        "link": f"https://n.news.naver.com/mnews/article/{zlib.crc32(article['link'].encode('utf-8')):010d}",
+        "description": escape(article["summary"]),
+        "pubDate": article["published"],
+    }
+
+
+def naver_timeline(n, day="2026-10-01", seed=0, newer=150, older=100):
+    """
+    키워드 하나의 날짜 내림차순 검색 결과: day보다 최신 기사 newer건 → day 기사 n건 → 과거 기사 older건
+    (과거 날짜 수집 시 앞쪽 페이지를 넘기고 대상 날짜 이후 한 페이지에서 멈추는 흐름이 그대로 재현됨)
+    """
+    next_day = (datetime.strptime(day, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+    prev_day = (datetime.strptime(day, "%Y-%m-%d") - timedelta(days=1)).strftime("%Y-%m-%d")
+    articles = (
+        make_articles(newer, day=next_day, seed=seed + 10_000)
+        + make_articles(n, day=day, seed=seed)
+        + make_articles(older, day=prev_day, seed=seed + 20_000)
+    )
+    return [to_naver_item(article) for article in articles]
+
+
+def rss_xml(articles, title="합성 피드"):
+    """기사 목록 → RSS 2.0 XML bytes"""
+    items = "".join(
+        "<item>"
+        f"<title>{escape(a['title'])}</title>"
+        f"<link>{escape(a['link'])}</link>"
+        f"<description><![CDATA[<p>{a['summary']}</p>]]></description>"
+        f"<pubDate>{a['published']}</pubDate>"
+        "</item>"
+        for a in articles
+    )
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<rss version="2.0"><channel><title>{escape(title)}</title><link>https://example.com/</link>'
+        f"<description>{escape(title)}</description>{items}</channel></rss>"
+    )
+    return xml.encode("utf-8")
+
+
+def make_report(articles, sections=5):
+    """요약 리포트 모양의 마크다운 (Notion 변환/인라인 서식 벤치마크 입력)"""
+    lines = ["# 📊 오늘의 경제/IT 뉴스 브리핑", ""]
+    per_section = max(1, len(articles) // sections)
+    for s in range(sections):
+        lines.append(f"## {s + 1}. {_SUBJECTS[s % len(_SUBJECTS)]} 관련 주요 이슈")
+        for k, article in enumerate(articles[s * per_section:(s + 1) * per_section], 1):
+            lines.append(f"{k}. **{article['title']}**")
+            lines.append(f"   {article['summary'][:160]}")
+            lines.append(f"   - 출처: [{article['source']}]({article['link']}) / 원문 {article['originallink']}")
+        lines.append("")
+    return "\n".join(lines)
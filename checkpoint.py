@@ -0,0 +1,222 @@
+"""
+파이프라인 단계별 체크포인트
+
+날짜별 실행 디렉터리(.cache/runs/YYYYMMDD/)에 단계 출력을 저장해서, 늦은 단계에서 실패했을 때
+수집/요약 같은 느리고 비용이 드는 단계를 다시 돌리지 않고 이어서 실행한다.
+
+단계: collect → dedup_url → dedup_tfidf → enrich(--enrich일 때만) → select → summarize → report → notion
+형식: 기사 목록은 JSONL(불러올 때 Article로 복원), 요약은 텍스트, 나머지는 JSON
+
+여러 프로필 실행(--briefing-profiles)에서는 enrich까지는 날짜 디렉터리를 같이 쓰고, select 이후 단계는
+프로필별 하위 디렉터리(.cache/runs/YYYYMMDD/profiles/<이름>/)에 저장한다.
+"""
+import json
+import os
+
+from article import Article
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RUNS_DIR = os.path.join(BASE_DIR, ".cache", "runs")
+
+STAGES = ("collect", "dedup_url", "dedup_tfidf", "enrich", "select", "summarize", "report", "notion")
+_FORMATS = {
+    "collect": "jsonl",
+    "dedup_url": "jsonl",
+    "dedup_tfidf": "jsonl",
+    "enrich": "jsonl",
+    "select": "jsonl",
+    "summarize": "txt",
+    "report": "json",
+    "notion": "json",
+}
+
+
+class CheckpointMissing(Exception):
+    """불러와야 할 단계의 체크포인트가 없음"""
+
+
+class RunCheckpoint:
+    """날짜 하나의 실행 디렉터리 (profile을 주면 그 프로필의 하위 디렉터리)"""
+
+    def __init__(self, report_day, root=RUNS_DIR, profile=None):
+        self.report_day = report_day
+        self.root = root
+        self.profile = profile
+        self.day_directory = os.path.join(root, report_day.replace("-", ""))
+        self.directory = self.day_directory
+        if profile is not None:
+            self.directory = os.path.join(self.day_directory, "profiles", profile)
+
+    def for_profile(self, profile):
+        return RunCheckpoint(self.report_day, root=self.root, profile=profile)
+
+    def path(self, stage):
+        return os.path.join(self.directory, f"{stage}.{_FORMATS[stage]}")
+
+    def has(self, stage):
+        return os.path.exists(self.path(stage))
+
+    def save(self, stage, value):
+        """저장 후, 이후 단계 체크포인트는 더 이상 유효하지 않으므로 삭제"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(stage)
+        tmp_path = f"{path}.tmp"
+        fmt = _FORMATS[stage]
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            if fmt == "jsonl":
+                for article in value:
+                    f.write(json.dumps(dict(article), ensure_ascii=False))
+                    f.write("\n")
+            elif fmt == "txt":
+                f.write(value)
+            else:
+                json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self._invalidate_after(stage)
+
+    def writer(self, stage, keep_empty=True):
+        """
+        기사 목록 단계(JSONL)를 한 건씩 이어 쓰는 writer (스트리밍 파이프라인용, with 블록으로 사용)
+        정상 종료 시에만 체크포인트로 교체하고, keep_empty=False이면 0건일 때 저장하지 않음
+        """
+        if _FORMATS[stage] != "jsonl":
+            raise ValueError(f"'{stage}' 단계는 JSONL 형식이 아닙니다")
+        return _JsonlWriter(self, stage, keep_empty)
+
+    def _invalidate_after(self, stage):
+        checkpoints = [self]
+        if self.profile is None:
+            # 공통 단계가 바뀌면 프로필별 이후 단계도 무효
+            profiles_dir = os.path.join(self.day_directory, "profiles")
+            if os.path.isdir(profiles_dir):
+                checkpoints += [self.for_profile(name) for name in sorted(os.listdir(profiles_dir))]
+        for checkpoint in checkpoints:
+            for later in STAGES[STAGES.index(stage) + 1:]:
+                try:
+                    os.remove(checkpoint.path(later))
+                except OSError:
+                    pass
+
+    def load(self, stage):
+        path = self.path(stage)
+        fmt = _FORMATS[stage]
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                if fmt == "jsonl":
+                    return [Article.from_dict(json.loads(line)) for line in f if line.strip()]
+                if fmt == "txt":
+                    return f.read()
+                return json.load(f)
+        except OSError:
+            label = self.report_day if self.profile is None else f"{self.report_day} [{self.profile}]"
+            raise CheckpointMissing(f"{label} '{stage}' 단계 체크포인트가 없습니다: {path}")
+
+
+class _JsonlWriter:
+    def __init__(self, checkpoint, stage, keep_empty):
+        self.checkpoint = checkpoint
+        self.stage = stage
+        self.keep_empty = keep_empty
+        self.count = 0
+        self._file = None
+
+    def __enter__(self):
+        os.makedirs(self.checkpoint.directory, exist_ok=True)
+        # 새로 쓰기 시작한 단계 이후의 체크포인트는 이미 유효하지 않음
+        self.checkpoint._invalidate_after(self.stage)
+        self._path = self.checkpoint.path(self.stage)
+        self._file = open(f"{self._path}.tmp", "w", encoding="utf-8")
+        return self
+
+    def write(self, articles):
+        for article in articles:
+            self._file.write(json.dumps(dict(article), ensure_ascii=False))
+            self._file.write("\n")
+            self.count += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if exc_type is None and (self.count or self.keep_empty):
+            os.replace(f"{self._path}.tmp", self._path)
+        else:
+            os.remove(f"{self._path}.tmp")
+        return False
+
+
+class StagePlan:
+    """
+    단계별 실행 여부 결정
+
+    - 기본: 모든 단계를 실행하고 체크포인트 저장
+    - resume: 체크포인트가 있는 단계는 불러오고, 처음 없는 단계부터 끝까지 실행
+    - from_stage: 그 이전 단계는 불러오고, 그 단계부터 끝까지 실행
+    - only_stage: 그 이전 단계는 불러오고, 그 단계만 실행 (이후 단계는 건너뜀)
+
+    action(stage) → 'run' / 'load' / 'skip'
+    """
+
+    def __init__(self, checkpoint, resume=False, from_stage=None, only_stage=None, metrics=None):
+        self.checkpoint = checkpoint
+        self.metrics = metrics
+        self.resume = resume
+        self.from_stage = from_stage
+        self.only_stage = only_stage
+        self._rerunning = False
+
+    def action(self, stage):
+        index = STAGES.index(stage)
+        if self.only_stage:
+            target = STAGES.index(self.only_stage)
+            return "load" if index < target else "run" if index == target else "skip"
+        if self.from_stage:
+            return "load" if index < STAGES.index(self.from_stage) else "run"
+        if self.resume and not self._rerunning:
+            if self.checkpoint.has(stage):
+                return "load"
+            self._rerunning = True
+        return "run"
+
+    def for_profile(self, profile):
+        """같은 실행 옵션으로 프로필 하위 디렉터리를 쓰는 계획"""
+        return StagePlan(self.checkpoint.for_profile(profile), resume=self.resume, from_stage=self.from_stage,
+                         only_stage=self.only_stage, metrics=self.metrics)
+
+    def runs_all(self, stages):
+        """stages가 모두 새로 실행될 단계인지 (스트리밍으로 여러 단계를 한 번에 처리할 수 있는지)"""
+        return all(self.action(stage) == "run" for stage in stages)
+
+    def stops_after(self, stage):
+        """only_stage 실행이면 해당 단계 이후는 진행하지 않음"""
+        return self.only_stage == stage
+
+    def stage(self, stage, run_fn, should_save=None, items_in=None):
+        """
+        단계 하나 처리: 불러오기 / 실행 후 저장 / 건너뛰기(None 반환)
+        should_save(result)가 False이면 저장하지 않음 (예: 요약 실패)
+        metrics가 있으면 소요 시간과 입출력 건수(items_in, 결과가 리스트면 items_out)를 기록
+        """
+        act = self.action(stage)
+        if act == "skip":
+            return None
+        if self.metrics is None:
+            return self._run_or_load(stage, act, run_fn, should_save)
+
+        fields = {"action": act} if items_in is None else {"action": act, "items_in": items_in}
+        if self.checkpoint.profile is not None:
+            fields["profile"] = self.checkpoint.profile
+        with self.metrics.stage(stage, day=self.checkpoint.report_day, **fields) as record:
+            result = self._run_or_load(stage, act, run_fn, should_save)
+            if isinstance(result, list):
+                record["items_out"] = len(result)
+        return result
+
+    def _run_or_load(self, stage, act, run_fn, should_save):
+        if act == "load":
+            value = self.checkpoint.load(stage)
+            print(f"⏭️  '{stage}' 단계: 체크포인트 사용 ({self.checkpoint.path(stage)})")
+            return value
+
+        result = run_fn()
+        if should_save is None or should_save(result):
+            self.checkpoint.save(stage, result)
+        return result
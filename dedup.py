@@ -0,0 +1,293 @@
+"""
+TF-IDF 기반 유사 기사(near-duplicate) 판정 엔진
+
+remove_duplicates_tfidf와 같은 규칙을 따른다:
+  앞에서부터 순서대로 남길 기사를 고르고, 남긴 기사 i와 cosine 유사도가
+  threshold 이상인 뒤쪽 기사 j(j > i)를 제거한다.
+
+엔진
+  - dense  : n×n 전체 유사도 행렬 (기존 방식, 비교용)
+  - sparse : 희소 행렬 곱을 BLOCK_SIZE 행씩 나눠 계산, threshold 이상인 쌍만 보관 (결과 동일)
+  - minhash: 문자 n-gram MinHash-LSH로 후보 쌍만 뽑은 뒤 TF-IDF cosine으로 검증 (대용량용 근사,
+             후보에서 빠진 쌍은 놓칠 수 있어 남긴 기사가 dense와 최대 MINHASH_TOLERANCE 비율까지 다를 수 있음)
+
+OnlineNearDuplicateIndex는 같은 규칙을 문서가 도착하는 대로 적용하는 스트리밍용 인덱스
+(해시 특성 공간이라 전체 문서를 미리 모을 필요가 없음, stream_dedup.py 참고)
+
+numpy/sklearn은 불러오는 데만 1초 넘게 걸려서, 실제로 유사도를 계산할 때 함수 안에서 import한다
+(ENGINES만 필요한 CLI 인자 파싱이나 체크포인트 재사용 실행은 이 비용을 내지 않음).
+"""
+import zlib
+
+ENGINES = ("auto", "dense", "sparse", "minhash")
+
+BLOCK_SIZE = 512
+LSH_MIN_DOCS = 5000  # auto 모드에서 이 건수 이상이면 minhash 사용
+
+MINHASH_PERM = 64
+MINHASH_BANDS = 16
+MINHASH_SHINGLE = 3
+MINHASH_MAX_BUCKET = 200  # 너무 흔한 버킷(상투적 문구)은 후보 폭증을 막기 위해 건너뜀
+MINHASH_TOLERANCE = 0.03  # minhash 결과와 dense 결과의 남긴 기사 차이(대칭차) / dense 남긴 기사 수 허용치
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def choose_engine(n_docs):
+    """문서 수에 따라 엔진 선택"""
+    return "minhash" if n_docs >= LSH_MIN_DOCS else "sparse"
+
+
+def _greedy_keep(n, neighbors):
+    """neighbors[i]: i와 threshold 이상 유사한 j(> i) 목록
+
+    Returns:
+        tuple: (남길 인덱스, 제거된 인덱스 set, 남긴 기사별 묶인 기사 수(자기 포함))
+    """
+    keep = []
+    removed = set()
+    group_sizes = []
+    for i in range(n):
+        if i in removed:
+            continue
+        keep.append(i)
+        before = len(removed)
+        removed.update(neighbors[i])
+        group_sizes.append(1 + len(removed) - before)
+    return keep, removed, group_sizes
+
+
+def _dense_neighbors(tfidf_matrix, threshold):
+    import numpy as np
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    sim = cosine_similarity(tfidf_matrix)
+    n = sim.shape[0]
+    return [(np.nonzero(sim[i, i + 1:] >= threshold)[0] + i + 1).tolist() for i in range(n)]
+
+
+def _sparse_neighbors(tfidf_matrix, threshold, block_size=BLOCK_SIZE):
+    # TfidfVectorizer 출력은 행별 L2 정규화되어 있으므로 내적 = cosine 유사도
+    n = tfidf_matrix.shape[0]
+    transposed = tfidf_matrix.T.tocsc()
+    neighbors = [[] for _ in range(n)]
+
+    for block_start in range(0, n, block_size):
+        block = (tfidf_matrix[block_start:block_start + block_size] @ transposed).tocsr()
+        for offset in range(block.shape[0]):
+            i = block_start + offset
+            row_start, row_end = block.indptr[offset], block.indptr[offset + 1]
+            cols = block.indices[row_start:row_end]
+            vals = block.data[row_start:row_end]
+            mask = (cols > i) & (vals >= threshold)
+            if mask.any():
+                neighbors[i] = sorted(cols[mask].tolist())
+    return neighbors
+
+
+def _shingle_hashes(doc):
+    import numpy as np
+
+    text = "".join(doc.lower().split())
+    if len(text) <= MINHASH_SHINGLE:
+        grams = {text} if text else set()
+    else:
+        grams = {text[k:k + MINHASH_SHINGLE] for k in range(len(text) - MINHASH_SHINGLE + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+def _minhash_signatures(docs, seed=1):
+    import numpy as np
+
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, 1 << 31, size=MINHASH_PERM).astype(np.uint64)
+    b = rng.randint(0, 1 << 31, size=MINHASH_PERM).astype(np.uint64)
+
+    signatures = np.full((len(docs), MINHASH_PERM), np.iinfo(np.uint64).max, dtype=np.uint64)
+    for idx, doc in enumerate(docs):
+        hashes = _shingle_hashes(doc)
+        if hashes.size == 0:
+            continue
+        # (a*x + b) mod p, 32비트 해시값이라 uint64 범위에서 넘치지 않음
+        permuted = (a[:, None] * hashes[None, :] + b[:, None]) % _MERSENNE_PRIME
+        signatures[idx] = permuted.min(axis=1)
+    return signatures
+
+
+def _minhash_neighbors(tfidf_matrix, docs, threshold):
+    import numpy as np
+
+    n = tfidf_matrix.shape[0]
+    signatures = _minhash_signatures(docs)
+    rows = MINHASH_PERM // MINHASH_BANDS
+
+    candidates = set()
+    for band in range(MINHASH_BANDS):
+        buckets = {}
+        band_sig = signatures[:, band * rows:(band + 1) * rows]
+        for i in range(n):
+            buckets.setdefault(band_sig[i].tobytes(), []).append(i)
+        for members in buckets.values():
+            if len(members) < 2 or len(members) > MINHASH_MAX_BUCKET:
+                continue
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    candidates.add((members[x], members[y]))
+
+    neighbors = [[] for _ in range(n)]
+    if not candidates:
+        return neighbors
+
+    # 후보 쌍만 실제 TF-IDF cosine으로 검증해 threshold 의미를 유지
+    pairs = np.array(sorted(candidates), dtype=np.int64)
+    sims = np.asarray(tfidf_matrix[pairs[:, 0]].multiply(tfidf_matrix[pairs[:, 1]]).sum(axis=1)).ravel()
+    for (i, j), s in zip(pairs.tolist(), sims.tolist()):
+        if s >= threshold:
+            neighbors[i].append(j)
+    return neighbors
+
+
+def find_near_duplicates(docs, threshold=0.72, engine="auto"):
+    """
+    유사 문서 판정
+
+    Args:
+        docs (list[str]): 비교할 텍스트 (title + summary)
+        threshold (float): cosine 유사도 기준
+        engine (str): auto / dense / sparse / minhash
+
+    Returns:
+        tuple: (남길 인덱스 list, 제거된 인덱스 set, 사용한 엔진 이름,
+                남긴 기사별 묶인 기사 수 list — keep과 같은 순서)
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"알 수 없는 중복 제거 엔진: {engine}")
+    if engine == "auto":
+        engine = choose_engine(len(docs))
+
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(min_df=1, ngram_range=(1, 2))
+    tfidf_matrix = vectorizer.fit_transform(docs)
+
+    if engine == "dense":
+        neighbors = _dense_neighbors(tfidf_matrix, threshold)
+    elif engine == "sparse":
+        neighbors = _sparse_neighbors(tfidf_matrix, threshold)
+    else:
+        neighbors = _minhash_neighbors(tfidf_matrix, docs, threshold)
+
+    keep, removed, group_sizes = _greedy_keep(len(docs), neighbors)
+    return keep, removed, engine, group_sizes
+
+
+ONLINE_THRESHOLD = 0.72
+ONLINE_N_FEATURES = 2 ** 18
+ONLINE_MAX_KEPT = 20000  # 비교 대상으로 유지할 최근 남긴 문서 수 (인덱스 메모리 상한)
+
+
+class OnlineNearDuplicateIndex:
+    """
+    문서가 도착하는 대로 판정하는 온라인 유사 문서 인덱스
+
+    HashingVectorizer(고정 크기 특성 공간, 학습 없음)로 묶음 단위 벡터화한 뒤 지금까지 남긴
+    문서 블록과 희소 행렬 곱으로 비교한다. 판정 규칙은 find_near_duplicates와 같다
+    (앞에서부터 남길 문서를 고르고, 남긴 문서와 threshold 이상이면 제거 — 가장 먼저 남긴 문서에 묶임).
+    IDF 없이 L2 정규화한 단어/바이그램 빈도라서 TF-IDF 결과와 완전히 같지는 않다.
+
+    max_kept를 넘으면 가장 오래된 블록부터 비교 대상에서 빠지므로 메모리가 입력 크기와 무관하게 묶인다.
+    """
+
+    def __init__(self, threshold=ONLINE_THRESHOLD, n_features=ONLINE_N_FEATURES, max_kept=ONLINE_MAX_KEPT,
+                 block_size=BLOCK_SIZE):
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        self.threshold = threshold
+        self.max_kept = max_kept
+        self.block_size = block_size
+        self.vectorizer = HashingVectorizer(n_features=n_features, ngram_range=(1, 2),
+                                            alternate_sign=False, norm="l2")
+        self._blocks = []  # (첫 번째 id, 남긴 문서 벡터 블록 k×F CSR)
+        self._index_t = None  # 블록 전체를 전치해 이어 붙인 F×K CSR (블록이 바뀔 때만 다시 만듦)
+        self._pending = []  # 아직 블록으로 합치지 않은 남긴 문서 벡터 묶음 (CSR)
+        self._pending_count = 0
+        self._pending_start = 0
+        self.kept_count = 0
+
+    def _first_match(self, matrix):
+        """행마다 threshold 이상인 가장 작은 열 번호 (없으면 -1)"""
+        import numpy as np
+
+        matrix = matrix.tocoo()
+        hit = matrix.data >= self.threshold
+        first = np.full(matrix.shape[0], matrix.shape[1], dtype=np.int64)
+        np.minimum.at(first, matrix.row[hit], matrix.col[hit])
+        first[first == matrix.shape[1]] = -1
+        return first
+
+    def _match_index(self, vectors):
+        """이미 남긴 문서 중 가장 먼저 남긴 유사 문서 id (없으면 -1)"""
+        import numpy as np
+        import scipy.sparse as sp
+
+        matched = np.full(vectors.shape[0], -1, dtype=np.int64)
+        if self._index_t is not None:
+            first = self._first_match(vectors @ self._index_t)
+            hit = first >= 0
+            matched[hit] = self._blocks[0][0] + first[hit]
+        if self._pending:
+            # 블록 id가 대기 중인 문서 id보다 항상 작으므로 블록에서 찾지 못한 경우만 채움
+            first = self._first_match(vectors @ sp.vstack(self._pending).T.tocsr())
+            fill = (matched < 0) & (first >= 0)
+            matched[fill] = self._pending_start + first[fill]
+        return matched
+
+    def _append_kept(self, vectors):
+        import scipy.sparse as sp
+
+        if not self._pending:
+            self._pending_start = self.kept_count - vectors.shape[0]
+        self._pending.append(vectors)
+        self._pending_count += vectors.shape[0]
+        if self._pending_count < self.block_size:
+            return
+
+        self._blocks.append((self._pending_start, sp.vstack(self._pending).tocsr()))
+        self._pending = []
+        self._pending_count = 0
+        while len(self._blocks) > 1 and self.kept_count - self._blocks[0][0] > self.max_kept:
+            self._blocks.pop(0)
+        self._index_t = sp.vstack([block for _, block in self._blocks]).T.tocsr()
+
+    def add(self, docs):
+        """
+        문서 묶음 판정 (입력 순서대로)
+
+        Returns:
+            list[tuple]: 문서마다 (남김 여부, id) — 남겼으면 새 id, 중복이면 묶인 남긴 문서의 id
+        """
+        if not docs:
+            return []
+        vectors = self.vectorizer.transform(docs).tocsr()
+        matched = self._match_index(vectors).tolist()
+
+        # 같은 묶음 안에서 앞서 남긴 문서와 비교
+        within = (vectors @ vectors.T).tocsr()
+        kept_rows = {}  # 묶음 안 행 번호 → 남긴 id
+        results = []
+        for row in range(vectors.shape[0]):
+            if matched[row] < 0:
+                start, end = within.indptr[row], within.indptr[row + 1]
+                earlier = [int(col) for col, value in zip(within.indices[start:end], within.data[start:end])
+                           if col < row and value >= self.threshold and col in kept_rows]
+                if earlier:
+                    matched[row] = kept_rows[min(earlier)]
+            if matched[row] < 0:
+                kept_rows[row] = self.kept_count
+                self.kept_count += 1
+                results.append((True, kept_rows[row]))
+            else:
+                results.append((False, matched[row]))
+
+        if kept_rows:
+            self._append_kept(vectors[list(kept_rows)])
+        return results
@@ -0,0 +1,300 @@
+"""
+원문 본문 보강 (선택 단계, --enrich)
+
+RSS/네이버 description은 앞부분만 잘린 리드 문장인 경우가 많아서, 중복 제거 이후 남은 기사의
+originallink 페이지를 받아 본문을 추출하고 summary를 본문 앞부분으로 바꾼다.
+  - 가져오기: 스레드 풀 + 도메인별 동시 요청 수 제한, stream으로 받아 MAX_BYTES까지만 읽음
+  - 추출: CPU 작업이라 프로세스 풀에서 실행 (HTML 파싱이 네트워크 대기와 GIL을 두고 다투지 않도록)
+  - 캐시: URL별 추출 결과를 .cache/fulltext/ 에 저장 (실패도 FAILURE_TTL 동안 기억해 같은 URL을 반복 요청하지 않음)
+
+본문 추출은 의존성 없이 html.parser로 한다: script/style/nav 등을 빼고 텍스트 조각을 가장 가까운
+컨테이너(div/article/section/td) 단위로 묶어, 링크 비율이 낮은 긴 조각의 합이 가장 큰 컨테이너를 본문으로 본다.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from html.parser import HTMLParser
+from urllib.parse import urlparse
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "fulltext")
+
+MAX_BYTES = 1024 * 1024
+FETCH_TIMEOUT = 10
+FETCH_WORKERS = 16
+PER_DOMAIN_LIMIT = 2
+ENRICHED_SUMMARY_CHARS = 1000
+MIN_BODY_CHARS = 200  # 이보다 짧으면 본문을 찾지 못한 것으로 봄
+FAILURE_TTL = 24 * 3600
+
+_SKIP_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "aside", "form", "iframe", "button",
+              "select", "svg", "figcaption"}
+_CONTAINER_TAGS = {"div", "article", "section", "td", "main", "body"}
+_BREAK_TAGS = {"p", "br", "div", "li", "h1", "h2", "h3", "h4", "h5", "h6", "tr", "article", "section",
+               "blockquote", "table", "ul", "ol", "dd", "dt"}
+_VOID_TAGS = {"br", "img", "hr", "meta", "link", "input", "source", "wbr", "col", "area", "base", "embed"}
+_MIN_SEGMENT = 25
+_MAX_LINK_RATIO = 0.5
+_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w-]+)""", re.IGNORECASE)
+
+
+class _BodyParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._stack = []  # (tag, 컨테이너 id)
+        self._skip_depth = 0
+        self._link_depth = 0
+        self._next_id = 0
+        self._buffer = []
+        self._link_chars = 0
+        self.segments = []  # (컨테이너 id, 텍스트, 링크 글자 수)
+
+    def _container(self):
+        for tag, node_id in reversed(self._stack):
+            if tag in _CONTAINER_TAGS:
+                return node_id
+        return -1
+
+    def _flush(self):
+        text = re.sub(r"\s+", " ", "".join(self._buffer)).strip()
+        if text:
+            self.segments.append((self._container(), text, self._link_chars))
+        self._buffer = []
+        self._link_chars = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _BREAK_TAGS:
+            self._flush()
+        if tag in _VOID_TAGS:
+            return
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        if tag == "a":
+            self._link_depth += 1
+        self._next_id += 1
+        self._stack.append((tag, self._next_id))
+
+    def handle_endtag(self, tag):
+        if tag in _VOID_TAGS:
+            return
+        # 닫히지 않은 태그가 섞여 있어도 가장 가까운 같은 태그까지 되감음
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                break
+        else:
+            return
+        if tag in _BREAK_TAGS:
+            self._flush()
+        for open_tag, _ in self._stack[index:]:
+            if open_tag in _SKIP_TAGS:
+                self._skip_depth -= 1
+            if open_tag == "a":
+                self._link_depth -= 1
+        del self._stack[index:]
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        self._buffer.append(data)
+        if self._link_depth:
+            self._link_chars += len(data.strip())
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def _decode(body, content_type=""):
+    match = re.search(r"charset=([\w-]+)", content_type or "", re.IGNORECASE)
+    charset = match.group(1) if match else None
+    if charset is None:
+        meta = _CHARSET_RE.search(body[:4096])
+        charset = meta.group(1).decode("ascii", "ignore") if meta else "utf-8"
+    charset = charset.lower()
+    if charset in ("euc-kr", "ks_c_5601-1987", "ksc5601"):
+        charset = "cp949"  # euc-kr 선언 페이지도 실제로는 cp949 확장 문자를 쓰는 경우가 많음
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def extract_main_text(body, content_type=""):
+    """
+    HTML bytes에서 본문 텍스트 추출 (찾지 못하면 빈 문자열)
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 둔다.
+    """
+    parser = _BodyParser()
+    try:
+        parser.feed(_decode(body, content_type))
+        parser.close()
+    except Exception:
+        return ""
+
+    scores = {}
+    for container, text, link_chars in parser.segments:
+        if len(text) >= _MIN_SEGMENT and link_chars / len(text) <= _MAX_LINK_RATIO:
+            scores[container] = scores.get(container, 0) + len(text)
+    if not scores:
+        return ""
+    best = max(scores, key=scores.get)
+    if scores[best] < MIN_BODY_CHARS:
+        return ""
+    return "\n".join(text for container, text, link_chars in parser.segments
+                     if container == best and link_chars / len(text) <= _MAX_LINK_RATIO)
+
+
+class FullTextCache:
+    """URL별 추출 결과 디스크 캐시 ({"url", "text", "status", "fetched"})"""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, failure_ttl=FAILURE_TTL):
+        self.directory = directory
+        self.failure_ttl = failure_ttl
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, url):
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not entry.get("text") and time.time() - entry.get("fetched", 0) > self.failure_ttl:
+            return None
+        return entry
+
+    def put(self, url, text, status):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "text": text, "status": status, "fetched": time.time()}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+class _DomainLimiter:
+    def __init__(self, limit):
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def __call__(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.limit)
+            return self._semaphores[host]
+
+
+def _fetch(client, url, limiter, max_bytes):
+    """(상태, HTML bytes, Content-Type, 잘렸는지) — 연결/본문 읽기 오류는 'error: ...' 상태로 (보강은 선택 단계)"""
+    with limiter(url):
+        response = None
+        try:
+            response = client.get(url, stream=True, timeout=FETCH_TIMEOUT)
+            content_type = response.headers.get("Content-Type", "")
+            if response.status_code != 200:
+                return f"http {response.status_code}", None, content_type, False
+            if content_type and "html" not in content_type.lower():
+                return "not html", None, content_type, False
+            body, truncated = client.read_limited(response, max_bytes)
+            return "ok", body, content_type, truncated
+        except Exception as e:
+            return f"error: {type(e).__name__}", None, "", False
+        finally:
+            if response is not None:
+                response.close()
+
+
+def _extraction_result(result):
+    """(본문, 상태) — 추출(프로세스 풀 포함) 중 예외는 빈 본문 + 'error: ...' 상태로"""
+    try:
+        text = result() if callable(result) else result.result()
+    except Exception as e:
+        return "", f"error: {type(e).__name__}"
+    return text, "ok" if text else "no body"
+
+
+def enrich_articles(articles, client=None, cache=None, fetch_workers=FETCH_WORKERS, per_domain=PER_DOMAIN_LIMIT,
+                    extract_workers=None, max_bytes=MAX_BYTES, summary_chars=ENRICHED_SUMMARY_CHARS):
+    """
+    originallink 본문으로 summary 보강 (articles를 그대로 수정해서 반환)
+
+    Args:
+        client: http_client.HttpClient 호환 객체 (None이면 공용 클라이언트)
+        cache (FullTextCache): None이면 캐시 없이 매번 가져옴
+        extract_workers (int): 본문 추출 프로세스 수 (None이면 CPU 수, 0이면 가져온 스레드에서 바로 추출)
+    """
+    if client is None:
+        from http_client import get_client
+
+        client = get_client()
+    started = time.perf_counter()
+    stats = {"targets": 0, "enriched": 0, "cached": 0, "failed": 0, "truncated": 0}
+
+    by_url = {}
+    for article in articles:
+        url = (article.get("originallink") or "").strip()
+        if url.startswith(("http://", "https://")):
+            by_url.setdefault(url, []).append(article)
+    stats["targets"] = len(by_url)
+
+    texts = {}
+    pending = []
+    for url in by_url:
+        entry = cache.get(url) if cache else None
+        if entry is not None:
+            stats["cached"] += 1
+            texts[url] = entry["text"]
+        else:
+            pending.append(url)
+
+    if pending:
+        limiter = _DomainLimiter(per_domain)
+        extractor = ProcessPoolExecutor(max_workers=extract_workers) if extract_workers != 0 else None
+        try:
+            with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool:
+                fetches = {fetch_pool.submit(_fetch, client, url, limiter, max_bytes): url for url in pending}
+                extractions = {}
+                for future in as_completed(fetches):
+                    url = fetches[future]
+                    status, body, content_type, truncated = future.result()
+                    stats["truncated"] += truncated
+                    if body is None:
+                        texts[url] = ""
+                        if cache:
+                            cache.put(url, "", status)
+                    else:
+                        if extractor is not None:
+                            try:
+                                # 나머지 페이지를 받는 동안 추출을 프로세스 풀에서 진행
+                                extractions[url] = extractor.submit(extract_main_text, body, content_type)
+                                continue
+                            except BrokenExecutor:
+                                pass  # 추출 프로세스가 죽은 풀이면 이 스레드에서 추출
+                        extractions[url] = _extraction_result(lambda: extract_main_text(body, content_type))
+
+            for url, result in extractions.items():
+                text, status = result if isinstance(result, tuple) else _extraction_result(result)
+                texts[url] = text
+                if cache:
+                    cache.put(url, text, status)
+        finally:
+            if extractor is not None:
+                extractor.shutdown()
+
+    for url, text in texts.items():
+        if not text:
+            stats["failed"] += 1
+            continue
+        stats["enriched"] += 1
+        for article in by_url[url]:
+            article["summary"] = text[:summary_chars]
+
+    stats["seconds"] = round(time.perf_counter() - started, 3)
+    return articles, stats
@@ -0,0 +1,223 @@
+"""
+공용 HTTP 클라이언트
+
+네이버/RSS 수집기(그리고 이후 본문 수집기)가 같은 연결 풀을 쓰도록 하나로 모은 계층.
+  - keep-alive 세션 + 연결 풀, gzip
+  - 429/5xx·연결 오류 재시도 (Retry-After 우선, 없으면 지터가 섞인 지수 백오프)
+  - 호스트별 동시 요청 수 제한 (stream=True 응답은 close할 때까지 슬롯을 잡아 본문 전송도 포함)
+  - 호스트별 요청 수/바이트/지연 시간 집계
+
+requests는 첫 클라이언트를 만들 때 import한다 (HTTP가 필요 없는 실행의 시작 시간 단축).
+"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+DEFAULT_TIMEOUT = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_PER_HOST_LIMIT = 8
+MAX_RETRY_AFTER = 60.0
+USER_AGENT = "Mozilla/5.0 (compatible; news-summarizer/1.0)"
+
+
+def _retry_after_seconds(value):
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 초로 변환"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _release_on_close(response, release):
+    """response.close()가 처음 불릴 때 release 호출 (read_limited, with 문, 재시도 전 close 모두 해당)"""
+    close = response.close
+    released = []
+
+    def _close():
+        try:
+            close()
+        finally:
+            if not released:
+                released.append(True)
+                release()
+
+    response.close = _close
+
+
+class HttpClient:
+    """
+    Args:
+        pool_size (int): 호스트별 연결 풀 크기
+        per_host_limit (int): 호스트별 동시 요청 수 기본값
+        host_limits (dict): 호스트별 동시 요청 수 개별 지정 {netloc: n}
+        max_retries (int): 재시도 횟수
+        backoff (float): 지수 백오프 기본 대기(초)
+    """
+
+    def __init__(self, pool_size=16, per_host_limit=DEFAULT_PER_HOST_LIMIT, host_limits=None,
+                 max_retries=DEFAULT_MAX_RETRIES, backoff=DEFAULT_BACKOFF, timeout=DEFAULT_TIMEOUT):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._transient_errors = (requests.ConnectionError, requests.Timeout)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+
+        self.per_host_limit = per_host_limit
+        self.host_limits = dict(host_limits or {})
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._stats = {}
+
+    def _semaphore(self, host):
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.host_limits.get(host, self.per_host_limit))
+                self._semaphores[host] = sem
+            return sem
+
+    def _record(self, host, elapsed=0.0, nbytes=0, requests_=0, retries=0, errors=0):
+        with self._lock:
+            stat = self._stats.setdefault(host, {"requests": 0, "bytes": 0, "elapsed": 0.0, "retries": 0, "errors": 0})
+            stat["requests"] += requests_
+            stat["bytes"] += nbytes
+            stat["elapsed"] += elapsed
+            stat["retries"] += retries
+            stat["errors"] += errors
+
+    def _delay(self, attempt, response=None):
+        if response is not None:
+            retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, MAX_RETRY_AFTER)
+        return self.backoff * (2 ** attempt) * (0.5 + random.random())
+
+    def request(self, method, url, timeout=None, stream=False, limiter=None, **kwargs):
+        """
+        요청 전송 (재시도 포함). 재시도를 다 써도 실패한 상태 코드는 그대로 응답으로 반환하고,
+        연결 오류는 마지막 예외를 다시 던진다.
+        stream=True이면 본문을 읽지 않고 반환하므로 read_limited로 읽어야 바이트가 집계된다.
+        이때 호스트 동시 요청 슬롯은 응답을 close할 때(read_limited는 자동) 반환되므로 반드시 닫아야 한다.
+        limiter(TokenBucket 등)가 있으면 재시도를 포함한 시도마다 토큰 1개를 사용한다.
+        """
+        host = urlparse(url).netloc
+        timeout = timeout or self.timeout
+        attempt = 0
+
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+            started = time.perf_counter()
+            try:
+                response, nbytes = self._send(host, method, url, timeout=timeout, stream=stream, **kwargs)
+            except self._transient_errors:
+                self._record(host, elapsed=time.perf_counter() - started, requests_=1, errors=1)
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(self._delay(attempt))
+                attempt += 1
+                self._record(host, retries=1)
+                continue
+
+            self._record(host, elapsed=time.perf_counter() - started, nbytes=nbytes, requests_=1)
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                delay = self._delay(attempt, response)
+                response.close()
+                time.sleep(delay)
+                attempt += 1
+                self._record(host, retries=1)
+                continue
+            return response
+
+    def _send(self, host, method, url, stream=False, **kwargs):
+        """요청 1회 (호스트 슬롯 안에서). (응답, 읽은 바이트 수)"""
+        sem = self._semaphore(host)
+        sem.acquire()
+        try:
+            response = self.session.request(method, url, stream=stream, **kwargs)
+            nbytes = 0 if stream else len(response.content)
+        except BaseException:
+            sem.release()
+            raise
+        if stream:
+            _release_on_close(response, sem.release)
+        else:
+            sem.release()
+        return response, nbytes
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def read_limited(self, response, max_bytes, chunk_size=16384):
+        """stream=True 응답을 max_bytes까지만 읽고 연결 반환. (본문 bytes, 잘렸는지 여부)"""
+        host = urlparse(response.url).netloc
+        chunks = []
+        total = 0
+        truncated = False
+        started = time.perf_counter()
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if not chunk:
+                    continue
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= max_bytes:
+                    truncated = True
+                    break
+        finally:
+            response.close()
+        self._record(host, elapsed=time.perf_counter() - started, nbytes=total)
+        return b"".join(chunks)[:max_bytes], truncated
+
+    def host_stats(self):
+        """호스트별 집계 스냅샷 {host: {requests, bytes, elapsed, retries, errors}}"""
+        with self._lock:
+            return {host: dict(stat) for host, stat in self._stats.items()}
+
+    def summary_lines(self):
+        lines = []
+        for host, stat in sorted(self.host_stats().items()):
+            avg_ms = stat["elapsed"] / stat["requests"] * 1000 if stat["requests"] else 0.0
+            lines.append(
+                f"{host}: {stat['requests']}회, {stat['bytes'] / 1024:.0f}KB, 평균 {avg_ms:.0f}ms"
+                + (f", 재시도 {stat['retries']}회" if stat["retries"] else "")
+                + (f", 오류 {stat['errors']}회" if stat["errors"] else "")
+            )
+        return lines
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def get_client():
+    """프로세스 공용 HttpClient"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
+
+
+def existing_client():
+    """이미 만들어진 공용 HttpClient (HTTP를 쓰지 않은 실행이면 None — 새로 만들지 않음)"""
+    with _default_lock:
+        return _default_client
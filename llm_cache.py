@@ -0,0 +1,137 @@
+"""
+OpenAI 응답 디스크 캐시 (content-addressed)
+
+키 = sha256(model, messages, temperature, max_tokens). 같은 날짜를 다시 돌리거나
+요약 이후 단계(Notion 등)에서 실패해 재실행할 때 같은 프롬프트를 다시 보내지 않는다.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "llm")
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_MAX_AGE_DAYS = 30
+EVICT_EVERY = 200  # 크기 한도 안이어도 이만큼 저장할 때마다 디렉터리를 훑어 만료 항목 정리
+EVICT_TARGET = 0.9  # 한도를 넘으면 이 비율까지 줄여 바로 다음 저장에서 다시 훑지 않게 함
+
+
+def cache_key(model, messages, temperature, max_tokens):
+    payload = json.dumps(
+        {"model": model, "messages": messages, "temperature": temperature, "max_tokens": max_tokens},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    Args:
+        read (bool): False이면 캐시를 읽지 않고 새로 호출한 결과로 덮어씀 (--refresh)
+        max_bytes (int): 캐시 디렉터리 최대 크기, 넘으면 오래된 항목부터 삭제
+        max_age_days (float): 이보다 오래된 항목은 무효
+
+    디렉터리 전체를 훑는 정리(evict)는 저장마다 하지 않는다. 처음 저장할 때 한 번 훑어 전체 크기를 구한 뒤
+    저장한 바이트를 더해 가다가, max_bytes를 넘거나 EVICT_EVERY번 저장했을 때만 다시 훑는다.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES,
+                 max_age_days=DEFAULT_MAX_AGE_DAYS, read=True):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        self.read = read
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes = None  # 마지막 정리 이후 추정 전체 크기 (아직 훑지 않았으면 None)
+        self._puts_since_evict = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key):
+        if not self.read:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.max_age:
+                os.remove(path)
+                raise FileNotFoundError(path)
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def put(self, key, content, usage=None):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"content": content, "usage": usage, "created": time.time()}, f, ensure_ascii=False)
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        written = os.path.getsize(tmp_path)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._puts_since_evict += 1
+            if self._total_bytes is not None:
+                self._total_bytes += written - replaced
+            due = (self._total_bytes is None or self._total_bytes > self.max_bytes
+                   or self._puts_since_evict >= EVICT_EVERY)
+        if due:
+            self.evict()
+
+    def evict(self):
+        """만료 항목 삭제 후, 전체 크기가 max_bytes를 넘으면 max_bytes × EVICT_TARGET까지 오래된 순으로 삭제"""
+        entries = []
+        now = time.time()
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                if now - st.st_mtime > self.max_age:
+                    _remove_quietly(path)
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_TARGET if total > self.max_bytes else self.max_bytes
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            _remove_quietly(path)
+            total -= size
+        with self._lock:
+            self._total_bytes = total
+            self._puts_since_evict = 0
+
+    def summary_line(self):
+        return f"LLM 캐시: hit {self.hits} / miss {self.misses}"
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -1,22 +1,63 @@
-import feedparser
-import openai
-import os
 import time
+_MODULE_STARTED = time.perf_counter()
+
+import os
 import re
+import sys
 import html
-import requests 
+import json
+import hashlib
 import argparse  # 커맨드라인 인자 처리용
+import contextlib
+import importlib
+import signal
+import sqlite3
+import threading
+import queue
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from dotenv import load_dotenv
-from dateutil import parser as date_parser
-import notion_client
+
+from article import Article
+from article_store import (
+    article_key, count_articles, exclusion_window, get_watermark, known_title_keys, known_urls,
+    load_articles, mark_summarized, open_store, set_watermark, title_key, upsert_articles,
+)
+from checkpoint import STAGES, CheckpointMissing, RunCheckpoint, StagePlan
+from dedup import ENGINES as DEDUP_ENGINES, find_near_duplicates
+from enrich import FullTextCache, enrich_articles
+from http_client import existing_client, get_client
+from llm_cache import LLMCache, cache_key
+from metrics import DEFAULT_METRICS_PATH, current as current_metrics
+from notion_blocks import markdown_to_notion_blocks, parse_inline_formatting
+from notion_publisher import (
+    DATE_PROPERTY_NAME, NOTION_REQUESTS_PER_SECOND, TITLE_PROPERTY_NAME, publish_many, publish_report,
+)
+from profiles import DEFAULT_INSIGHT, DEFAULT_PROFILES_PATH, ProfileError, load_profiles, union_keywords
+from query_planner import KeywordPlanner
+from ratelimit import TokenBucket
+from report_index import index_report, open_index, search_main
+from report_stream import ReportStreamWriter
+from selection import DEFAULT_TOKEN_BUDGET, format_article_line, select_articles
+from stream_dedup import StreamingDedup
+from timestamps import parse_kst, struct_to_kst
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 load_dotenv(os.path.join(BASE_DIR, ".env"))
 
+# 불러오는 데 오래 걸리는 의존성은 실제로 쓰는 단계 안에서 import한다.
+# (수집 0건으로 끝나거나 체크포인트로 Notion만 재등록하는 실행이 sklearn/openai 로딩을 기다리지 않도록)
+# --timing-imports로 각 모듈의 import 시간을 확인할 수 있다. 순서: 의존되는 모듈 먼저
+HEAVY_IMPORTS = [
+    ("requests", "네이버/RSS 수집"),
+    ("feedparser", "RSS 파싱"),
+    ("numpy", "유사 기사 제거"),
+    ("sklearn.feature_extraction.text", "유사 기사 제거"),
+    ("openai", "요약"),
+    ("notion_client", "Notion 등록"),
+]
+
 # 한국 주요 언론사 RSS 피드
 RSS_FEEDS = {
     "한국경제": "https://www.hankyung.com/feed/economy",
@@ -28,6 +69,9 @@ RSS_FEEDS = {
 
 KST = timezone(timedelta(hours=9))
 
+CACHE_DIR = os.path.join(BASE_DIR, ".cache")
+RSS_CACHE_DIR = os.path.join(CACHE_DIR, "rss")
+
 def _clean_html(text: str) -> str:
     """HTML 태그/엔티티 제거"""
     if not text:
@@ -36,7 +80,106 @@ def _clean_html(text: str) -> str:
     text = re.sub(r"<[^>]+>", "", text)
     return text.strip()
 
-def collect_news_from_rss(target_date=None):
+def _rss_cache_path(url):
+    return os.path.join(RSS_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _load_rss_cache(url):
+    try:
+        with open(_rss_cache_path(url), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_rss_cache(url, etag, modified, entries):
+    os.makedirs(RSS_CACHE_DIR, exist_ok=True)
+    path = _rss_cache_path(url)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"url": url, "etag": etag, "modified": modified, "entries": entries}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _rss_entry_to_dict(entry):
+    """feedparser 엔트리에서 필요한 필드만 캐시 가능한 dict로 변환"""
+    parsed = entry.get("published_parsed")
+    return {
+        "title": entry.get("title", ""),
+        "link": entry.get("link", ""),
+        "published": entry.get("published", ""),
+        "published_parsed": list(parsed[:6]) if parsed else None,
+        "summary": entry.get("summary", ""),
+    }
+
+
+def _fetch_rss_feed(source, url, use_cache=True):
+    """
+    피드 하나를 조건부 GET(If-None-Match/If-Modified-Since)으로 조회
+    304이면 XML 파싱 없이 디스크 캐시의 엔트리를 그대로 사용
+    use_cache=False이면 캐시를 읽지도 쓰지도 않음 (벤치마크 등이 실제 .cache/rss를 덮어쓰지 않게)
+    """
+    started = time.perf_counter()
+    cached = _load_rss_cache(url) if use_cache else None
+    entries = []
+    not_modified = False
+    error = None
+
+    try:
+        request_headers = {}
+        if cached:
+            if cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached.get("modified"):
+                request_headers["If-Modified-Since"] = cached["modified"]
+        response = get_client().get(url, headers=request_headers, timeout=10)
+
+        if response.status_code == 304 and cached:
+            entries = cached.get("entries", [])
+            not_modified = True
+        elif response.status_code != 200:
+            error = f"HTTP {response.status_code}"
+        else:
+            import feedparser
+
+            feed = feedparser.parse(response.content)
+            entries = [_rss_entry_to_dict(e) for e in feed.entries[:100]]
+            if entries and use_cache:
+                _save_rss_cache(url, response.headers.get("ETag"), response.headers.get("Last-Modified"), entries)
+            elif not entries and feed.get("bozo"):
+                error = str(feed.get("bozo_exception", "피드 파싱 실패"))
+
+    except Exception as e:
+        error = str(e)
+
+    return {
+        "source": source,
+        "entries": entries,
+        "not_modified": not_modified,
+        "elapsed": time.perf_counter() - started,
+        "error": error,
+    }
+
+
+def _rss_entry_kst_datetime(entry):
+    if entry.get("published_parsed"):
+        return struct_to_kst(entry["published_parsed"])
+    return parse_kst(entry.get("published", ""))
+
+
+def _rss_entry_to_article(entry, source, published_at=None):
+    return Article(
+        _clean_html(entry.get("title", "")),
+        entry.get("link", ""),
+        summary=_clean_html(entry.get("summary", ""))[:500],
+        source=source,
+        originallink=entry.get("link", ""),  # RSS는 보통 link가 원문
+        published=entry.get("published", ""),
+        published_at=published_at,
+    )
+
+
+def collect_news_from_rss(target_date=None, use_cache=True):
     """RSS로 뉴스 수집 (fallback / 또는 기본)"""
     print("📰 RSS로 뉴스 수집 시작...")
     all_articles = []
@@ -52,63 +195,345 @@ def collect_news_from_rss(target_date=None):
     else:
         print("📅 수집 대상 날짜: 전체(피드 최신 기사)\n")
 
-    for source, url in RSS_FEEDS.items():
-        try:
-            print(f"  → {source} 수집 중...")
-            feed = feedparser.parse(url)
-
-            count = 0
-            for entry in feed.entries[:100]:
-                published_raw = entry.get("published", "")
-
-                if target_day is not None:
-                    entry_date = None
-                    try:
-                        if entry.get("published_parsed"):
-                            parsed = entry.published_parsed
-                            dt_utc = datetime(*parsed[:6], tzinfo=timezone.utc)
-                            entry_date = dt_utc.astimezone(KST).date()
-                        elif published_raw:
-                            dt = date_parser.parse(published_raw)
-                            if dt.tzinfo is None:
-                                dt = dt.replace(tzinfo=KST)
-                            entry_date = dt.astimezone(KST).date()
-                    except Exception:
-                        entry_date = None
-
-                    if entry_date != target_day:
-                        continue
-
-                title = _clean_html(entry.get("title", ""))
-                summary = _clean_html(entry.get("summary", ""))[:500]
-
-                article = {
-                    "title": title,
-                    "link": entry.get("link", ""),
-                    "published": published_raw,
-                    "summary": summary,
-                    "source": source,
-                    "originallink": entry.get("link", ""),  # RSS는 보통 link가 원문
-                }
-                if article["title"]:
-                    all_articles.append(article)
-                    count += 1
-
-            print(f"     ✓ {count}개 수집")
-            time.sleep(0.3)
-
-        except Exception as e:
-            print(f"     ✗ 오류: {e}")
+    with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as executor:
+        futures = [
+            executor.submit(_fetch_rss_feed, source, url, use_cache)
+            for source, url in RSS_FEEDS.items()
+        ]
+        # 피드 순서 유지
+        results = [f.result() for f in futures]
+
+    for result in results:
+        source = result["source"]
+        if result["error"]:
+            print(f"  → {source} ✗ 오류: {result['error']}")
+            continue
+
+        count = 0
+        for entry in result["entries"]:
+            published_at = _rss_entry_kst_datetime(entry)
+            if target_day is not None and (published_at.date() if published_at else None) != target_day:
+                continue
+
+            article = _rss_entry_to_article(entry, source, published_at)
+            if article.title:
+                all_articles.append(article)
+                count += 1
+
+        cache_note = ", 변경 없음(캐시)" if result["not_modified"] else ""
+        print(f"  → {source} {count}개 수집 ({result['elapsed']:.2f}초{cache_note})")
 
     print(f"\n총 {len(all_articles)}개 기사 수집 완료!\n")
     return all_articles
 
-def collect_news_from_naver(target_date=None):
+
+NAVER_NEWS_URL = "https://openapi.naver.com/v1/search/news.json"
+NAVER_MAX_QPS = 8  # 네이버 검색 API 초당 호출 한도 아래로 유지
+NAVER_DISPLAY = 100
+NAVER_MAX_START = 1000  # 네이버 검색 API start 파라미터 상한
+
+NAVER_KEYWORDS = [
+    "금융", "증시", "주식", "환율", "증권", "캐피탈", 
+    "IT", "AI", "테크", "스테이블코인", "디지털자산",
+    "삼성증권", "네이버", 
+    "하나은행", "우리은행", "은행", "기업은행",
+]
+
+
+def _naver_item_to_article(item, pub_date_str, published_at=None):
+    title = _clean_html(item.get("title", ""))
+    description = _clean_html(item.get("description", ""))[:500]
+
+    originallink = item.get("originallink") or ""
+    link = item.get("link") or originallink
+
+    source_domain = "네이버뉴스"
+    try:
+        if originallink:
+            source_domain = urlparse(originallink).netloc or "네이버뉴스"
+    except Exception:
+        pass
+
+    return Article(title, link, summary=description, source=source_domain, originallink=originallink,
+                   published=pub_date_str, published_at=published_at)
+
+
+def _request_naver_page(keyword, headers, page, limiter):
+    """네이버 뉴스 검색 결과 한 페이지(날짜 내림차순)의 items. 200이 아니면 RuntimeError"""
+    params = {
+        "query": keyword,
+        "display": NAVER_DISPLAY,
+        "sort": "date",
+        "start": 1 + page * NAVER_DISPLAY,
+    }
+    response = get_client().get(NAVER_NEWS_URL, headers=headers, params=params, timeout=10, limiter=limiter)
+
+    if response.status_code != 200:
+        raise RuntimeError(f"{response.status_code} (start={params['start']})")
+    return response.json().get("items", [])
+
+
+def _fetch_naver_keyword(keyword, headers, oldest_day, newest_day, first_page_only, limiter, seek=False,
+                         on_articles=None, on_page=None):
+    """
+    키워드 하나에 대해 네이버 뉴스 페이지를 순서대로 조회하고 [oldest_day, newest_day] 기사를 KST 일자별로 분류
+    (결과가 날짜 내림차순이라 다음 페이지 조회 여부가 이전 페이지에 달려 있으므로 페이지는 순차 조회)
+
+    seek=True이면 1000건 범위 안에서 galloping + 이분 탐색으로 newest_day가 처음 걸리는
+    페이지를 먼저 찾고, 그 페이지부터 순차 조회한다 (과거 날짜일수록 앞쪽 페이지 호출을 건너뜀).
+
+    on_articles(pub_day, articles)가 주어지면 페이지마다 일자별 기사 묶음을 바로 넘기고
+    articles_by_day에는 모으지 않는다 (스트리밍 수집).
+    on_page(keyword, 페이지의 대상 기간 기사)가 False를 돌려주면 다음 페이지를 조회하지 않는다 (키워드 계획의 조기 종료).
+
+    Returns:
+        dict: articles_by_day, count(수집 건수), page_oldest_days(first_page부터 순차 조회한 페이지별 최소 일자),
+              first_page, pages(실제 호출 수), elapsed, error, reached_api_limit_without_target
+    """
+    started = time.perf_counter()
+    articles_by_day = {}
+    count = 0
+    page_oldest_days = []
+    fetched = {}  # 페이지 번호 → (items, page_oldest_day)
+    error = None
+    reached_api_limit_without_target = False
+    last_page = (NAVER_MAX_START - 1) // NAVER_DISPLAY
+    first_page = 0
+
+    def _fetch_page(page):
+        # 발행 시각은 여기서 한 번만 파싱해 기사 생성까지 재사용
+        if page in fetched:
+            return fetched[page]
+        items = _request_naver_page(keyword, headers, page, limiter)
+        pub_dates = [parse_kst(item.get("pubDate", "")) for item in items]
+        page_oldest_day = min((pub_date.date() for pub_date in pub_dates if pub_date is not None), default=None)
+        fetched[page] = (items, pub_dates, page_oldest_day)
+        return fetched[page]
+
+    def _reaches_window(page):
+        # 빈 페이지(결과 끝)이거나 newest_day 이하 기사가 있으면 이 페이지부터 대상 기간
+        items, _, page_oldest_day = _fetch_page(page)
+        return not items or (page_oldest_day is not None and page_oldest_day <= newest_day)
+
+    try:
+        if seek and not first_page_only:
+            # galloping: 0, 1, 3, 7, ... 로 넘어가며 대상 기간에 닿는 첫 구간을 찾고 그 안에서 이분 탐색
+            below, page, step = -1, 0, 1
+            while not _reaches_window(page):
+                below = page
+                if page == last_page:
+                    break
+                page = min(last_page, page + step)
+                step *= 2
+
+            if below == last_page:
+                first_page = None
+                reached_api_limit_without_target = True
+            else:
+                low, high = below + 1, page
+                while low < high:
+                    mid = (low + high) // 2
+                    if _reaches_window(mid):
+                        high = mid
+                    else:
+                        low = mid + 1
+                first_page = low
+
+        page = first_page
+        while page is not None and page <= last_page:
+            items, pub_dates, page_oldest_day = _fetch_page(page)
+            if not items:
+                break
+
+            page_by_day = {}
+            for item, pub_date in zip(items, pub_dates):
+                if pub_date is None:
+                    continue
+
+                # 대상 기간이 아니면 스킵 (KST 기준 일자 비교)
+                pub_day = pub_date.date()
+                if pub_day < oldest_day or pub_day > newest_day:
+                    continue
+
+                article = _naver_item_to_article(item, item.get("pubDate", ""), pub_date)
+                if article.title:
+                    page_by_day.setdefault(pub_day, []).append(article)
+
+            for pub_day, page_articles in page_by_day.items():
+                count += len(page_articles)
+                if on_articles:
+                    on_articles(pub_day, page_articles)
+                else:
+                    articles_by_day.setdefault(pub_day, []).extend(page_articles)
+
+            page_oldest_days.append(page_oldest_day)
+
+            if on_page and not on_page(keyword, [a for day_articles in page_by_day.values() for a in day_articles]):
+                break
+
+            # 오늘 수집 모드는 첫 페이지만 조회
+            if first_page_only:
+                break
+
+            # 결과가 날짜 내림차순이므로, 페이지 최솟값이 oldest_day보다 작아지면 종료
+            if page_oldest_day and page_oldest_day < oldest_day:
+                break
+
+            # 마지막 페이지까지 와도 대상 기간보다 최신 기사뿐인 경우
+            if page == last_page and page_oldest_day and page_oldest_day > newest_day and not count:
+                reached_api_limit_without_target = True
+
+            page += 1
+
+    except Exception as e:
+        error = str(e)
+
+    return {
+        "keyword": keyword,
+        "articles_by_day": articles_by_day,
+        "count": count,
+        "page_oldest_days": page_oldest_days,
+        "first_page": first_page or 0,
+        "pages": len(fetched),
+        "elapsed": time.perf_counter() - started,
+        "error": error,
+        "reached_api_limit_without_target": reached_api_limit_without_target,
+    }
+
+
+def _single_day_calls(page_oldest_days, day, first_page=0):
+    """날짜 하나만 1페이지부터 순차 수집했다면 이 키워드에서 필요했을 페이지 호출 수
+    (first_page 이전 페이지는 모두 대상 기간보다 최신이라 순차 수집이면 전부 호출됨)"""
+    for index, page_oldest_day in enumerate(page_oldest_days):
+        if page_oldest_day and page_oldest_day < day:
+            return first_page + index + 1
+    return first_page + len(page_oldest_days)
+
+
+def _naver_headers():
+    client_id = os.getenv("NAVER_CLIENT_ID")
+    client_secret = os.getenv("NAVER_CLIENT_SECRET")
+    if not client_id or not client_secret:
+        return None
+    return {
+        "X-Naver-Client-Id": client_id,
+        "X-Naver-Client-Secret": client_secret
+    }
+
+
+def _sweep_naver_keywords(headers, oldest_day, newest_day, first_page_only, max_concurrency, seek=False,
+                          planner=None, keywords=None):
+    """
+    모든 키워드를 동시에 조회 (하나의 TokenBucket으로 QPS 상한 유지). 키워드 순서대로 결과 반환
+    planner(KeywordPlanner)가 있으면 그 계획의 순서/건너뛰기/조기 종료를 따른다.
+    keywords가 없으면 NAVER_KEYWORDS (여러 프로필 실행은 프로필 키워드 합집합)
+    """
+    keywords = keywords or NAVER_KEYWORDS
+    # 실행 전체가 하나의 버킷을 공유하므로 동시성과 무관하게 QPS 상한을 지킨다
+    limiter = TokenBucket(NAVER_MAX_QPS)
+    max_concurrency = max(1, int(max_concurrency or 1))
+    print(f"  (동시 조회 {max_concurrency}개, 최대 {NAVER_MAX_QPS} QPS)")
+    keywords = planner.plan(keywords, first_page_only) if planner else keywords
+
+    def _fetch(keyword):
+        try:
+            return _fetch_naver_keyword(keyword, headers, oldest_day, newest_day, first_page_only, limiter, seek,
+                                        on_page=planner.observe if planner else None)
+        finally:
+            if planner:
+                planner.done(keyword)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        # 계획 순서대로 제출해야 조기 종료 판정이 앞선 키워드를 기다릴 수 있다 (KeywordPlanner.observe)
+        futures = [executor.submit(_fetch, keyword) for keyword in keywords]
+        # 키워드 순서를 유지해야 이후 단계(중복 제거/요약)의 입력 순서가 실행마다 같다
+        results = [f.result() for f in futures]
+
+    _print_sweep_results(results, first_page_only, planner)
+    return results
+
+
+def _print_sweep_results(results, first_page_only, planner=None):
+    for result in results:
+        print(f"  → '{result['keyword']}' {result['count']}개 수집 "
+              f"({result['pages']}페이지, {result['elapsed']:.2f}초)")
+        if result["error"]:
+            print(f"     ✗ 오류: {result['error']}")
+        if not first_page_only and result["count"] == 0 and result["reached_api_limit_without_target"]:
+            print("     ⚠️  API 최대 1000건 범위에서 해당 날짜까지 내려가지 못했습니다.")
+    if planner:
+        with current_metrics().stage("keyword_plan") as record:
+            record.update(planner.finish(results))
+        print("\n🧭 키워드 계획")
+        for line in KeywordPlanner.summary_lines(record):
+            print(f"   {line}")
+
+
+def iter_naver_batches(oldest_day, newest_day, first_page_only=False, max_concurrency=4, seek=False, planner=None,
+                       keywords=None):
+    """
+    _sweep_naver_keywords의 스트리밍 버전: 키워드별 페이지가 도착하는 대로 (KST 일자, 기사 목록)을 내보냄
+
+    묶음은 키워드 순서가 아니라 도착 순서이며, 소비하는 쪽이 묶음을 처리하는 동안에도
+    다른 키워드 조회는 계속 진행된다. API 키가 없거나 네이버에서 0건인 날짜는 마지막에 RSS 결과를 내보낸다
+    (오늘 수집 모드는 collect_news_from_naver와 같이 API 키가 없을 때만 RSS 사용).
+    """
+    days = [oldest_day + timedelta(days=k) for k in range((newest_day - oldest_day).days + 1)]
+    counts = {day: 0 for day in days}
+
+    headers = _naver_headers()
+    if headers is None:
+        print("❌ 네이버 API 키가 없습니다. RSS로 대체합니다.\n")
+    else:
+        limiter = TokenBucket(NAVER_MAX_QPS)
+        max_concurrency = max(1, int(max_concurrency or 1))
+        print(f"  (동시 조회 {max_concurrency}개, 최대 {NAVER_MAX_QPS} QPS, 도착하는 대로 중복 제거)")
+        batches = queue.Queue()
+        done = object()
+        keywords = keywords or NAVER_KEYWORDS
+        keywords = planner.plan(keywords, first_page_only) if planner else keywords
+
+        def _fetch(keyword):
+            try:
+                return _fetch_naver_keyword(keyword, headers, oldest_day, newest_day, first_page_only, limiter, seek,
+                                            on_articles=lambda day, articles: batches.put((day, articles)),
+                                            on_page=planner.observe if planner else None)
+            finally:
+                if planner:
+                    planner.done(keyword)
+                batches.put(done)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [executor.submit(_fetch, keyword) for keyword in keywords]
+            remaining = len(futures)
+            while remaining:
+                batch = batches.get()
+                if batch is done:
+                    remaining -= 1
+                    continue
+                counts[batch[0]] += len(batch[1])
+                yield batch
+            results = [f.result() for f in futures]
+        _print_sweep_results(results, first_page_only, planner)
+
+    for day in days:
+        if counts[day] or (headers is not None and first_page_only):
+            continue
+        if headers is not None:
+            print(f"\n⚠️  네이버에서 {day.isoformat()} 기사 0건입니다. RSS 폴백을 시도합니다.\n")
+        yield day, collect_news_from_rss(target_date=None if first_page_only else day.isoformat())
+
+
+def collect_news_from_naver(target_date=None, max_concurrency=4, seek=False, planner=None, keywords=None):
     """
     네이버 뉴스 API로 뉴스 수집
-    
+
     Args:
         target_date (str): 'YYYY-MM-DD' 형식 또는 None (오늘)
+        max_concurrency (int): 동시에 조회할 키워드 수 (1이면 순차 조회)
+        seek (bool): 과거 날짜일 때 대상 날짜가 걸리는 페이지를 탐색으로 먼저 찾음
+        planner (KeywordPlanner): 키워드 조회 계획 (None이면 모든 키워드를 끝까지 조회)
+        keywords (list): 조회할 키워드 (None이면 NAVER_KEYWORDS)
     """
     print("📰 네이버 뉴스 API로 수집 시작...")
     
@@ -127,181 +552,305 @@ def collect_news_from_naver(target_date=None):
         target_day = datetime.now(KST).date()
         print(f"📅 수집 대상 날짜: 오늘 ({target_day.strftime('%Y년 %m월 %d일')})\n")
 
-    client_id = os.getenv("NAVER_CLIENT_ID")
-    client_secret = os.getenv("NAVER_CLIENT_SECRET")
-
-    if not client_id or not client_secret:
+    headers = _naver_headers()
+    if headers is None:
         print("❌ 네이버 API 키가 없습니다. RSS로 대체합니다.\n")
         return collect_news_from_rss(target_date=target_date)
 
-    keywords = [
-        "금융", "증시", "주식", "환율", "증권", "캐피탈", 
-        "IT", "AI", "테크", "스테이블코인", "디지털자산",
-        "삼성증권", "네이버", 
-        "하나은행", "우리은행", "은행", "기업은행",
-    ]
+    results = _sweep_naver_keywords(headers, target_day, target_day, target_date is None, max_concurrency, seek=seek,
+                                    planner=planner, keywords=keywords)
 
-    url = "https://openapi.naver.com/v1/search/news.json"
-    headers = {
-        "X-Naver-Client-Id": client_id,
-        "X-Naver-Client-Secret": client_secret
-    }
+    all_articles = []
+    for result in results:
+        all_articles.extend(result["articles_by_day"].get(target_day, []))
 
-    def _to_kst_date(pub_date_str):
-        if not pub_date_str:
-            return None
-        try:
-            pub_date = date_parser.parse(pub_date_str)
-            if pub_date.tzinfo is None:
-                pub_date = pub_date.replace(tzinfo=KST)
-            return pub_date.astimezone(KST).date()
-        except Exception:
-            return None
+    if target_date and not all_articles:
+        print("⚠️  네이버에서 대상 날짜 기사 0건입니다. RSS 폴백을 시도합니다.\n")
+        rss_articles = collect_news_from_rss(target_date=target_date)
+        if rss_articles:
+            return rss_articles
 
-    all_articles = []
-    display = 100
-    max_start = 1000  # 네이버 검색 API start 파라미터 상한
+    print(f"\n총 {len(all_articles)}개 기사 수집 완료!\n")
+    return all_articles
 
-    for keyword in keywords:
-        try:
-            print(f"  → '{keyword}' 검색 중...")
-            count = 0
-            start = 1
-            reached_api_limit_without_target = False
-
-            while start <= max_start:
-                params = {
-                    "query": keyword,
-                    "display": display,
-                    "sort": "date",
-                    "start": start,
-                }
-                response = requests.get(url, headers=headers, params=params, timeout=10)
-
-                if response.status_code != 200:
-                    print(f"     ✗ 오류: {response.status_code} (start={start})")
-                    break
 
-                data = response.json()
-                items = data.get("items", [])
-                if not items:
-                    break
+def collect_news_from_naver_range(from_date, to_date, max_concurrency=4, seek=False, planner=None, keywords=None):
+    """
+    기간 백필용 수집: 키워드마다 가장 오래된 날짜까지 한 번만 페이지를 내려가며 KST 일자별로 분류
 
-                page_oldest_day = None
-                for item in items:
-                    pub_date_str = item.get("pubDate", "")
-                    pub_day = _to_kst_date(pub_date_str)
-                    if pub_day is None:
-                        continue
-
-                    if page_oldest_day is None or pub_day < page_oldest_day:
-                        page_oldest_day = pub_day
-
-                    # 지정된 날짜가 아니면 스킵 (KST 기준 일자 비교)
-                    if pub_day != target_day:
-                        continue
-
-                    title = _clean_html(item.get("title", ""))
-                    description = _clean_html(item.get("description", ""))[:500]
-
-                    originallink = item.get("originallink") or ""
-                    link = item.get("link") or originallink
-
-                    source_domain = "네이버뉴스"
-                    try:
-                        if originallink:
-                            source_domain = urlparse(originallink).netloc or "네이버뉴스"
-                    except Exception:
-                        pass
-
-                    article = {
-                        "title": title,
-                        "link": link,
-                        "published": pub_date_str,
-                        "summary": description,
-                        "source": source_domain,
-                        "originallink": originallink,
-                    }
-
-                    if article["title"]:
-                        all_articles.append(article)
-                        count += 1
-
-                # 오늘 수집 모드는 첫 페이지만 조회
-                if target_date is None:
-                    break
+    Args:
+        from_date (str), to_date (str): 'YYYY-MM-DD' (포함 구간)
+        seek (bool): 가장 최근 날짜가 걸리는 페이지를 탐색으로 먼저 찾음
+        planner (KeywordPlanner): 키워드 조회 계획
+        keywords (list): 조회할 키워드 (None이면 NAVER_KEYWORDS)
 
-                # 결과가 날짜 내림차순이므로, 페이지 최솟값이 target_day보다 작아지면 종료
-                if page_oldest_day and page_oldest_day < target_day:
-                    break
+    Returns:
+        dict: {'YYYY-MM-DD': [article, ...]} — 기간 내 모든 날짜 키 포함 (오래된 날짜부터)
+    """
+    print("📰 네이버 뉴스 API로 기간 수집 시작...")
+    try:
+        oldest_day = datetime.strptime(from_date, "%Y-%m-%d").date()
+        newest_day = datetime.strptime(to_date, "%Y-%m-%d").date()
+    except ValueError:
+        print(f"❌ 잘못된 날짜 형식: {from_date} ~ {to_date} (YYYY-MM-DD 형식 필요)")
+        return {}
+    if oldest_day > newest_day:
+        oldest_day, newest_day = newest_day, oldest_day
+
+    days = [oldest_day + timedelta(days=k) for k in range((newest_day - oldest_day).days + 1)]
+    print(f"📅 수집 대상 기간: {oldest_day.strftime('%Y년 %m월 %d일')} ~ "
+          f"{newest_day.strftime('%Y년 %m월 %d일')} ({len(days)}일)\n")
+
+    headers = _naver_headers()
+    if headers is None:
+        print("❌ 네이버 API 키가 없습니다. 날짜별 RSS로 대체합니다.\n")
+        return {day.isoformat(): collect_news_from_rss(target_date=day.isoformat()) for day in days}
+
+    results = _sweep_naver_keywords(headers, oldest_day, newest_day, False, max_concurrency, seek=seek, planner=planner,
+                                    keywords=keywords)
+
+    by_day = {day.isoformat(): [] for day in days}
+    sweep_calls = 0
+    single_day_calls = 0
+    for result in results:
+        for day, articles in result["articles_by_day"].items():
+            by_day[day.isoformat()].extend(articles)
+        sweep_calls += result["pages"]
+        single_day_calls += sum(_single_day_calls(result["page_oldest_days"], day, result["first_page"]) for day in days)
+
+    print(f"\n📉 API 호출 {sweep_calls}회 (날짜별 실행 시 {single_day_calls}회, "
+          f"{max(0, single_day_calls - sweep_calls)}회 절약)")
+    for day_str, articles in by_day.items():
+        print(f"   {day_str}: {len(articles)}개")
+
+    for day_str, articles in by_day.items():
+        if not articles:
+            print(f"\n⚠️  네이버에서 {day_str} 기사 0건입니다. RSS 폴백을 시도합니다.\n")
+            by_day[day_str] = collect_news_from_rss(target_date=day_str)
+
+    print(f"\n총 {sum(len(v) for v in by_day.values())}개 기사 수집 완료!\n")
+    return by_day
+
+
+DAEMON_INTERVAL_MINUTES = 15
+POLL_OVERLAP = timedelta(minutes=10)  # 색인이 늦게 잡힌 기사를 놓치지 않도록 워터마크보다 조금 앞부터 조회
+
+
+def _poll_naver_keyword(keyword, headers, since, limiter):
+    """
+    키워드 하나에서 since 이후 발행된 기사만 조회 (첫 페이지부터 내려가다 since보다 오래된 기사가 나오면 중단)
 
-                if start == max_start and page_oldest_day and page_oldest_day > target_day and count == 0:
-                    reached_api_limit_without_target = True
+    Returns:
+        dict: keyword, articles, newest(가장 최근 발행 시각), pages, error
+    """
+    articles = []
+    newest = None
+    pages = 0
+    error = None
+    last_page = (NAVER_MAX_START - 1) // NAVER_DISPLAY
 
-                start += display
-                time.sleep(0.12)
+    try:
+        for page in range(last_page + 1):
+            items = _request_naver_page(keyword, headers, page, limiter)
+            pages += 1
+            if not items:
+                break
+
+            reached_since = False
+            for item in items:
+                pub_date_str = item.get("pubDate", "")
+                pub_date = parse_kst(pub_date_str)
+                if pub_date is None:
+                    continue
+                if pub_date < since:
+                    reached_since = True
+                    continue
+                article = _naver_item_to_article(item, pub_date_str, pub_date)
+                if article.title:
+                    articles.append(article)
+                if newest is None or pub_date > newest:
+                    newest = pub_date
+            if reached_since:
+                break
+    except Exception as e:
+        error = str(e)
 
-            print(f"     ✓ {count}개 수집")
-            if target_date and count == 0 and reached_api_limit_without_target:
-                print("     ⚠️  API 최대 1000건 범위에서 해당 날짜까지 내려가지 못했습니다.")
+    return {"keyword": keyword, "articles": articles, "newest": newest, "pages": pages, "error": error}
 
-            time.sleep(0.12)
 
-        except Exception as e:
-            print(f"     ✗ 오류: {e}")
+def _store_polled(store, articles):
+    """폴링 결과를 KST 발행일을 수집일로 삼아 저장하고 새로 추가된 기사 수 반환"""
+    before = count_articles(store)
+    by_day = {}
+    for article in articles:
+        published_at = article.published_at
+        if published_at is not None:
+            by_day.setdefault(published_at.date().isoformat(), []).append(article)
+    for day, day_articles in by_day.items():
+        upsert_articles(store, day_articles, collected_day=day)
+    return count_articles(store) - before
 
-    if target_date and not all_articles:
-        print("⚠️  네이버에서 대상 날짜 기사 0건입니다. RSS 폴백을 시도합니다.\n")
-        rss_articles = collect_news_from_rss(target_date=target_date)
-        if rss_articles:
-            return rss_articles
 
-    print(f"\n총 {len(all_articles)}개 기사 수집 완료!\n")
-    return all_articles
+def poll_sources(store, max_concurrency=4, keywords=None):
+    """
+    네이버 키워드와 RSS 피드를 워터마크 이후분만 조회해 저장소에 추가 (수집 데몬 1회분)
+    워터마크가 없거나 오늘 이전이면 오늘 0시(KST)부터 조회한다. keywords가 없으면 NAVER_KEYWORDS.
+
+    Returns:
+        int: 새로 저장된 기사 수
+    """
+    now = datetime.now(KST)
+    day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def _since(source):
+        watermark = get_watermark(store, source)
+        return max(day_start, watermark - POLL_OVERLAP) if watermark else day_start
+
+    print(f"🔄 [{now.strftime('%H:%M:%S')}] 증분 수집")
+    polled = []  # (워터마크 키, 기사 목록, 최신 발행 시각)
+
+    headers = _naver_headers()
+    if headers is None:
+        print("  ⚠️  네이버 API 키가 없어 RSS만 조회합니다.")
+    else:
+        limiter = TokenBucket(NAVER_MAX_QPS)
+        since_by_keyword = {keyword: _since(f"naver:{keyword}") for keyword in keywords or NAVER_KEYWORDS}
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            futures = [
+                executor.submit(_poll_naver_keyword, keyword, headers, since, limiter)
+                for keyword, since in since_by_keyword.items()
+            ]
+            for future in futures:
+                result = future.result()
+                if result["error"]:
+                    print(f"  → '{result['keyword']}' ✗ 오류: {result['error']}")
+                polled.append((f"naver:{result['keyword']}", result["articles"], result["newest"]))
+
+    with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as executor:
+        futures = [executor.submit(_fetch_rss_feed, source, url, True) for source, url in RSS_FEEDS.items()]
+        for future in futures:
+            result = future.result()
+            source = result["source"]
+            if result["error"]:
+                print(f"  → {source} ✗ 오류: {result['error']}")
+                continue
+            since = _since(f"rss:{source}")
+            articles = []
+            newest = None
+            for entry in result["entries"]:
+                published = _rss_entry_kst_datetime(entry)
+                if published is None or published < since:
+                    continue
+                article = _rss_entry_to_article(entry, source, published)
+                if article.title:
+                    articles.append(article)
+                newest = published if newest is None or published > newest else newest
+            polled.append((f"rss:{source}", articles, newest))
+
+    added = _store_polled(store, [article for _, articles, _ in polled for article in articles])
+    # 저장이 끝난 뒤에 워터마크를 올려야 중간에 죽어도 다음 폴링에서 다시 가져온다
+    for source, _, newest in polled:
+        if newest is not None:
+            set_watermark(store, source, newest)
+
+    fetched = sum(len(articles) for _, articles, _ in polled)
+    print(f"  → 조회 {fetched}개, 신규 저장 {added}개\n")
+    return added
+
+
+def run_daemon(store, interval_minutes=DAEMON_INTERVAL_MINUTES, max_concurrency=4, keywords=None):
+    """
+    수집 데몬: interval_minutes마다 poll_sources 실행 (SIGTERM/Ctrl+C로 종료)
+    프로세스가 계속 살아 있으므로 공용 HTTP 클라이언트의 연결이 재사용된다.
+    """
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    print(f"🛰️  수집 데몬 시작 ({interval_minutes}분 간격, 종료: Ctrl+C)\n")
+
+    try:
+        while not stop.is_set():
+            started = time.monotonic()
+            try:
+                poll_sources(store, max_concurrency=max_concurrency, keywords=keywords)
+            except Exception as e:
+                print(f"❌ 증분 수집 오류: {e}\n")
+            stop.wait(max(0.0, interval_minutes * 60 - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        pass
+
+    print("🛑 수집 데몬 종료")
+    for line in get_client().summary_lines():
+        print(f"   🌐 {line}")
+
+
+def collect_news_from_store(store, target_date=None, max_concurrency=4, keywords=None):
+    """
+    저장소에 모인 기사로 수집 단계 대체 (수집 데몬과 함께 사용)
+    오늘 리포트면 마지막 폴링 이후분을 한 번 더 증분 수집한 뒤 조회한다.
+    """
+    if target_date is None:
+        poll_sources(store, max_concurrency=max_concurrency, keywords=keywords)
+    day = target_date or datetime.now(KST).date().isoformat()
+    articles = load_articles(store, day)
+    print(f"🗄️  저장소에서 {day} 기사 {len(articles)}개 불러옴\n")
+    return articles
 
 
-def dedup_by_url(articles):
-    """URL 기준 1차 중복 제거 (네이버 키워드 루프 중복 방지)"""
+def dedup_by_url(articles, store=None, exclude_window=None, summarized_only=True):
+    """URL 기준 1차 중복 제거 (네이버 키워드 루프 중복 방지)
+
+    store/exclude_window가 주어지면 해당 기간에 이미 수집(또는 요약)된 URL도 제외
+    """
+    excluded = set()
+    if store is not None and exclude_window:
+        excluded = known_urls(store, (article_key(a) for a in articles), *exclude_window,
+                              summarized_only=summarized_only)
+
     seen = set()
     out = []
+    skipped_history = 0
     for a in articles:
-        key = (a.get("originallink") or a.get("link") or "").strip()
-        if not key:
-            # url이 없으면 제목 기반으로라도 키 생성
-            key = f"title::{a.get('title','')}"
+        key = article_key(a)
         if key in seen:
             continue
         seen.add(key)
+        if key in excluded:
+            skipped_history += 1
+            continue
         out.append(a)
+
+    if skipped_history:
+        print(f"🗂️  이전 실행에서 이미 다룬 기사 {skipped_history}개 제외 (URL 기준)\n")
     return out
 
-def remove_duplicates_tfidf(articles, threshold=0.72):
-    """TF-IDF 기반 2차 중복 제거 (title+summary)"""
+def remove_duplicates_tfidf(articles, threshold=0.72, engine="auto", store=None, exclude_window=None, summarized_only=True):
+    """TF-IDF 기반 2차 중복 제거 (title+summary)
+
+    engine: auto(건수에 따라 선택) / dense / sparse / minhash — dedup.py 참고
+    store/exclude_window가 주어지면 해당 기간에 같은 제목으로 이미 다룬 기사(재송고)도 제외
+    """
     print("🔍 중복 기사 제거 중...")
 
+    if store is not None and exclude_window and articles:
+        known = known_title_keys(store, (title_key(a.get("title", "")) for a in articles), *exclude_window,
+                                 summarized_only=summarized_only)
+        if known:
+            before = len(articles)
+            articles = [a for a in articles if title_key(a.get("title", "")) not in known]
+            print(f"  → 이전 실행에서 다룬 같은 제목 기사 {before - len(articles)}개 제외")
+
     if not articles:
         return []
 
     docs = [(a.get("title","") + " " + a.get("summary","")).strip() for a in articles]
 
     try:
-        vectorizer = TfidfVectorizer(min_df=1, ngram_range=(1, 2))
-        tfidf_matrix = vectorizer.fit_transform(docs)
-        sim = cosine_similarity(tfidf_matrix)
-
-        keep = []
-        removed = set()
-
-        for i in range(len(articles)):
-            if i in removed:
-                continue
-            keep.append(i)
-            for j in range(i + 1, len(articles)):
-                if sim[i][j] >= threshold:
-                    removed.add(j)
+        keep, removed, used_engine, group_sizes = find_near_duplicates(docs, threshold=threshold, engine=engine)
 
         unique = [articles[i] for i in keep]
-        print(f"  → {len(removed)}개 중복 제거")
+        for a, size in zip(unique, group_sizes):
+            a["dup_count"] = size  # 같은 이슈로 묶인 기사 수 (선별 단계의 중요도 신호)
+        print(f"  → {len(removed)}개 중복 제거 (엔진: {used_engine})")
         print(f"  → {len(unique)}개 고유 기사 남음\n")
         return unique
 
@@ -310,29 +859,19 @@ def remove_duplicates_tfidf(articles, threshold=0.72):
         print(f"  → 원본 {len(articles)}개 그대로 사용\n")
         return articles
 
-def summarize_news(articles):
-    """AI 요약"""
-    print("🤖 OpenAI GPT AI 요약 생성 중...\n")
-
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        return "❌ 오류: OPENAI_API_KEY가 설정되지 않았습니다."
-
-    client = openai.OpenAI(api_key=api_key)
-
-    # 요약 입력을 title만 넣지 말고 summary도 같이
-    # 너무 길어지면 비용/토큰 증가하니 80개 정도로 제한 권장
-    selected = articles[:80]
-    articles_text = "\n\n".join([
-        f"[{a.get('source','')}] {a.get('title','')}\n- 요약: {a.get('summary','')}\n- 링크: {a.get('originallink') or a.get('link')}"
-        for a in selected
-    ])
-
-    prompt = f"""다음은 오늘 수집된 한국 경제/IT 뉴스 기사 {len(selected)}개입니다.
+def enrich_news(articles):
+    """중복 제거 후 남은 기사의 원문 본문으로 summary 보강 (enrich.py)"""
+    print("📄 원문 본문 보강 중...")
+    articles, stats = enrich_articles(articles, cache=FullTextCache())
+    print(f"  → {stats['enriched']}/{stats['targets']}개 보강 (캐시 {stats['cached']}개, 실패 {stats['failed']}개, "
+          f"크기 제한으로 잘림 {stats['truncated']}개, {stats['seconds']:.1f}초)\n")
+    return articles
 
-{articles_text}
+SUMMARY_MODEL = "gpt-4o-mini"
+SUMMARY_SYSTEM_PROMPT = "당신은 한국 경제/IT 뉴스 전문 에디터입니다. 객관적이고 간결한 데일리 브리핑을 작성합니다."
 
-요구사항:
+# 최종 리포트 형식 (단일 호출 / map-reduce의 merge 호출이 공유, {insight}는 프로필별 인사이트 지시문)
+REPORT_INSTRUCTIONS_TEMPLATE = """요구사항:
 - **카테고리 분류 기준**:
   - '경제' 섹션: 은행, 증권, 보험, 카드, 자산운용 등 금융기관 관련 소식. 기업의 실적 발표, 투자, M&A, 지분 변동, 정부의 경제 정책 등.
   - 'IT/기술' 섹션: 인공지능(AI), 소프트웨어, 하드웨어, 통신, 블록체인, 플랫폼 기업(네이버, 카카오 등) 관련 소식. 기술 개발, 신제품 출시, IT 서비스 업데이트 등.
@@ -347,299 +886,1061 @@ def summarize_news(articles):
 3) # IT/기술 TOP 10 (각 6~8줄, 숫자목록, 경제부문과 겹치지 않는 topic)
 4) 공통 트렌드 5~8줄
 5) 출처 링크(이슈별 대표 링크 1개씩)
-6) 금융권 개발자를 지망하는 취업준비생을 위한 인사이트 추출
+6) {insight}
+"""
+REPORT_INSTRUCTIONS = REPORT_INSTRUCTIONS_TEMPLATE.format(insight=DEFAULT_INSIGHT)
+
+# map 단계: 묶음별로 이슈 단위 중간 요약
+PARTITION_INSTRUCTIONS = """요구사항:
+- 같은 사건을 다루는 기사는 하나의 이슈로 통합하세요.
+- 이슈마다 아래 형식으로 작성하세요. 중요도가 높은 이슈부터 나열하세요.
+  - [경제] 또는 [IT/기술] 이슈 제목 (관련 기사 N개)
+    핵심 내용 3~4줄 (수치, 기관/기업명 포함)
+    대표 링크: URL
+- 이 묶음 밖의 내용은 추측하지 마세요.
 """
 
-    try:
+
+def _summary_prompts(profile=None):
+    """(시스템 프롬프트, 리포트 지시문) — 프로필이 없으면 기본 독자용"""
+    if profile is None:
+        return SUMMARY_SYSTEM_PROMPT, REPORT_INSTRUCTIONS
+    system_prompt = SUMMARY_SYSTEM_PROMPT
+    if profile.audience:
+        system_prompt += f" 이 브리핑의 독자는 {profile.audience}입니다."
+    return system_prompt, REPORT_INSTRUCTIONS_TEMPLATE.format(insight=profile.insight)
+
+
+def _format_articles(articles):
+    return "\n\n".join([format_article_line(a) for a in articles])
+
+
+def _chat(client, prompt, max_tokens, temperature=0.5, cache=None, on_token=None, system_prompt=SUMMARY_SYSTEM_PROMPT):
+    """
+    chat completion 호출 (cache가 있으면 먼저 조회)
+    on_token이 주어지면 stream=True로 받아 조각이 도착할 때마다 콜백 호출
+    """
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": prompt}
+    ]
+    key = None
+    if cache is not None:
+        key = cache_key(SUMMARY_MODEL, messages, temperature, max_tokens)
+        cached = cache.get(key)
+        if cached is not None:
+            current_metrics().add_openai_call(cached=True)
+            if on_token is not None:
+                on_token(cached["content"])
+            return cached["content"]
+
+    usage = None
+    if on_token is None:
         response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "당신은 한국 경제/IT 뉴스 전문 에디터입니다. 객관적이고 간결한 데일리 브리핑을 작성합니다."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=3500,
-            temperature=0.5
+            model=SUMMARY_MODEL,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        content = response.choices[0].message.content
+        usage = getattr(response, "usage", None)
+    else:
+        stream = client.chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+            stream_options={"include_usage": True}
         )
-        return response.choices[0].message.content
+        pieces = []
+        for chunk in stream:
+            # include_usage: 마지막 조각은 choices 없이 usage만 담고 온다
+            if getattr(chunk, "usage", None) is not None:
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                pieces.append(delta)
+                on_token(delta)
+        content = "".join(pieces)
+
+    usage = usage.model_dump() if hasattr(usage, "model_dump") else None
+    current_metrics().add_openai_call(usage=usage)
+    if cache is not None and content:
+        cache.put(key, content, usage=usage)
+    return content
+
+
+PARTITION_RETRIES = 1  # 실패한 묶음 요약을 다시 시도하는 횟수
+
+
+def _topic_keyword(article, keywords):
+    """기사 제목/요약에 들어간 키워드 중 가장 구체적인(긴) 것 (같으면 키워드 목록 순서, 없으면 None)"""
+    text = f"{article.get('title', '')} {article.get('summary', '')}"
+    lowered = text.lower()
+    best = None
+    for keyword in keywords:
+        if (keyword.lower() in lowered if keyword.isascii() else keyword in text) and (
+                best is None or len(keyword) > len(best)):
+            best = keyword
+    return best
+
+
+def _partition_articles(articles, partition_size, keywords=None):
+    """
+    기사 목록을 주제(키워드)별로 모아 partition_size 이하 묶음으로 분할
+
+    기사마다 가장 구체적인 키워드(_topic_keyword)로 묶고, 키워드 목록 순서대로(키워드 없는 기사는 마지막)
+    작은 주제는 한 묶음에 이어 담는다. partition_size보다 큰 주제는 거의 같은 크기로 나눈다.
+    주제 안에서는 중복 제거 순서를 유지한다.
+
+    Returns:
+        list[tuple]: (묶음에 든 키워드 list, 기사 list)
+    """
+    keywords = keywords or NAVER_KEYWORDS
+    groups = {}
+    for article in articles:
+        groups.setdefault(_topic_keyword(article, keywords), []).append(article)
+    order = [keyword for keyword in keywords if keyword in groups] + ([None] if None in groups else [])
+
+    parts = []
+    topics, current = [], []
+    for keyword in order:
+        group = groups[keyword]
+        if current and len(current) + len(group) > partition_size:
+            parts.append((topics, current))
+            topics, current = [], []
+        if len(group) <= partition_size:
+            topics.append(keyword)
+            current.extend(group)
+            continue
+        n_chunks = -(-len(group) // partition_size)
+        base, extra = divmod(len(group), n_chunks)
+        start = 0
+        for k in range(n_chunks):
+            end = start + base + (1 if k < extra else 0)
+            parts.append(([keyword], group[start:end]))
+            start = end
+    if current:
+        parts.append((topics, current))
+    return parts
+
+
+def _summarize_map_reduce(client, articles, partition_size, max_in_flight, cache=None, on_token=None,
+                          instructions=REPORT_INSTRUCTIONS, system_prompt=SUMMARY_SYSTEM_PROMPT, keywords=None):
+    parts = _partition_articles(articles, partition_size, keywords)
+    print(f"  → {len(articles)}개 기사를 주제별 {len(parts)}개 묶음으로 나눠 요약 (동시 {max_in_flight}개)")
+
+    def _summarize_part(index, topics, part):
+        topic = ", ".join(keyword or "기타" for keyword in topics)
+        prompt = f"""다음은 오늘 수집된 한국 경제/IT 뉴스 기사 중 {index + 1}/{len(parts)}번째 묶음({len(part)}개, 주제: {topic})입니다.
+
+{_format_articles(part)}
+
+{PARTITION_INSTRUCTIONS}"""
+        started = time.perf_counter()
+        for attempt in range(PARTITION_RETRIES + 1):
+            try:
+                text = _chat(client, prompt, max_tokens=1500, temperature=0.3, cache=cache,
+                             system_prompt=system_prompt)
+                break
+            except Exception as e:
+                if attempt == PARTITION_RETRIES:
+                    raise
+                print(f"     ↻ 묶음 {index + 1} 요약 재시도: {e}")
+        return text, time.perf_counter() - started
+
+    partials = [None] * len(parts)
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(1, max_in_flight)) as executor:
+        futures = {executor.submit(_summarize_part, i, topics, part): i for i, (topics, part) in enumerate(parts)}
+        for future, i in futures.items():
+            try:
+                partials[i], elapsed = future.result()
+                print(f"     ✓ 묶음 {i + 1} 요약 완료 ({elapsed:.1f}초)")
+            except Exception as e:
+                print(f"     ✗ 묶음 {i + 1} 요약 실패: {e}")
+                failed.append(i)
+                current_metrics().event("summary_partition_failed", partition=i + 1, partitions=len(parts),
+                                        articles=len(parts[i][1]), error=str(e))
+
+    if len(failed) == len(parts):
+        raise RuntimeError("모든 묶음 요약이 실패했습니다.")
+
+    partial_text = "\n\n".join(f"## 묶음 {i + 1}\n{p}" for i, p in enumerate(partials) if p)
+    prompt = f"""다음은 오늘 수집된 한국 경제/IT 뉴스 기사 {len(articles)}개를 주제별 {len(parts) - len(failed)}개 묶음으로 나눠 이슈별로 정리한 중간 요약입니다.
+여러 묶음에 걸쳐 같은 이슈가 있으면 하나로 합치고, 관련 기사 수가 많은 이슈를 우선하세요.
+
+{partial_text}
+
+{instructions}"""
+    summary = _chat(client, prompt, max_tokens=3500, cache=cache, on_token=on_token, system_prompt=system_prompt)
+    if not failed:
+        return summary
+
+    # 빠진 기사가 있다는 것을 리포트에서 바로 알 수 있게 남긴다
+    missing = sum(len(parts[i][1]) for i in failed)
+    topics = ", ".join(dict.fromkeys(keyword or "기타" for i in sorted(failed) for keyword in parts[i][0]))
+    note = (f"\n\n> ⚠️ {len(parts)}개 묶음 중 {len(failed)}개 요약 실패로 기사 {missing}개"
+            f"(주제: {topics})가 이 리포트에 반영되지 않았습니다.")
+    if on_token is not None:
+        on_token(note)
+    return summary + note
+
+
+def summarize_news(articles, mode="single", client=None, max_articles=80, partition_size=40, max_in_flight=4,
+                   cache=None, on_token=None, instructions=REPORT_INSTRUCTIONS, system_prompt=SUMMARY_SYSTEM_PROMPT,
+                   keywords=None):
+    """AI 요약
+
+    Args:
+        mode (str): 'single' (한 번의 호출, max_articles개까지) 또는
+                    'map-reduce' (묶음별 동시 요약 후 최종 병합, 개수 제한 없음)
+        client: OpenAI 클라이언트 (None이면 OPENAI_API_KEY로 생성, 테스트용 대역 주입 가능)
+        cache (LLMCache): 응답 캐시 (None이면 사용 안 함)
+        on_token (callable): 지정하면 최종 리포트 생성 호출을 스트리밍으로 받아 조각마다 호출
+        instructions, system_prompt: 리포트 형식 지시문 / 시스템 프롬프트 (프로필별 독자에 맞춘 값, _summary_prompts)
+        keywords (list): map-reduce 묶음을 나눌 주제 키워드 (None이면 NAVER_KEYWORDS, 프로필 실행은 프로필 키워드)
+    """
+    print("🤖 OpenAI GPT AI 요약 생성 중...\n")
+
+    if client is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            return "❌ 오류: OPENAI_API_KEY가 설정되지 않았습니다."
+        import openai
+
+        client = openai.OpenAI(api_key=api_key)
+
+    try:
+        if mode == "map-reduce" and len(articles) > partition_size:
+            return _summarize_map_reduce(client, articles, partition_size, max_in_flight, cache=cache,
+                                         on_token=on_token, instructions=instructions, system_prompt=system_prompt,
+                                         keywords=keywords)
+
+        # 요약 입력을 title만 넣지 말고 summary도 같이
+        # 너무 길어지면 비용/토큰 증가하니 80개 정도로 제한 권장
+        selected = articles[:max_articles] if mode == "single" else articles
+        prompt = f"""다음은 오늘 수집된 한국 경제/IT 뉴스 기사 {len(selected)}개입니다.
+
+{_format_articles(selected)}
+
+{instructions}"""
+        return _chat(client, prompt, max_tokens=3500, cache=cache, on_token=on_token, system_prompt=system_prompt)
 
     except Exception as e:
         return f"❌ 오류: {e}"
 
-def parse_inline_formatting(text):
-    """텍스트에서 **bold**, Markdown 링크, 일반 URL 같은 인라인 서식을 파싱하여 Notion rich_text 객체 배열로 반환"""
-    
-    rich_text_elements = []
-    last_idx = 0
-    
-    # Regex to find all three types of formatting
-    # Group 'md_text': Markdown Link Text, Group 'md_url': Markdown Link URL
-    # Group 'bold_text': Bold Text
-    # Group 'raw_url': Raw URL
-    # Pattern order is important: Markdown link should be matched before raw URL
-    pattern = re.compile(
-        r'\[(?P<md_text>[^\]]+?)\]\((?P<md_url>https?:\/\/[^\s\)]+)\)'  # Markdown link
-        r'|\*\*(?P<bold_text>[^\*]+?)\*\*'                               # Bold text
-        r'|(?P<raw_url>https?:\/\/[^\s]+)'                                # Raw URL
-    )
-    
-    for match in pattern.finditer(text):
-        start, end = match.span()
-        
-        # Add preceding plain text
-        if start > last_idx:
-            plain_text = text[last_idx:start]
-            if plain_text:
-                rich_text_elements.append({"type": "text", "text": {"content": plain_text}})
-        
-        # Process the matched part
-        if match.group('md_text'): # It's a Markdown link
-            md_text = match.group('md_text')
-            md_url = match.group('md_url')
-            rich_text_elements.append({
-                "type": "text",
-                "text": {"content": md_text, "link": {"url": md_url}},
-                "annotations": {"bold": False} 
-            })
-        elif match.group('bold_text'): # It's bold text
-            bold_text = match.group('bold_text')
-            rich_text_elements.append({
-                "type": "text",
-                "text": {"content": bold_text},
-                "annotations": {"bold": True}
-            })
-        elif match.group('raw_url'):  # It's a raw URL
-            raw_url = match.group('raw_url')
-
-            # ✅ 문장 끝에 붙는 구두점/닫는 괄호 제거
-            # - 일반적으로 URL에 포함되지 않는 후행 문자들을 제거
-            # - 필요하면 목록에 더 추가 가능
-            raw_url = raw_url.rstrip(').,;:!?"\'”’》〉】]')
-
-            rich_text_elements.append({
-                "type": "text",
-                "text": {"content": raw_url, "link": {"url": raw_url}},
-                "annotations": {"bold": False}
-            })
-            
-        last_idx = end
-    
-    # Add any remaining plain text at the end
-    if last_idx < len(text):
-        plain_text = text[last_idx:]
-        if plain_text:
-            rich_text_elements.append({"type": "text", "text": {"content": plain_text}})
-            
-    return rich_text_elements
-
-def add_to_notion(title, content, report_date_str):
-    """Notion DB에 요약 리포트 추가"""
+def add_to_notion(title, content, report_date_str, blocks=None, database_id=None):
+    """
+    Notion DB에 요약 리포트 추가 (blocks: 미리 변환해 둔 블록, 없으면 content를 변환). 성공 여부 반환
+    database_id가 없으면 NOTION_DATABASE_ID 환경 변수의 DB
+    """
     print("📝 Notion에 리포트 등록 중...")
 
     api_key = os.getenv("NOTION_API_KEY")
-    database_id = os.getenv("NOTION_DATABASE_ID")
+    database_id = database_id or os.getenv("NOTION_DATABASE_ID")
 
     if not api_key or not database_id:
         print("❌ Notion API 키 또는 데이터베이스 ID가 없습니다.")
         print("   .env 파일에 NOTION_API_KEY와 NOTION_DATABASE_ID를 설정하세요.\n")
-        return
+        return False
 
     try:
-        notion = notion_client.Client(auth=api_key)
-
-        children_blocks = []
-        lines = content.split('\n')
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            stripped_line = line.strip()
-
-            if not stripped_line:
-                i += 1
-                continue
+        import notion_client
 
-            # --- 블록 레벨 요소 처리 ---
+        notion = notion_client.Client(auth=api_key)
 
-            # 제목 (Headings)
-            if stripped_line.startswith('# '):
-                text_content = stripped_line[2:]
-                block = {"object": "block", "type": "heading_1", "heading_1": {"rich_text": parse_inline_formatting(text_content)}}
-                children_blocks.append(block)
-                i += 1
-                continue
-            elif stripped_line.startswith('## '):
-                text_content = stripped_line[3:]
-                block = {"object": "block", "type": "heading_2", "heading_2": {"rich_text": parse_inline_formatting(text_content)}}
-                children_blocks.append(block)
-                i += 1
-                continue
-            elif stripped_line.startswith('### '):
-                text_content = stripped_line[4:]
-                block = {"object": "block", "type": "heading_3", "heading_3": {"rich_text": parse_inline_formatting(text_content)}}
-                children_blocks.append(block)
-                i += 1
-                continue
+        if blocks is None:
+            blocks = markdown_to_notion_blocks(content)
 
-            # 목록 그룹 처리 (Process a whole list at once)
-            is_numbered = re.match(r'^\d+[\.\)]\s', stripped_line)
-            is_bulleted = stripped_line.startswith(('- ', '* '))
-            if is_numbered or is_bulleted:
-                list_type_to_process = 'numbered' if is_numbered else 'bulleted'
-                
-                # Loop as long as we are in the same type of list
-                while i < len(lines):
-                    current_line_stripped = lines[i].strip()
-                    if not current_line_stripped:
-                        # empty line breaks the list
-                        break 
-                    
-                    is_current_line_numbered = re.match(r'^\d+[\.\)]\s', current_line_stripped)
-                    is_current_line_bulleted = current_line_stripped.startswith(('- ', '* '))
-
-                    # Break if list type changes or it's not a list item
-                    if (list_type_to_process == 'numbered' and not is_current_line_numbered) or \
-                       (list_type_to_process == 'bulleted' and not is_current_line_bulleted) or \
-                        current_line_stripped.startswith('#'):
-                        break
-
-                    # It's a valid item of the current list. Process it.
-                    if is_current_line_numbered:
-                        text_content = re.sub(r'^\d+[\.\)]\s', '', current_line_stripped)
-                        block_type = 'numbered_list_item'
-                    else:
-                        text_content = current_line_stripped[2:]
-                        block_type = 'bulleted_list_item'
-
-                    # Find multi-line content for this item
-                    item_content_end_index = i + 1
-                    while item_content_end_index < len(lines):
-                        next_line = lines[item_content_end_index]
-                        next_line_stripped = next_line.strip()
-                        # Stop if next line is a new list/block type or empty
-                        if not next_line_stripped or next_line_stripped.startswith(('#', '- ', '* ')) or re.match(r'^\d+[\.\)]\s', next_line_stripped):
-                            break
-                        text_content += '\n' + next_line
-                        item_content_end_index += 1
-
-                    # Create and append the list item block
-                    rich_text = parse_inline_formatting(text_content)
-                    block = {"object": "block", "type": block_type, block_type: {"rich_text": rich_text}}
-                    children_blocks.append(block)
-
-                    # Move master index 'i' to the next item
-                    i = item_content_end_index
-                
-                continue # Finished processing the list, restart main while loop
-
-            # 일반 문단 (Paragraphs) - Fallback
-            text_content = line
-            i += 1
-            # Consume subsequent lines until a new block starts
-            while i < len(lines):
-                next_line = lines[i]
-                next_line_stripped = next_line.strip()
-                if not next_line_stripped or \
-                    next_line_stripped.startswith(('#', '- ', '* ')) or \
-                    re.match(r'^\d+[\.\)]\s', next_line_stripped):
-                    break
-                text_content += '\n' + next_line
-                i += 1
-            
-            block = {"object": "block", "type": "paragraph", "paragraph": {"rich_text": parse_inline_formatting(text_content)}}
-            children_blocks.append(block)
-
-        # --- Notion 페이지 생성 ---
-        TITLE_PROPERTY_NAME = "이름"
-        DATE_PROPERTY_NAME = "날짜"
-
-        new_page_data = {
-            "parent": {"database_id": database_id},
-            "properties": {
-                TITLE_PROPERTY_NAME: {"title": [{"text": {"content": title}}]},
-                DATE_PROPERTY_NAME: {"date": {"start": report_date_str}}
-            },
-            "children": children_blocks
-        }
-
-        notion.pages.create(**new_page_data)
-        print("✅ Notion 등록 완료!\n")
+        # 새 페이지에 블록을 배치로 추가한 뒤 같은 날짜 기존 페이지는 보관
+        _, updated = publish_report(notion, database_id, title, report_date_str, blocks,
+                                    limiter=TokenBucket(NOTION_REQUESTS_PER_SECOND))
+        if updated:
+            print("✅ Notion 기존 페이지 교체 완료!\n")
+        else:
+            print("✅ Notion 등록 완료!\n")
+        return True
 
     except Exception as e:
         err_msg = str(e).lower()
         if "property" in err_msg and ("does not exist" in err_msg or "unrecognized property" in err_msg):
             print(f"❌ Notion 등록 오류: 데이터베이스에 필요한 속성이 없거나 이름이 다릅니다.")
-            print(f"   main.py 파일의 'add_to_notion' 함수에서 속성 이름을 확인하고,")
+            print(f"   notion_publisher.py 파일 상단의 속성 이름을 확인하고,")
             print(f"   사용자 Notion DB의 실제 속성 이름으로 TITLE_PROPERTY_NAME과 DATE_PROPERTY_NAME을 수정해주세요.")
             print(f"   (현재 설정: 제목='{TITLE_PROPERTY_NAME}', 날짜='{DATE_PROPERTY_NAME}')\n")
         else:
             print(f"❌ Notion 등록 오류: {e}\n")
+        return False
 
 
-def save_report(summary, articles_count, target_date=None):
-    os.makedirs("reports", exist_ok=True)
-    
+REPORT_PREFIX = "\n\n"
+REPORT_SUFFIX = f"\n\n{'='*70}\n"
+
+
+def _report_filename(target_date=None, profile=None):
     if target_date:
-        date_obj = datetime.strptime(target_date, "%Y-%m-%d")
-        today = date_obj.strftime("%Y%m%d")
-        display_date = date_obj.strftime('%Y년 %m월 %d일')
+        today = datetime.strptime(target_date, "%Y-%m-%d").strftime("%Y%m%d")
     else:
         today = datetime.now().strftime("%Y%m%d")
-        display_date = datetime.now().strftime('%Y년 %m월 %d일')
-    
-    filename = f"reports/daily_report_{today}.txt"
+    suffix = f"_{profile.name}" if profile else ""
+    return f"reports/daily_report_{today}{suffix}.txt"
 
-    report = f"""
 
-{summary}
+def save_report(summary, articles_count, target_date=None, profile=None):
+    os.makedirs("reports", exist_ok=True)
+    
+    filename = _report_filename(target_date, profile)
 
-{"="*70}
-"""
+    report = f"{REPORT_PREFIX}{summary}{REPORT_SUFFIX}"
     with open(filename, "w", encoding="utf-8") as f:
         f.write(report)
     print(f"✅ 저장 완료: {filename}\n")
+    _index_report(filename)
     return filename
 
+
+def _index_report(filename):
+    """저장한 리포트를 검색 색인에 반영 (색인 실패는 리포트 저장을 막지 않음)"""
+    try:
+        conn = open_index()
+        try:
+            count = index_report(conn, filename)
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️  리포트 색인 실패 ({filename}): {e}\n")
+        return
+    print(f"🗂️  리포트 색인 갱신: 항목 {count}개 (python main.py search 검색어)\n")
+
+def _report_title(report_day, profile=None):
+    day = datetime.strptime(report_day, '%Y-%m-%d').strftime('%Y년 %m월 %d일')
+    return f"{day} {profile.title}" if profile else f"{day} 뉴스 브리핑"
+
+
+def add_many_to_notion(jobs, max_workers=3):
+    """
+    여러 리포트를 Notion에 동시 등록. 작업 순서대로 publish_many 결과 반환
+
+    Args:
+        jobs (list[tuple]): (title, content, report_date_str, blocks, database_id)
+            database_id가 None이면 NOTION_DATABASE_ID, DB별로 나눠 차례로 등록 (전체 요청 속도 유지)
+    """
+    print(f"📝 Notion에 리포트 {len(jobs)}건 등록 중...")
+
+    api_key = os.getenv("NOTION_API_KEY")
+    default_database_id = os.getenv("NOTION_DATABASE_ID")
+
+    if not api_key:
+        print("❌ Notion API 키가 없습니다.")
+        print("   .env 파일에 NOTION_API_KEY와 NOTION_DATABASE_ID를 설정하세요.\n")
+        return []
+
+    by_database = {}
+    results = [None] * len(jobs)
+    for index, (title, content, report_date_str, blocks, database_id) in enumerate(jobs):
+        database_id = database_id or default_database_id
+        if not database_id:
+            results[index] = {"date": report_date_str, "page_id": None, "updated": False,
+                              "error": "Notion 데이터베이스 ID가 없습니다"}
+            continue
+        by_database.setdefault(database_id, []).append(index)
+
+    if by_database:
+        import notion_client
+
+        notion = notion_client.Client(auth=api_key)
+        for database_id, indexes in by_database.items():
+            publish_jobs = []
+            for index in indexes:
+                title, content, report_date_str, blocks, _ = jobs[index]
+                publish_jobs.append((title, report_date_str,
+                                     blocks if blocks is not None else markdown_to_notion_blocks(content)))
+            for index, result in zip(indexes, publish_many(notion, database_id, publish_jobs, max_workers=max_workers)):
+                results[index] = result
+
+    for job, result in zip(jobs, results):
+        if result["error"]:
+            print(f"  ❌ {job[0]}: {result['error']}")
+        else:
+            print(f"  ✅ {job[0]}: {'기존 페이지 교체' if result['updated'] else '새 페이지 등록'}")
+    print()
+    return results
+
+
+def _publish_notion_jobs(plan_jobs, label):
+    """(StagePlan, Notion 작업) 목록을 한 번에 등록하고 성공한 작업만 그 계획에 notion 체크포인트 저장"""
+    with current_metrics().stage("notion", day=label, items_in=len(plan_jobs)):
+        results = add_many_to_notion([job for _, job in plan_jobs])
+    for (plan, _), result in zip(plan_jobs, results):
+        if not result["error"]:
+            plan.checkpoint.save("notion", {"date": result["date"], "published": True})
+
+
+def _run_day(args, report_day, articles, store, llm_cache, plan, target_date=None, publish=True, unique_articles=None):
+    """
+    수집된 기사로 하루치 리포트 생성 (중복 제거 → [본문 보강] → 선별 → 요약 → 저장 → Notion)
+
+    각 단계 결과는 plan의 체크포인트로 저장/복원되므로 --resume, --from-stage,
+    --only-stage로 이미 끝난 단계를 다시 실행하지 않을 수 있다.
+    --briefing-profiles이면 본문 보강까지 한 번 처리한 결과로 프로필별 선별 이후 단계를 동시에 진행한다.
+
+    Args:
+        report_day (str): 리포트 날짜 'YYYY-MM-DD'
+        articles (list): collect 단계 결과
+        plan (StagePlan): 단계별 실행 계획
+        target_date (str): 리포트 파일 이름에 쓸 날짜 (None이면 오늘)
+        publish (bool): False이면 Notion 등록 대신 등록할 작업을 반환
+        unique_articles (list): 스트리밍 수집에서 이미 중복 제거까지 끝난 결과 (주어지면 중복 제거 단계 생략)
+
+    Returns:
+        tuple: (리포트 파일 경로 목록, Notion에 등록할 (StagePlan, 작업) 목록)
+    """
+    window = exclusion_window(report_day, args.exclude_days) if store and args.exclude_days > 0 else None
+    summarized_only = not args.exclude_seen
+
+    def _dedup_url():
+        if store:
+            upsert_articles(store, articles, collected_day=report_day)
+        return dedup_by_url(articles, store=store, exclude_window=window, summarized_only=summarized_only)
+
+    if unique_articles is None:
+        deduped = plan.stage("dedup_url", _dedup_url, items_in=len(articles))
+        if plan.stops_after("dedup_url"):
+            return [], []
+
+        unique_articles = plan.stage("dedup_tfidf", lambda: remove_duplicates_tfidf(
+            deduped, threshold=0.72, engine=args.dedup_engine,
+            store=store, exclude_window=window, summarized_only=summarized_only), items_in=len(deduped))
+        if plan.stops_after("dedup_tfidf"):
+            return [], []
+
+    if args.enrich:
+        unique_articles = plan.stage("enrich", lambda: enrich_news(unique_articles), items_in=len(unique_articles))
+    if plan.stops_after("enrich"):
+        return [], []
+
+    if args.profiles:
+        return _run_profiles(args, report_day, unique_articles, store, llm_cache, plan, target_date, publish)
+
+    filename, job = _run_briefing(args, report_day, unique_articles, store, llm_cache, plan, target_date, publish)
+    return [filename] if filename else [], [(plan, job)] if job else []
+
+
+# 프로필 브리핑이 동시에 요약을 끝내고 저장소에 요약 여부를 기록할 때 사용
+_store_lock = threading.Lock()
+
+
+def _run_profiles(args, report_day, unique_articles, store, llm_cache, plan, target_date, publish):
+    """공통 단계 결과로 프로필별 브리핑(선별 → 요약 → 저장)을 동시에 만들고 Notion 등록은 모아서 처리"""
+    print(f"👥 프로필 {len(args.profiles)}개 브리핑 동시 생성: {', '.join(p.name for p in args.profiles)}\n")
+    profile_plans = [(profile, plan.for_profile(profile.name)) for profile in args.profiles]
+    with ThreadPoolExecutor(max_workers=len(profile_plans)) as executor:
+        futures = [
+            executor.submit(_run_briefing, args, report_day, unique_articles, store, llm_cache, profile_plan,
+                            target_date, False, profile)
+            for profile, profile_plan in profile_plans
+        ]
+        results = [future.result() for future in futures]
+
+    filenames = [filename for filename, _ in results if filename]
+    plan_jobs = [(profile_plan, job) for (_, profile_plan), (_, job) in zip(profile_plans, results) if job]
+    # --only-stage select/summarize가 아닌데 리포트가 없으면 후보 기사가 없던 프로필
+    skipped = [profile.name for (profile, profile_plan), (filename, _) in zip(profile_plans, results)
+               if filename is None
+               and not (profile_plan.stops_after("select") or profile_plan.stops_after("summarize"))]
+    if skipped:
+        print(f"⚠️  후보 기사가 없어 리포트를 만들지 않은 프로필: {', '.join(skipped)}\n")
+        current_metrics().event("profiles_skipped", day=report_day, profiles=skipped)
+    if publish and plan_jobs:
+        # Notion 요청 속도 제한을 프로필끼리 나눠 쓰도록 한 번에 등록
+        _publish_notion_jobs(plan_jobs, report_day)
+        return filenames, []
+    return filenames, plan_jobs
+
+
+def _run_briefing(args, report_day, unique_articles, store, llm_cache, plan, target_date=None, publish=True,
+                  profile=None):
+    """
+    중복 제거(·본문 보강) 결과로 브리핑 하나 생성 (선별 → 요약 → 저장 → Notion)
+
+    Args:
+        profile (Profile): 프로필 브리핑이면 그 프로필 (키워드로 후보 기사를 고르고 프롬프트/파일 이름/Notion DB 적용)
+
+    Returns:
+        tuple: (리포트 파일 경로 또는 None, Notion 작업 또는 None)
+    """
+    label = f"[{profile.name}] " if profile else ""
+    candidates = unique_articles
+    if profile is not None:
+        candidates = profile.select_candidates(unique_articles)
+        print(f"👤 {label}{profile.title}: 후보 기사 {len(candidates)}/{len(unique_articles)}개\n")
+        if not candidates:
+            print(f"❌ {label}프로필 키워드에 해당하는 기사가 없습니다.\n")
+            return None, None
+
+    # 요약 입력 선별: single 모드는 토큰 예산 안에서 중요도 순으로 채움
+    budgeted = args.summary_mode == "single" and args.token_budget > 0
+    max_articles = None if budgeted else 80
+
+    def _select():
+        if not budgeted:
+            return candidates
+        chosen, est_tokens = select_articles(candidates, token_budget=args.token_budget)
+        print(f"🎯 {label}요약 입력 선별: {len(chosen)}/{len(candidates)}개 (추정 {est_tokens} 토큰)\n")
+        return chosen
+
+    prompt_articles = plan.stage("select", _select, items_in=len(candidates))
+    if plan.stops_after("select"):
+        return None, None
+
+    # 스트리밍으로 요약한 경우 리포트 파일과 Notion 블록이 요약 단계에서 함께 만들어진다
+    streamed = {"filename": None, "blocks": None}
+    system_prompt, instructions = _summary_prompts(profile)
+
+    def _summarize():
+        stream_writer = None
+        notion_blocks = None
+        if args.stream:
+            notion_blocks = []
+            stream_writer = ReportStreamWriter(
+                _report_filename(target_date, profile), prefix=REPORT_PREFIX, suffix=REPORT_SUFFIX,
+                on_section=lambda text: notion_blocks.extend(markdown_to_notion_blocks(text)),
+            )
+
+        summary = summarize_news(prompt_articles, mode=args.summary_mode, max_articles=max_articles,
+                                 max_in_flight=args.max_in_flight, cache=llm_cache,
+                                 on_token=stream_writer.write if stream_writer else None,
+                                 instructions=instructions, system_prompt=system_prompt,
+                                 keywords=profile.keywords if profile and profile.keywords else None)
+        failed = summary.startswith("❌")
+
+        if stream_writer and not failed:
+            streamed["filename"] = stream_writer.finish()
+            streamed["blocks"] = notion_blocks
+            ttft = stream_writer.time_to_first_token
+            print(f"✅ 저장 완료: {streamed['filename']} "
+                  f"(첫 토큰 {ttft if ttft is not None else 0:.1f}초, 전체 {stream_writer.total_time:.1f}초)\n")
+        elif stream_writer:
+            stream_writer.abort()
+
+        if store and not failed:
+            # map-reduce는 개수 제한 없이 모두 요약하므로 전부, single은 실제로 프롬프트에 넣은 max_articles개만 기록
+            everything = args.summary_mode == "map-reduce" or max_articles is None
+            summarized = prompt_articles if everything else prompt_articles[:max_articles]
+            with _store_lock:
+                mark_summarized(store, summarized, report_day)
+        return summary
+
+    # 실패한 요약은 저장하지 않아 --resume 시 다시 요약한다
+    summary = plan.stage("summarize", _summarize, should_save=lambda text: not text.startswith("❌"))
+    if plan.stops_after("summarize"):
+        return streamed["filename"], None
+
+    def _report():
+        if streamed["filename"]:
+            _index_report(streamed["filename"])
+            return {"filename": streamed["filename"]}
+        return {"filename": save_report(summary, len(candidates), target_date=target_date, profile=profile)}
+
+    report = plan.stage("report", _report)
+    if report is None:
+        return streamed["filename"], None
+    filename = report["filename"]
+    if plan.stops_after("report"):
+        return filename, None
+
+    # Notion에 등록
+    database_id = profile.database_id if profile else None
+    job = (_report_title(report_day, profile), summary, report_day, streamed["blocks"], database_id)
+    if not publish:
+        # 기간 백필/여러 프로필은 작업을 모아 한 번에 등록하고, 성공한 작업만 체크포인트 저장
+        return filename, job if plan.action("notion") == "run" else None
+
+    plan.stage("notion", lambda: {"date": report_day, "published": add_to_notion(*job[:3], blocks=job[3])},
+               should_save=lambda result: result["published"])
+    return filename, None
+
+
+STREAM_STAGES = ("collect", "dedup_url", "dedup_tfidf")
+
+
+def _stream_collect_dedup(args, plans, store, batches):
+    """
+    수집 묶음을 받는 대로 날짜별 StreamingDedup에 넘겨 collect → dedup_url → dedup_tfidf를 한 번에 처리
+    (collect/dedup_url 체크포인트는 한 건씩 이어 쓰고, dedup_tfidf는 끝나고 저장)
+
+    Args:
+        plans (dict): {'YYYY-MM-DD': StagePlan} — 세 단계 모두 새로 실행되는 날짜만
+        batches: iter_naver_batches가 내보내는 (KST 일자, 기사 목록)
+
+    Returns:
+        dict: {'YYYY-MM-DD': 고유 기사 목록} — 수집 0건인 날짜는 None
+    """
+    summarized_only = not args.exclude_seen
+    streams = {}
+    days = sorted(plans)
+    label = days[0] if len(days) == 1 else f"{days[0]}~{days[-1]}"
+    with contextlib.ExitStack() as stack, current_metrics().stage("collect_stream", day=label) as record:
+        for day, plan in plans.items():
+            window = exclusion_window(day, args.exclude_days) if store and args.exclude_days > 0 else None
+            collected = stack.enter_context(plan.checkpoint.writer("collect", keep_empty=False))
+            url_unique = stack.enter_context(plan.checkpoint.writer("dedup_url"))
+            streams[day] = StreamingDedup(store=store, collected_day=day, exclude_window=window,
+                                          summarized_only=summarized_only,
+                                          on_collected=collected.write, on_url_unique=url_unique.write)
+
+        for pub_day, articles in batches:
+            # 오늘 수집 모드는 날짜가 하나뿐이라 KST 일자와 리포트 날짜가 달라도 같은 묶음으로 처리
+            stream = streams.get(pub_day.isoformat()) if len(streams) > 1 else next(iter(streams.values()))
+            if stream is not None:
+                stream.add(articles)
+
+        record["items_in"] = sum(stream.collected for stream in streams.values())
+        record["items_out"] = sum(len(stream.unique) for stream in streams.values())
+
+    print("\n🔍 스트리밍 중복 제거 결과")
+    results = {}
+    for day, stream in streams.items():
+        for line in stream.summary_lines():
+            print(f"  {day}: {line}" if len(streams) > 1 else f"  → {line}")
+        if not stream.collected:
+            results[day] = None
+            continue
+        plans[day].checkpoint.save("dedup_tfidf", stream.unique)
+        results[day] = stream.unique
+    print()
+    return results
+
+
+def _keyword_planner(args):
+    """--all-keywords이면 계획 없이 모두 조회하되 통계는 계속 기록 (조기 종료는 --early-stop일 때만)"""
+    return KeywordPlanner(active=not args.all_keywords, early_stop=args.early_stop)
+
+
+def _collect_keywords(args):
+    """수집할 네이버 키워드 (--briefing-profiles이면 프로필 키워드 합집합)"""
+    return union_keywords(args.profiles, NAVER_KEYWORDS) if args.profiles else NAVER_KEYWORDS
+
+
+def _stage_plan(args, report_day):
+    return StagePlan(RunCheckpoint(report_day), resume=args.resume,
+                     from_stage=args.from_stage, only_stage=args.only_stage, metrics=current_metrics())
+
+
+def _range_days(from_date, to_date):
+    """'YYYY-MM-DD' 기간의 날짜 문자열 목록 (오래된 날짜부터, 형식 오류면 빈 목록)"""
+    try:
+        oldest_day = datetime.strptime(from_date, "%Y-%m-%d").date()
+        newest_day = datetime.strptime(to_date, "%Y-%m-%d").date()
+    except ValueError:
+        return []
+    if oldest_day > newest_day:
+        oldest_day, newest_day = newest_day, oldest_day
+    return [(oldest_day + timedelta(days=k)).isoformat() for k in range((newest_day - oldest_day).days + 1)]
+
+
+def _run_single(args, store, llm_cache):
+    """하루치 실행. 수집된 기사가 없으면 None"""
+    report_day = args.date or datetime.now().strftime("%Y-%m-%d")
+    plan = _stage_plan(args, report_day)
+
+    if args.stream_dedup and _range_days(report_day, report_day) and plan.runs_all(STREAM_STAGES):
+        # 날짜 형식이 잘못되면 일반 수집 경로에서 안내 후 종료
+        print("📰 네이버 뉴스 API로 스트리밍 수집 시작...")
+        day = datetime.strptime(report_day, "%Y-%m-%d").date() if args.date else datetime.now(KST).date()
+        batches = iter_naver_batches(day, day, first_page_only=args.date is None,
+                                     max_concurrency=args.concurrency, seek=args.seek, planner=_keyword_planner(args),
+                                     keywords=_collect_keywords(args))
+        unique_articles = _stream_collect_dedup(args, {report_day: plan}, store, batches)[report_day]
+        if unique_articles is None:
+            print("❌ 수집된 기사가 없습니다.")
+            return None
+        filenames, _ = _run_day(args, report_day, None, store, llm_cache, plan, target_date=args.date,
+                                unique_articles=unique_articles)
+        return filenames
+
+    def _collect():
+        if args.from_store:
+            return collect_news_from_store(store, target_date=args.date, max_concurrency=args.concurrency,
+                                           keywords=_collect_keywords(args))
+        # ✅ 날짜 파라미터 전달
+        return collect_news_from_naver(target_date=args.date, max_concurrency=args.concurrency, seek=args.seek,
+                                       planner=_keyword_planner(args), keywords=_collect_keywords(args))
+
+    articles = plan.stage("collect", _collect, should_save=bool)
+
+    if not articles:
+        print("❌ 수집된 기사가 없습니다.")
+        return None
+    if plan.stops_after("collect"):
+        return []
+
+    filenames, _ = _run_day(args, report_day, articles, store, llm_cache, plan, target_date=args.date)
+    return filenames
+
+
+def _run_range(args, store, llm_cache):
+    """기간 백필: 한 번의 페이지 순회로 모든 날짜 기사를 모은 뒤 날짜별로 리포트 생성"""
+    plans = {day: _stage_plan(args, day) for day in _range_days(args.from_date, args.to_date)}
+
+    # 스트리밍: 수집과 중복 제거를 겹쳐서 처리 (모든 날짜가 세 단계를 새로 실행할 때만)
+    streamed = {}
+    if args.stream_dedup and plans and all(plan.runs_all(STREAM_STAGES) for plan in plans.values()):
+        days = sorted(plans)
+        print("📰 네이버 뉴스 API로 기간 스트리밍 수집 시작...")
+        batches = iter_naver_batches(datetime.strptime(days[0], "%Y-%m-%d").date(),
+                                     datetime.strptime(days[-1], "%Y-%m-%d").date(),
+                                     max_concurrency=args.concurrency, seek=args.seek, planner=_keyword_planner(args),
+                                     keywords=_collect_keywords(args))
+        streamed = _stream_collect_dedup(args, plans, store, batches)
+
+    # 수집 체크포인트가 없는 날짜가 하나라도 있을 때만 순회
+    by_day = {}
+    if args.from_store:
+        by_day = {day: load_articles(store, day) for day in plans}
+    elif not streamed and (not plans or any(plan.action("collect") == "run" for plan in plans.values())):
+        with current_metrics().stage("collect_sweep", day=f"{args.from_date}~{args.to_date}") as record:
+            by_day = collect_news_from_naver_range(args.from_date, args.to_date, max_concurrency=args.concurrency,
+                                                   seek=args.seek, planner=_keyword_planner(args),
+                                                   keywords=_collect_keywords(args))
+            record["items_out"] = sum(len(articles) for articles in by_day.values())
+
+    filenames = []
+    notion_jobs = []
+    for report_day, plan in plans.items():
+        print("-"*70)
+        print(f"📆 {report_day} 리포트 생성")
+        print("-"*70 + "\n")
+        if streamed:
+            articles = None
+            if streamed[report_day] is None:
+                print("❌ 수집된 기사가 없습니다.\n")
+                continue
+        else:
+            articles = plan.stage("collect", lambda: by_day.get(report_day, []), should_save=bool)
+            if not articles:
+                print("❌ 수집된 기사가 없습니다.\n")
+                continue
+            if plan.stops_after("collect"):
+                continue
+        day_filenames, plan_jobs = _run_day(args, report_day, articles, store, llm_cache, plan,
+                                            target_date=report_day, publish=False,
+                                            unique_articles=streamed.get(report_day))
+        filenames.extend(day_filenames)
+        notion_jobs.extend(plan_jobs)
+
+    if notion_jobs:
+        _publish_notion_jobs(notion_jobs, f"{args.from_date}~{args.to_date}")
+    return filenames
+
+
+PROFILE_DEFAULT = "auto"
+
+
+def _report_import_times():
+    """main 모듈 로딩~인자 파싱 시간과 무거운 의존성별 import 시간 출력"""
+    print(f"⏱️  main 모듈 로딩 → 인자 파싱: {(time.perf_counter() - _MODULE_STARTED) * 1000:.0f}ms")
+    preloaded = [module for module, _ in HEAVY_IMPORTS if module in sys.modules]
+    if preloaded:
+        print(f"   ⚠️  시작 시점에 이미 로딩됨: {', '.join(preloaded)}")
+    total = 0.0
+    for module, stage in HEAVY_IMPORTS:
+        started = time.perf_counter()
+        importlib.import_module(module)
+        elapsed = time.perf_counter() - started
+        total += elapsed
+        print(f"   {module:<34} {elapsed * 1000:7.0f}ms  ({stage} 단계에서 로딩)")
+    print(f"   {'합계':<33} {total * 1000:7.0f}ms\n")
+
+
+def _dump_profile(profiler, path):
+    """cProfile 결과 저장 후 누적 시간 상위 함수 출력"""
+    import pstats
+
+    if path == PROFILE_DEFAULT:
+        path = os.path.join(BASE_DIR, "logs", f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.prof")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    profiler.dump_stats(path)
+    print(f"🔬 프로파일 저장: {path} (누적 시간 상위 15개)")
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "search":
+        search_main(sys.argv[2:])
+        return
+
     # 커맨드라인 인자 파싱
-    parser = argparse.ArgumentParser(description='경제/IT 뉴스 요약 서비스')
+    parser = argparse.ArgumentParser(
+        description='경제/IT 뉴스 요약 서비스',
+        epilog='지난 리포트 검색: python main.py search 검색어 [--from YYYY-MM-DD --to YYYY-MM-DD --section 경제|IT --profile 이름]',
+    )
     parser.add_argument(
         '--date', '-d',
         type=str,
         default=None,
         help='수집할 날짜 (YYYY-MM-DD 형식, 예: 2026-01-10). 미지정시 오늘'
     )
+    parser.add_argument(
+        '--from',
+        dest='from_date',
+        type=str,
+        default=None,
+        help='기간 백필 시작 날짜 (YYYY-MM-DD, --to와 함께 사용)'
+    )
+    parser.add_argument(
+        '--to',
+        dest='to_date',
+        type=str,
+        default=None,
+        help='기간 백필 끝 날짜 (YYYY-MM-DD, 포함)'
+    )
+    parser.add_argument(
+        '--concurrency', '-c',
+        type=int,
+        default=4,
+        help='네이버 키워드 동시 조회 수 (기본 4, 1이면 순차 조회)'
+    )
+    parser.add_argument(
+        '--seek',
+        action='store_true',
+        help='과거 날짜 수집 시 대상 날짜가 걸리는 페이지를 탐색해 앞쪽 페이지 호출을 건너뜀'
+    )
+    parser.add_argument(
+        '--all-keywords',
+        action='store_true',
+        help='키워드 계획(겹치는 키워드 건너뛰기/조기 종료) 없이 모든 키워드를 끝까지 조회 (통계는 계속 기록)'
+    )
+    parser.add_argument(
+        '--early-stop',
+        action='store_true',
+        help='앞선 키워드에서 이미 본 기사가 대부분인 페이지가 나오면 그 키워드는 더 내려가지 않음 '
+             '(API 호출 절약, 일부 기사를 놓칠 수 있음)'
+    )
+    parser.add_argument(
+        '--stream-dedup',
+        action='store_true',
+        help='수집 페이지가 도착하는 대로 URL/유사 기사 중복 제거 (해시 특성 공간 온라인 판정, --dedup-engine 무시)'
+    )
+    parser.add_argument(
+        '--dedup-engine',
+        choices=DEDUP_ENGINES,
+        default='auto',
+        help='유사 기사 제거 엔진 (기본 auto: 건수에 따라 sparse/minhash 선택)'
+    )
+    parser.add_argument(
+        '--exclude-days',
+        type=int,
+        default=0,
+        help='최근 N일 안에 이미 다룬 기사 제외 (기본 0: 제외 안 함)'
+    )
+    parser.add_argument(
+        '--exclude-seen',
+        action='store_true',
+        help='--exclude-days 기준을 "요약됨" 대신 "수집됨"으로 적용'
+    )
+    parser.add_argument(
+        '--no-store',
+        action='store_true',
+        help='기사 저장소(.cache/articles.sqlite3)를 사용하지 않음'
+    )
+    parser.add_argument(
+        '--enrich',
+        action='store_true',
+        help='중복 제거 후 기사 원문 페이지에서 본문을 추출해 요약 입력 보강 (.cache/fulltext/에 URL별 캐시)'
+    )
+    parser.add_argument(
+        '--briefing-profiles',
+        dest='profiles_path',
+        nargs='?',
+        const=DEFAULT_PROFILES_PATH,
+        default=None,
+        metavar='PATH',
+        help='프로필 설정(기본 profiles.json)의 독자별 브리핑을 한 번의 수집/중복 제거로 동시에 생성 '
+             '(키워드 합집합 수집, 프로필별 프롬프트/리포트 파일/Notion DB)'
+    )
+    parser.add_argument(
+        '--summary-mode',
+        choices=['single', 'map-reduce'],
+        default='single',
+        help='요약 방식 (single: 상위 80개 한 번에 / map-reduce: 묶음별 동시 요약 후 병합)'
+    )
+    parser.add_argument(
+        '--max-in-flight',
+        type=int,
+        default=4,
+        help='map-reduce 모드에서 동시에 보낼 OpenAI 요청 수 (기본 4)'
+    )
+    parser.add_argument(
+        '--token-budget',
+        type=int,
+        default=DEFAULT_TOKEN_BUDGET,
+        help=f'single 모드 요약 입력 기사 토큰 예산 (기본 {DEFAULT_TOKEN_BUDGET}, 0이면 선별 없이 상위 80개)'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='요약을 스트리밍으로 받아 리포트 파일에 바로 기록하고 완료된 섹션부터 Notion 블록으로 변환'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='OpenAI 응답 캐시를 읽지도 쓰지도 않음'
+    )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='OpenAI 응답 캐시를 무시하고 새로 요약한 결과로 갱신'
+    )
+    stage_group = parser.add_mutually_exclusive_group()
+    stage_group.add_argument(
+        '--resume',
+        action='store_true',
+        help='체크포인트(.cache/runs/YYYYMMDD/)가 있는 단계는 건너뛰고 이어서 실행'
+    )
+    stage_group.add_argument(
+        '--from-stage',
+        choices=STAGES,
+        default=None,
+        help='이전 단계는 체크포인트에서 불러오고 지정한 단계부터 다시 실행'
+    )
+    stage_group.add_argument(
+        '--only-stage',
+        choices=STAGES,
+        default=None,
+        help='이전 단계는 체크포인트에서 불러오고 지정한 단계만 실행 (예: notion → Notion 재등록)'
+    )
+    parser.add_argument(
+        '--metrics-file',
+        type=str,
+        default=DEFAULT_METRICS_PATH,
+        help='실행 지표(단계별 시간, HTTP, 토큰 사용량)를 JSON 한 줄로 덧붙일 파일 (기본 logs/metrics.jsonl)'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const=PROFILE_DEFAULT,
+        default=None,
+        metavar='PATH',
+        help='cProfile로 실행을 프로파일링해 PATH(기본 logs/profile_<시각>.prof)에 저장하고 상위 함수 출력'
+    )
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='수집 데몬 모드: --interval 분마다 네이버/RSS를 마지막 수집 이후분만 조회해 저장소에 누적'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=DAEMON_INTERVAL_MINUTES,
+        help=f'수집 데몬 폴링 간격(분, 기본 {DAEMON_INTERVAL_MINUTES})'
+    )
+    parser.add_argument(
+        '--from-store',
+        action='store_true',
+        help='API로 다시 수집하지 않고 저장소(수집 데몬이 모은 기사)에서 불러와 리포트 생성'
+    )
+    parser.add_argument(
+        '--timing-imports',
+        action='store_true',
+        help='시작~인자 파싱 시간과 무거운 의존성별 import 시간을 출력하고 종료'
+    )
     args = parser.parse_args()
+    if args.timing_imports:
+        _report_import_times()
+        return
     
     print("\n" + "="*70)
     print("🚀 경제/IT 뉴스 요약 서비스 시작 (OpenAI + Naver/RSS)")
     print("="*70 + "\n")
 
-    # ✅ 날짜 파라미터 전달
-    articles = collect_news_from_naver(target_date=args.date)
+    if bool(args.from_date) != bool(args.to_date):
+        print("❌ --from과 --to는 함께 지정해야 합니다.")
+        return
+    if args.from_date and args.date:
+        print("❌ --date와 --from/--to는 함께 쓸 수 없습니다.")
+        return
 
-    if not articles:
-        print("❌ 수집된 기사가 없습니다.")
+    if args.stream_dedup and args.from_store:
+        print("❌ --stream-dedup은 API 수집에만 쓸 수 있습니다 (--from-store와 함께 쓸 수 없음).")
+        return
+    if "enrich" in (args.from_stage, args.only_stage) and not args.enrich:
+        print("❌ --from-stage/--only-stage enrich는 --enrich와 함께 써야 합니다.")
+        return
+    if args.no_store and (args.daemon or args.from_store):
+        print("❌ --daemon/--from-store는 기사 저장소가 필요합니다 (--no-store와 함께 쓸 수 없음).")
         return
 
-    articles = dedup_by_url(articles)
-    unique_articles = remove_duplicates_tfidf(articles, threshold=0.72)
+    args.profiles = None
+    if args.profiles_path:
+        try:
+            args.profiles = load_profiles(args.profiles_path)
+        except ProfileError as e:
+            print(f"❌ {e}")
+            return
+        print(f"👥 프로필 {len(args.profiles)}개: "
+              + ", ".join(f"{p.name}({p.title}, 키워드 {len(p.keywords) or '전체'})" for p in args.profiles))
+        print(f"   수집 키워드 {len(_collect_keywords(args))}개 (프로필 키워드 합집합)\n")
+
+    store = None if args.no_store else open_store()
+    if args.daemon:
+        run_daemon(store, interval_minutes=args.interval, max_concurrency=args.concurrency,
+                   keywords=_collect_keywords(args))
+        return
 
-    summary = summarize_news(unique_articles)
-    filename = save_report(summary, len(unique_articles), target_date=args.date)
+    llm_cache = None if args.no_cache else LLMCache(read=not args.refresh)
 
-    # Notion에 등록
-    # 날짜가 지정되지 않았을 경우 오늘 날짜로 설정
-    if args.date:
-        report_date = datetime.strptime(args.date, "%Y-%m-%d")
-    else:
-        # report 파일 저장시 사용된 날짜와 동일하게 오늘 날짜 사용
-        report_date = datetime.now()
+    metrics = current_metrics()
+    profiler = None
+    if args.profile:
+        import cProfile
 
-    report_title = f"{report_date.strftime('%Y년 %m월 %d일')} 뉴스 브리핑"
-    add_to_notion(report_title, summary, report_date.strftime("%Y-%m-%d"))
+        profiler = cProfile.Profile()
+    status = "error"
+    filenames = []
+    if profiler:
+        profiler.enable()
+    try:
+        filenames = _run_range(args, store, llm_cache) if args.from_date else _run_single(args, store, llm_cache)
+        status = "ok" if filenames is not None else "no_articles"
+    except CheckpointMissing as e:
+        status = "checkpoint_missing"
+        print(f"❌ {e}")
+        print("   --from-stage/--only-stage 이전 단계를 먼저 실행하거나 --resume을 사용하세요.")
+    finally:
+        if profiler:
+            profiler.disable()
+            _dump_profile(profiler, args.profile)
+        # HTTP를 쓰지 않은 실행(--only-stage 등)에서 집계하려고 클라이언트(requests import)를 만들지 않는다
+        http_client = existing_client()
+        metrics.write(
+            args.metrics_file,
+            status=status,
+            date=args.date,
+            range=[args.from_date, args.to_date] if args.from_date else None,
+            summary_mode=args.summary_mode,
+            profiles=[profile.name for profile in args.profiles] if args.profiles else None,
+            reports=filenames or [],
+            http=http_client.host_stats() if http_client else {},
+        )
+    if status != "ok":
+        return
 
     print("="*70)
     print("✨ 완료! 리포트를 확인하세요:")
-    print(f"   📄 {filename}")
+    for filename in filenames:
+        print(f"   📄 {filename}")
+    if llm_cache is not None:
+        print(f"   🗃️  {llm_cache.summary_line()}")
+    usage = metrics.openai
+    print(f"   🤖 OpenAI {usage['calls']}회, 토큰 {usage['prompt_tokens']} + {usage['completion_tokens']}")
+    print(f"   📈 실행 지표: {args.metrics_file}")
+    for line in http_client.summary_lines() if http_client else []:
+        print(f"   🌐 {line}")
     print("="*70 + "\n")
 
 if __name__ == "__main__":
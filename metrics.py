@@ -0,0 +1,92 @@
+"""
+실행 지표 기록
+
+단계별 소요 시간/입출력 기사 수, OpenAI 토큰 사용량, HTTP 호스트별 요청 수·바이트를
+모아 실행 1회당 JSON 한 줄로 logs/metrics.jsonl에 덧붙인다. 날짜별로 비교해
+성능/비용 변화를 추적하는 용도.
+
+get_client()처럼 프로세스 공용 인스턴스(current())를 두어 깊은 곳(_chat 등)에서도
+인자를 넘기지 않고 기록할 수 있게 한다.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_METRICS_PATH = os.path.join(BASE_DIR, "logs", "metrics.jsonl")
+
+USAGE_FIELDS = ("prompt_tokens", "completion_tokens", "total_tokens")
+
+
+class RunMetrics:
+    def __init__(self):
+        self.started_at = datetime.now().astimezone().isoformat(timespec="seconds")
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+        self.stages = []
+        self.events = []
+        self.openai = {"calls": 0, "cache_hits": 0, **{field: 0 for field in USAGE_FIELDS}}
+
+    @contextmanager
+    def stage(self, name, day=None, **fields):
+        """
+        단계 하나의 소요 시간 기록. yield된 dict에 항목을 추가하면 함께 저장된다.
+
+            with metrics.stage("dedup_url", day=report_day, items_in=len(articles)) as record:
+                ...
+                record["items_out"] = len(result)
+        """
+        record = {"stage": name, "day": day, **fields}
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = round(time.perf_counter() - started, 3)
+            with self._lock:
+                self.stages.append(record)
+
+    def event(self, kind, **fields):
+        """단계 시간으로는 드러나지 않는 일(부분 실패, 건너뛴 조회 등) 기록"""
+        with self._lock:
+            self.events.append({"event": kind, **fields})
+
+    def add_openai_call(self, usage=None, cached=False):
+        """usage: response.usage.model_dump() 형태의 dict (없으면 호출 수만 집계)"""
+        with self._lock:
+            if cached:
+                self.openai["cache_hits"] += 1
+                return
+            self.openai["calls"] += 1
+            for field in USAGE_FIELDS:
+                self.openai[field] += (usage or {}).get(field) or 0
+
+    def to_record(self, **extra):
+        with self._lock:
+            return {
+                "started_at": self.started_at,
+                "seconds": round(time.perf_counter() - self._started, 3),
+                **extra,
+                "stages": [dict(record) for record in self.stages],
+                "events": [dict(event) for event in self.events],
+                "openai": dict(self.openai),
+            }
+
+    def write(self, path=DEFAULT_METRICS_PATH, **extra):
+        """실행 기록 1건을 JSONL 파일에 덧붙이고 기록한 dict 반환"""
+        record = self.to_record(**extra)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+        return record
+
+
+_current = RunMetrics()
+
+
+def current():
+    """프로세스 공용 RunMetrics"""
+    return _current
@@ -0,0 +1,144 @@
+"""
+요약 마크다운 → Notion 블록 변환기
+
+Notion 클라이언트 없이 텍스트만 받아 블록 리스트를 돌려주는 순수 함수라서
+단독으로 테스트/벤치마크할 수 있다. 줄마다 종류를 한 번만 판별한 뒤 한 번의
+순회로 블록을 만든다.
+
+지원 형식
+  - '# ', '## ', '### ' 제목
+  - '1. ' / '1) ' 숫자 목록, '- ' / '* ' 글머리 목록 (다음 줄이 일반 텍스트면 같은 항목으로 이어붙임)
+  - 그 외 연속된 줄은 하나의 문단
+  - 인라인: **굵게**, [텍스트](URL), 일반 URL
+"""
+import re
+
+# 인라인 서식: Markdown 링크가 일반 URL보다 먼저 매칭되어야 함
+_INLINE_PATTERN = re.compile(
+    r'\[(?P<md_text>[^\]]+?)\]\((?P<md_url>https?:\/\/[^\s\)]+)\)'  # Markdown link
+    r'|\*\*(?P<bold_text>[^\*]+?)\*\*'                               # Bold text
+    r'|(?P<raw_url>https?:\/\/[^\s]+)'                                # Raw URL
+)
+
+# 줄 종류 판별 (strip된 줄에 match)
+_LINE_PATTERN = re.compile(
+    r'(?P<heading>#{1,3} )'
+    r'|(?P<numbered>\d+[\.\)]\s)'
+    r'|(?P<bulleted>[-*] )'
+    r'|(?P<hash>#)'
+)
+
+# URL 끝에 붙는 구두점/닫는 괄호
+_URL_TRAILING_CHARS = ').,;:!?"\'”’》〉】]'
+
+_BLANK, _HEADING, _NUMBERED, _BULLETED, _HASH, _TEXT = range(6)
+_HEADING_TYPES = {2: "heading_1", 3: "heading_2", 4: "heading_3"}
+
+
+def parse_inline_formatting(text):
+    """텍스트에서 **bold**, Markdown 링크, 일반 URL 같은 인라인 서식을 파싱하여 Notion rich_text 객체 배열로 반환"""
+    rich_text_elements = []
+    last_idx = 0
+
+    for match in _INLINE_PATTERN.finditer(text):
+        start, end = match.span()
+
+        # Add preceding plain text
+        if start > last_idx:
+            rich_text_elements.append({"type": "text", "text": {"content": text[last_idx:start]}})
+
+        md_text = match.group('md_text')
+        if md_text:  # Markdown link
+            rich_text_elements.append({
+                "type": "text",
+                "text": {"content": md_text, "link": {"url": match.group('md_url')}},
+                "annotations": {"bold": False}
+            })
+        else:
+            bold_text = match.group('bold_text')
+            if bold_text:
+                rich_text_elements.append({
+                    "type": "text",
+                    "text": {"content": bold_text},
+                    "annotations": {"bold": True}
+                })
+            else:  # Raw URL
+                raw_url = match.group('raw_url').rstrip(_URL_TRAILING_CHARS)
+                rich_text_elements.append({
+                    "type": "text",
+                    "text": {"content": raw_url, "link": {"url": raw_url}},
+                    "annotations": {"bold": False}
+                })
+
+        last_idx = end
+
+    # Add any remaining plain text at the end
+    if last_idx < len(text):
+        rich_text_elements.append({"type": "text", "text": {"content": text[last_idx:]}})
+
+    return rich_text_elements
+
+
+def _tokenize(lines):
+    """줄마다 (종류, strip된 줄, 표식 길이) 판별 — 정규식은 줄당 최대 한 번"""
+    tokens = []
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            tokens.append((_BLANK, stripped, 0))
+            continue
+        match = _LINE_PATTERN.match(stripped)
+        if match is None:
+            tokens.append((_TEXT, stripped, 0))
+        elif match.lastgroup == "heading":
+            tokens.append((_HEADING, stripped, match.end()))
+        elif match.lastgroup == "numbered":
+            tokens.append((_NUMBERED, stripped, match.end()))
+        elif match.lastgroup == "bulleted":
+            tokens.append((_BULLETED, stripped, 2))
+        else:
+            # '#'로 시작하지만 제목이 아닌 줄: 문단이 되지만 앞 블록의 이어붙이기는 끊는다
+            tokens.append((_HASH, stripped, 0))
+    return tokens
+
+
+def _block(block_type, text):
+    return {"object": "block", "type": block_type, block_type: {"rich_text": parse_inline_formatting(text)}}
+
+
+def markdown_to_notion_blocks(content):
+    """요약 마크다운 텍스트를 Notion 블록 리스트로 변환"""
+    lines = content.split('\n')
+    tokens = _tokenize(lines)
+    blocks = []
+    n = len(lines)
+    i = 0
+
+    while i < n:
+        kind, stripped, marker_len = tokens[i]
+
+        if kind == _BLANK:
+            i += 1
+            continue
+
+        if kind == _HEADING:
+            blocks.append(_block(_HEADING_TYPES[marker_len], stripped[marker_len:]))
+            i += 1
+            continue
+
+        if kind == _NUMBERED or kind == _BULLETED:
+            block_type = 'numbered_list_item' if kind == _NUMBERED else 'bulleted_list_item'
+            parts = [stripped[marker_len:]]
+        else:
+            # 일반 문단 (_TEXT 또는 _HASH): 원래 줄을 그대로 사용
+            block_type = 'paragraph'
+            parts = [lines[i]]
+
+        # 다음 줄이 일반 텍스트인 동안 같은 블록으로 이어붙임
+        i += 1
+        while i < n and tokens[i][0] == _TEXT:
+            parts.append(lines[i])
+            i += 1
+        blocks.append(_block(block_type, '\n'.join(parts)))
+
+    return blocks
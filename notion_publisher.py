@@ -0,0 +1,213 @@
+"""
+Notion 리포트 게시
+
+- 페이지를 먼저 만든 뒤 블록을 순서대로 배치(최대 100개, 페이로드 크기 제한) 단위로 추가
+- 429/5xx는 Retry-After(없으면 지수 백오프 + 지터)를 지켜 재시도
+- 같은 '날짜' 페이지가 이미 있으면 새 페이지에 본문을 모두 올린 뒤에 기존 페이지를 보관(archive)
+  (재실행해도 중복 페이지 없음, 도중에 실패해도 기존 페이지는 그대로 남음)
+- 여러 날짜를 게시할 때는 publish_many로 동시에 처리하되 전체 요청 수는 하나의 TokenBucket으로 제한
+
+notion 인자는 notion_client.Client와 같은 메서드(pages/blocks/databases)를 가진 객체면 된다.
+notion-client 3.x(Notion-Version 2025-09-03)에는 databases.query가 없으므로 같은 날짜 페이지는
+DB의 데이터 소스(data_sources.query)로 찾는다.
+"""
+import json
+import random
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from ratelimit import TokenBucket
+
+TITLE_PROPERTY_NAME = "이름"
+DATE_PROPERTY_NAME = "날짜"
+
+NOTION_MAX_CHILDREN = 100  # 요청 1건당 children 최대 개수
+NOTION_MAX_TEXT = 2000  # rich_text 1개당 content 최대 길이
+NOTION_MAX_PAYLOAD_BYTES = 400_000  # 요청 본문 한도(약 500KB)보다 여유 있게
+NOTION_REQUESTS_PER_SECOND = 3  # Notion API 평균 허용 속도
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 5
+
+
+def _retry_after(error):
+    headers = getattr(error, "headers", None) or {}
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def call_with_retry(fn, *args, limiter=None, max_retries=MAX_RETRIES, base_delay=1.0, **kwargs):
+    """Notion API 호출 (429/5xx 재시도, limiter가 있으면 호출마다 토큰 1개 사용)"""
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            status = getattr(e, "status", None)
+            if status not in RETRY_STATUSES or attempt >= max_retries:
+                raise
+            delay = _retry_after(e)
+            if delay is None:
+                delay = base_delay * (2 ** attempt) * (0.5 + random.random())
+            attempt += 1
+            print(f"     ⏳ Notion {status} 응답, {delay:.1f}초 후 재시도 ({attempt}/{max_retries})")
+            time.sleep(delay)
+
+
+def _split_rich_text(rich_text):
+    out = []
+    for element in rich_text:
+        content = element.get("text", {}).get("content", "")
+        if len(content) <= NOTION_MAX_TEXT:
+            out.append(element)
+            continue
+        for start in range(0, len(content), NOTION_MAX_TEXT):
+            piece = dict(element)
+            piece["text"] = dict(element["text"], content=content[start:start + NOTION_MAX_TEXT])
+            out.append(piece)
+    return out
+
+
+def split_long_text(blocks):
+    """content가 2000자를 넘는 rich_text를 여러 개로 분할"""
+    out = []
+    for block in blocks:
+        block_type = block.get("type")
+        body = block.get(block_type)
+        if isinstance(body, dict) and "rich_text" in body:
+            block = dict(block)
+            block[block_type] = dict(body, rich_text=_split_rich_text(body["rich_text"]))
+        out.append(block)
+    return out
+
+
+def batch_blocks(blocks, max_children=NOTION_MAX_CHILDREN, max_bytes=NOTION_MAX_PAYLOAD_BYTES):
+    """블록을 순서를 유지한 채 개수/크기 제한에 맞춰 나눔"""
+    batches = []
+    current = []
+    current_bytes = 0
+    for block in blocks:
+        size = len(json.dumps(block, ensure_ascii=False).encode("utf-8"))
+        if current and (len(current) >= max_children or current_bytes + size > max_bytes):
+            batches.append(current)
+            current = []
+            current_bytes = 0
+        current.append(block)
+        current_bytes += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+# 클라이언트별 {database_id: data_source_id} (DB마다 databases.retrieve 한 번만)
+_data_source_ids = weakref.WeakKeyDictionary()
+_data_source_lock = threading.Lock()
+
+
+def _data_source_id(notion, database_id, limiter=None):
+    """DB의 첫 번째 데이터 소스 id (리포트 DB는 데이터 소스가 하나)"""
+    with _data_source_lock:
+        cached = _data_source_ids.get(notion, {}).get(database_id)
+    if cached:
+        return cached
+    database = call_with_retry(notion.databases.retrieve, database_id=database_id, limiter=limiter)
+    sources = database.get("data_sources") or []
+    if not sources:
+        raise ValueError(f"데이터 소스가 없는 데이터베이스: {database_id}")
+    with _data_source_lock:
+        _data_source_ids.setdefault(notion, {})[database_id] = sources[0]["id"]
+    return sources[0]["id"]
+
+
+def find_existing_pages(notion, database_id, date_str, limiter=None, date_property=DATE_PROPERTY_NAME):
+    """같은 날짜 속성을 가진 (보관되지 않은) 페이지 id 목록"""
+    body = {"filter": {"property": date_property, "date": {"equals": date_str}}, "page_size": 100}
+    data_sources = getattr(notion, "data_sources", None)
+    if data_sources is not None and hasattr(data_sources, "query"):
+        data_source_id = _data_source_id(notion, database_id, limiter=limiter)
+        result = call_with_retry(data_sources.query, data_source_id=data_source_id, limiter=limiter, **body)
+    elif hasattr(notion.databases, "query"):
+        result = call_with_retry(notion.databases.query, database_id=database_id, limiter=limiter, **body)
+    else:
+        result = call_with_retry(notion.request, path=f"databases/{database_id}/query", method="POST",
+                                 body=body, limiter=limiter)
+    return [page["id"] for page in result.get("results", [])
+            if not page.get("archived") and not page.get("in_trash")]
+
+
+def archive_page(notion, page_id, limiter=None):
+    call_with_retry(notion.pages.update, page_id=page_id, archived=True, limiter=limiter)
+
+
+def publish_report(notion, database_id, title, date_str, blocks, limiter=None,
+                   title_property=TITLE_PROPERTY_NAME, date_property=DATE_PROPERTY_NAME):
+    """
+    리포트 페이지 생성 (같은 날짜 페이지가 있으면 교체)
+
+    블록을 하나씩 지우며 기존 페이지를 비우면 수백 블록에 수 분이 걸리고, 도중에 실패하면 반쯤 빈 페이지가
+    남는다. 그래서 항상 새 페이지에 본문을 다 올린 다음 기존 페이지를 보관한다. 본문을 올리다 실패하면
+    새 페이지를 보관하고(가능하면) 예외를 그대로 올려 기존 페이지가 남게 한다.
+    같은 날짜 페이지 조회가 실패하면 경고만 남기고 새 페이지는 그대로 만든다(이때는 기존 페이지가 남음).
+
+    Returns:
+        tuple: (page_id, 기존 페이지 교체 여부)
+    """
+    properties = {
+        title_property: {"title": [{"text": {"content": title}}]},
+        date_property: {"date": {"start": date_str}},
+    }
+
+    try:
+        existing = find_existing_pages(notion, database_id, date_str, limiter=limiter, date_property=date_property)
+    except Exception as e:
+        print(f"     ⚠️  {date_str} 기존 페이지 조회 실패, 교체 없이 새로 만듦: {e}")
+        existing = []
+    page = call_with_retry(notion.pages.create, parent={"database_id": database_id},
+                           properties=properties, limiter=limiter)
+    page_id = page["id"]
+
+    try:
+        for batch in batch_blocks(split_long_text(blocks)):
+            call_with_retry(notion.blocks.children.append, block_id=page_id, children=batch, limiter=limiter)
+    except Exception:
+        try:
+            archive_page(notion, page_id, limiter=limiter)
+        except Exception:
+            pass  # 원래 오류를 알리는 것이 우선 (남은 페이지는 다음 게시 때 기존 페이지로 보관됨)
+        raise
+
+    # 이전 실행에서 보관에 실패해 같은 날짜 페이지가 여럿 남았어도 모두 정리
+    for old_page_id in existing:
+        archive_page(notion, old_page_id, limiter=limiter)
+    return page_id, bool(existing)
+
+
+def publish_many(notion, database_id, jobs, max_workers=3, requests_per_second=NOTION_REQUESTS_PER_SECOND):
+    """
+    여러 리포트를 동시에 게시 (전체 요청 속도는 requests_per_second로 제한)
+
+    Args:
+        jobs (list[tuple]): (title, date_str, blocks)
+
+    Returns:
+        list[dict]: 작업 순서대로 date, page_id, updated, error
+    """
+    limiter = TokenBucket(requests_per_second)
+
+    def _publish(job):
+        title, date_str, blocks = job
+        try:
+            page_id, updated = publish_report(notion, database_id, title, date_str, blocks, limiter=limiter)
+            return {"date": date_str, "page_id": page_id, "updated": updated, "error": None}
+        except Exception as e:
+            return {"date": date_str, "page_id": None, "updated": False, "error": e}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return list(executor.map(_publish, jobs))
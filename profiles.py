@@ -0,0 +1,141 @@
+"""
+브리핑 프로필 (대상 독자별 키워드/프롬프트/Notion DB)
+
+하나의 실행에서 여러 독자용 브리핑(예: 임원, IT팀, 재무팀)을 만든다. 프로필마다 main.py를 따로 돌리면
+수집과 중복 제거를 그만큼 반복하므로, 모든 프로필 키워드의 합집합을 한 번 수집·중복 제거(·본문 보강)한 뒤
+프로필별로 기사를 골라 선별 → 요약 → 저장 → Notion 등록을 동시에 진행한다.
+
+    python main.py --briefing-profiles                  # profiles.json
+    python main.py --briefing-profiles team.json --from 2026-01-01 --to 2026-01-07
+
+profiles.json 예:
+
+    {
+      "profiles": [
+        {"name": "exec", "title": "임원 브리핑", "keywords": ["금융", "증시", "환율", "은행"],
+         "audience": "금융사 임원", "insight": "경영진이 내일 확인해야 할 리스크와 기회 정리",
+         "notion_database_env": "NOTION_DATABASE_ID_EXEC"},
+        {"name": "it", "title": "IT팀 브리핑", "keywords": ["IT", "AI", "테크", "디지털자산"],
+         "notion_database_id": "..."}
+      ]
+    }
+
+  - keywords: 이 프로필이 다루는 키워드 (없으면 main.NAVER_KEYWORDS 전체). 수집한 기사 중 제목/요약에
+    키워드가 들어간 기사만 이 프로필의 요약 입력 후보가 된다 (영문 키워드는 단어 단위로 대소문자 무시).
+    --summary-mode map-reduce의 주제별 묶음도 이 키워드 순서로 나눈다
+  - audience: 시스템 프롬프트에 덧붙일 독자 설명 / insight: 리포트 마지막 항목(인사이트) 지시문
+  - notion_database_id 또는 notion_database_env(기본 NOTION_DATABASE_ID): 프로필별 Notion DB
+    (같은 날짜 페이지를 갱신하는 방식이라 프로필끼리 DB를 공유할 수 없다)
+"""
+import json
+import os
+import re
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PROFILES_PATH = os.path.join(BASE_DIR, "profiles.json")
+
+DEFAULT_INSIGHT = "금융권 개발자를 지망하는 취업준비생을 위한 인사이트 추출"
+DEFAULT_DATABASE_ENV = "NOTION_DATABASE_ID"
+
+_NAME_RE = re.compile(r"^[\w-]+$")
+_FIELDS = {"name", "title", "keywords", "audience", "insight", "notion_database_id", "notion_database_env"}
+
+
+class ProfileError(ValueError):
+    """프로필 설정 오류"""
+
+
+class Profile:
+    def __init__(self, name, title=None, keywords=None, audience=None, insight=DEFAULT_INSIGHT,
+                 notion_database_id=None, notion_database_env=DEFAULT_DATABASE_ENV):
+        self.name = name
+        self.title = title or name
+        self.keywords = list(keywords or [])
+        self.audience = audience
+        self.insight = insight or DEFAULT_INSIGHT
+        self.notion_database_id = notion_database_id
+        self.notion_database_env = notion_database_env or DEFAULT_DATABASE_ENV
+        self._pattern = self._compile(self.keywords) if self.keywords else None
+
+    @staticmethod
+    def _compile(keywords):
+        parts = []
+        for keyword in sorted(set(keywords), key=len, reverse=True):
+            escaped = re.escape(keyword)
+            if keyword.isascii():
+                escaped = rf"(?<![A-Za-z0-9]){escaped}(?![A-Za-z0-9])"
+            parts.append(escaped)
+        return re.compile("|".join(parts), re.IGNORECASE)
+
+    @property
+    def database_id(self):
+        return self.notion_database_id or os.getenv(self.notion_database_env)
+
+    def matches(self, article):
+        if self._pattern is None:
+            return True
+        return bool(self._pattern.search(article.get("title", ""))
+                    or self._pattern.search(article.get("summary", "")))
+
+    def select_candidates(self, articles):
+        """이 프로필 키워드가 들어간 기사 (중복 제거 결과 순서 유지)"""
+        return [article for article in articles if self.matches(article)]
+
+    def __repr__(self):
+        return f"Profile({self.name!r})"
+
+
+def load_profiles(path=DEFAULT_PROFILES_PATH):
+    """
+    프로필 설정 파일 읽기 (Notion DB ID가 없는 프로필은 등록 단계에서만 실패로 처리)
+
+    Raises:
+        ProfileError: 파일을 읽을 수 없거나 형식/이름이 잘못됐거나, 두 프로필이 같은 Notion DB를 씀
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except OSError as e:
+        raise ProfileError(f"프로필 파일을 읽을 수 없습니다: {path} ({e})")
+    except ValueError as e:
+        raise ProfileError(f"프로필 파일 JSON 형식 오류: {path} ({e})")
+
+    entries = data.get("profiles") if isinstance(data, dict) else data
+    if not isinstance(entries, list) or not entries:
+        raise ProfileError(f"프로필이 없습니다: {path} ('profiles' 목록 필요)")
+
+    profiles = []
+    for entry in entries:
+        if not isinstance(entry, dict) or not entry.get("name"):
+            raise ProfileError(f"프로필마다 'name'이 필요합니다: {entry!r}")
+        unknown = set(entry) - _FIELDS
+        if unknown:
+            raise ProfileError(f"'{entry['name']}' 프로필에 알 수 없는 항목: {', '.join(sorted(unknown))}")
+        if not _NAME_RE.match(entry["name"]):
+            raise ProfileError(f"프로필 이름은 글자/숫자/_/-만 쓸 수 있습니다 (파일 이름에 사용): {entry['name']!r}")
+        keywords = entry.get("keywords") or []
+        if not isinstance(keywords, list) or not all(isinstance(k, str) and k.strip() for k in keywords):
+            raise ProfileError(f"'{entry['name']}' 프로필의 keywords는 문자열 목록이어야 합니다")
+        profiles.append(Profile(**{**entry, "keywords": [k.strip() for k in keywords]}))
+
+    names = [profile.name for profile in profiles]
+    duplicated = sorted({name for name in names if names.count(name) > 1})
+    if duplicated:
+        raise ProfileError(f"프로필 이름이 중복됩니다: {', '.join(duplicated)}")
+
+    owners = {}
+    for profile in profiles:
+        database_id = profile.database_id
+        if database_id and database_id in owners:
+            raise ProfileError(f"'{profile.name}' 프로필이 '{owners[database_id]}' 프로필과 같은 Notion DB를 씁니다 "
+                               "(같은 날짜 페이지를 서로 덮어씀)")
+        owners.setdefault(database_id, profile.name)
+    return profiles
+
+
+def union_keywords(profiles, default_keywords):
+    """수집할 키워드: 프로필 키워드 합집합 (처음 나온 순서 유지, 키워드가 없는 프로필이 있으면 기본 키워드 포함)"""
+    keywords = []
+    for profile in profiles:
+        keywords.extend(profile.keywords or default_keywords)
+    return list(dict.fromkeys(keywords))
@@ -0,0 +1,250 @@
+"""
+네이버 키워드 조회 계획
+
+키워드 목록은 서로 많이 겹친다 ('은행'이 '하나은행'/'우리은행'/'기업은행'을 대부분 포함하고,
+'증시'/'주식'/'증권'은 거의 같은 기사를 돌려줌). 겹친 기사는 dedup_by_url에서 버려지지만
+이미 일일 호출 한도를 쓴 뒤다.
+
+실행마다 키워드별로 수집한 기사 키(URL) 집합에서
+  - 고유 수익률(yield): 다른 키워드에서는 나오지 않은 기사 비율
+  - 겹침(overlap): 이 키워드 기사 중 다른 키워드에도 나온 비율 (상위 몇 개)
+을 지수 이동 평균으로 .cache/keyword_stats.json에 누적하고, 다음 실행에서
+  - 순서: 고유 수익률이 높은(넓은) 키워드부터 조회 → 좁은 키워드는 이미 본 기사가 많은 상태에서 조회
+  - 건너뛰기: 이력이 충분하고 고유 수익률이 SKIP_YIELD 미만이며 다른 키워드가 COVER_OVERLAP 이상 덮는 키워드
+  - 조기 종료(early_stop=True일 때만, --early-stop): 대상 기간 기사가 있는 p번째 페이지에서 처음 보는 기사 비율이
+    EARLY_STOP_YIELD 미만이면 그 키워드는 더 내려가지 않음
+을 적용한다. PROBE_EVERY번에 한 번(첫 실행 포함)은 계획 없이 모두 조회해 건너뛴 키워드의 통계와
+비교 기준이 되는 전체 조회 고유 기사 수를 갱신한다.
+active=False이면 설정된 순서대로 모두 조회하고 통계만 기록한다.
+건너뛴 키워드와 조기 종료한 키워드는 실행 지표(metrics events)에도 하나씩 남는다.
+
+조기 종료의 '처음 보는 기사'는 키워드들이 동시에 조회되더라도 실행마다 같게 판정해야 하므로,
+계획 순서상 앞선 키워드들의 처음 p페이지(대상 기간 페이지 기준, 그보다 짧으면 끝까지)와
+이 키워드의 앞 페이지에 없던 기사로 센다. 그래서 p번째 페이지 판정은 앞선 키워드가 p페이지를 보거나
+끝날 때까지 기다린다 (스레드 풀이 계획 순서대로 시작하므로 가장 앞선 미완료 키워드는 기다리지 않음).
+"""
+import json
+import os
+import threading
+from collections import Counter
+from datetime import datetime
+
+from article_store import article_key
+from metrics import current as current_metrics
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_STATS_PATH = os.path.join(BASE_DIR, ".cache", "keyword_stats.json")
+
+EMA_ALPHA = 0.3
+MIN_RUNS = 3  # 건너뛰기 판단에 필요한 최소 조회 횟수
+SKIP_YIELD = 0.05
+COVER_OVERLAP = 0.8
+PROBE_EVERY = 7
+EARLY_STOP_YIELD = 0.1
+EARLY_STOP_MIN_PAGES = 2  # 대상 기간 기사가 있는 페이지를 이만큼은 본 뒤에만 조기 종료
+OVERLAP_TOP = 3
+
+
+def _ema(previous, value):
+    return value if previous is None else round((1 - EMA_ALPHA) * previous + EMA_ALPHA * value, 4)
+
+
+class KeywordPlanner:
+    """
+    한 번의 수집(키워드 순회)에 대한 계획과 기록
+
+        keywords = planner.plan(NAVER_KEYWORDS, first_page_only)
+        ... 페이지마다 planner.observe(keyword, 대상 기간 기사) → False이면 그 키워드 중단
+        ... 키워드 조회가 끝나면(오류 포함) planner.done(keyword)
+        summary = planner.finish(results)
+    """
+
+    def __init__(self, path=DEFAULT_STATS_PATH, active=True, early_stop=False):
+        self.path = path
+        self.active = active
+        self.early_stop = early_stop
+        self.stats = self._load()
+        self.mode = "paged"
+        self.probe = False
+        self.skipped = {}  # 키워드 → 덮는 키워드
+        self.early_stopped = {}  # 키워드 → 대상 기간 페이지 수
+        self._lock = threading.Lock()
+        self._progress = threading.Condition(self._lock)
+        self._order = []
+        self._seen = set()
+        self._keys = {}
+        self._page_keys = {}  # 키워드 → 대상 기간 페이지별 기사 키 집합 목록
+        self._finished = set()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"keywords": {}, "runs": {}}
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.stats, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def plan(self, keywords, first_page_only=False):
+        """조회할 키워드 목록 (조회 순서대로)"""
+        self.mode = "first_page" if first_page_only else "paged"
+        self.probe = self.stats["runs"].get(self.mode, {}).get("count", 0) % PROBE_EVERY == 0
+        if not self.active:
+            # 계획을 끈 실행은 설정된 순서 그대로 (통계만 쌓음)
+            self._order = list(keywords)
+            return list(keywords)
+        stats = self.stats["keywords"]
+        order = {keyword: index for index, keyword in enumerate(keywords)}
+        # 이력이 없는 키워드는 수익률 1로 보고 앞에 둔다 (처음 몇 번은 모두 조회되며 통계가 쌓임)
+        ordered = sorted(keywords, key=lambda k: (-(stats.get(k, {}).get("yield") or 1.0), order[k]))
+        if not self._planning:
+            self._order = ordered
+            return ordered
+
+        planned = []
+        for keyword in ordered:
+            stat = stats.get(keyword, {})
+            if stat.get("runs", 0) >= MIN_RUNS and stat.get("yield", 1.0) < SKIP_YIELD:
+                coverer = next((other for other, ratio in stat.get("overlap", [])
+                                if ratio >= COVER_OVERLAP and other in order and other not in self.skipped), None)
+                if coverer:
+                    self.skipped[keyword] = coverer
+                    current_metrics().event("keyword_skip", keyword=keyword, covered_by=coverer,
+                                            keyword_yield=stat.get("yield"), mode=self.mode)
+                    continue
+            planned.append(keyword)
+        self._order = planned
+        return planned
+
+    @property
+    def _planning(self):
+        return self.active and not self.probe
+
+    def observe(self, keyword, articles):
+        """
+        페이지 하나의 대상 기간 기사 기록
+
+        Returns:
+            bool: 다음 페이지를 계속 조회할지
+        """
+        keys = {article_key(a) for a in articles}
+        with self._progress:
+            self._keys.setdefault(keyword, set()).update(keys)
+            if not keys:
+                return True
+            self._seen.update(keys)
+            pages = self._page_keys.setdefault(keyword, [])
+            pages.append(keys)
+            page = len(pages)
+            self._progress.notify_all()
+
+            if not (self.early_stop and self._planning) or self.mode == "first_page" or page < EARLY_STOP_MIN_PAGES:
+                return True
+            earlier = self._order[:self._order.index(keyword)] if keyword in self._order else []
+            self._progress.wait_for(lambda: all(
+                other in self._finished or len(self._page_keys.get(other, ())) >= page for other in earlier))
+            seen = set().union(*pages[:-1], *(k for other in earlier for k in self._page_keys.get(other, [])[:page]))
+
+        fresh_ratio = len(keys - seen) / len(keys)
+        if fresh_ratio >= EARLY_STOP_YIELD:
+            return True
+        with self._lock:
+            self.early_stopped[keyword] = page
+        current_metrics().event("keyword_early_stop", keyword=keyword, pages=page, fresh_ratio=round(fresh_ratio, 3))
+        return False
+
+    def done(self, keyword):
+        """키워드 조회 종료 (뒤 키워드의 조기 종료 판정이 이 키워드를 더 기다리지 않게 함)"""
+        with self._progress:
+            self._finished.add(keyword)
+            self._progress.notify_all()
+
+    def finish(self, results):
+        """
+        조회 결과로 통계 갱신·저장하고 요약 반환
+
+        Args:
+            results (list): _fetch_naver_keyword 결과 (keyword, pages, error)
+        """
+        stats = self.stats["keywords"]
+        counts = Counter(key for keys in self._keys.values() for key in keys)
+        calls = 0
+        estimated_saved = 0.0
+        estimated_missed = 0.0
+
+        for result in results:
+            keyword = result["keyword"]
+            calls += result["pages"]
+            if result["error"]:
+                continue
+            keys = self._keys.get(keyword, set())
+            stat = stats.setdefault(keyword, {})
+            complete = keyword not in self.early_stopped
+            pages_key = f"pages_{self.mode}"
+            if not complete and stat.get(pages_key):
+                estimated_saved += max(0.0, stat[pages_key] - result["pages"])
+                if stat.get("items") and stat.get("yield") is not None:
+                    estimated_missed += max(0.0, stat["items"] - len(keys)) * stat["yield"]
+
+            stat["runs"] = stat.get("runs", 0) + 1
+            stat["updated"] = datetime.now().isoformat(timespec="seconds")
+            if keys:
+                exclusive = sum(1 for key in keys if counts[key] == 1)
+                stat["yield"] = _ema(stat.get("yield"), exclusive / len(keys))
+                overlaps = [
+                    (other, round(len(keys & other_keys) / len(keys), 3))
+                    for other, other_keys in self._keys.items() if other != keyword
+                ]
+                stat["overlap"] = sorted((item for item in overlaps if item[1] >= 0.1),
+                                         key=lambda item: -item[1])[:OVERLAP_TOP]
+            if complete:
+                # 조기 종료한 실행의 건수/페이지 수는 잘린 값이라 평균에 넣지 않음
+                stat["items"] = _ema(stat.get("items"), len(keys))
+                stat[pages_key] = _ema(stat.get(pages_key), result["pages"])
+
+        for keyword in self.skipped:
+            stat = stats[keyword]
+            estimated_saved += stat.get(f"pages_{self.mode}") or 1
+            estimated_missed += (stat.get("items") or 0) * (stat.get("yield") or 0)
+
+        run_stats = self.stats["runs"].setdefault(self.mode, {})
+        run_stats["count"] = run_stats.get("count", 0) + 1
+        previous_unique = run_stats.get("unique")
+        if not self.skipped and not self.early_stopped:
+            run_stats["unique"] = _ema(previous_unique, len(self._seen))
+        self._save()
+
+        return {
+            "probe": self.probe and self.active,
+            "calls": calls,
+            "estimated_saved": round(estimated_saved),
+            "skipped": dict(self.skipped),
+            "early_stopped": dict(self.early_stopped),
+            "unique": len(self._seen),
+            "typical_unique": round(previous_unique) if previous_unique is not None else None,
+            "estimated_missed": round(estimated_missed),
+        }
+
+    @staticmethod
+    def summary_lines(summary):
+        if summary["probe"]:
+            lines = [f"API 호출 {summary['calls']}회 (전체 조회로 키워드 통계 갱신)"]
+        else:
+            lines = [f"API 호출 {summary['calls']}회 (계획으로 약 {summary['estimated_saved']}회 절약)"]
+        if summary["skipped"]:
+            lines.append("건너뜀: " + ", ".join(f"'{k}'(← '{v}')" for k, v in summary["skipped"].items()))
+        if summary["early_stopped"]:
+            lines.append("조기 종료: " + ", ".join(f"'{k}'({pages}페이지)"
+                                               for k, pages in summary["early_stopped"].items()))
+        coverage = f"고유 기사 {summary['unique']}개"
+        if summary["typical_unique"] is not None:
+            coverage += f" (전체 조회 평균 {summary['typical_unique']}개)"
+        if summary["estimated_missed"]:
+            coverage += f", 놓쳤을 것으로 추정되는 고유 기사 약 {summary['estimated_missed']}개"
+        lines.append(coverage)
+        return lines
@@ -0,0 +1,35 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """토큰 버킷 방식 요청 속도 제한기 (여러 스레드가 하나를 공유)
+
+    Args:
+        rate (float): 초당 보충되는 토큰 수 (= 허용 QPS)
+        burst (float): 한 번에 몰아서 쓸 수 있는 최대 토큰 수 (기본값: rate)
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1.0):
+        """토큰을 얻을 때까지 대기. 실제로 대기한 시간(초)을 반환"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
@@ -0,0 +1,328 @@
+"""
+지난 리포트 검색 색인
+
+reports/daily_report_YYYYMMDD[_프로필].txt를 항목(섹션의 번호 매긴 기사 하나, 또는 '오늘의 핵심' 문단) 단위로 나눠
+SQLite 역색인(.cache/report_index.sqlite3)에 넣는다. 리포트 저장 단계에서 그 날짜 리포트만 다시 색인하고,
+검색할 때는 크기/수정 시각이 바뀐 파일만 다시 읽으므로 파일 전체를 훑지 않는다.
+
+토큰화: 한글 연속 구간은 글자 2-gram(한 글자 단어는 그대로), 영문/숫자는 소문자 단어 하나.
+형태소 분석 없이도 '롯데손해보험' → 롯데/데손/손해/해보/보험 처럼 조사·붙여쓰기와 무관하게 찾을 수 있다.
+검색어의 n-gram을 모두 가진 항목을 색인에서 고른 뒤, 저장해 둔 항목 텍스트로 실제 포함 여부를 확인한다.
+
+    python main.py search 스테이블코인                      # 언제 다뤘는지 (최근 순)
+    python main.py search 롯데손해보험 --from 2026-01-01 --to 2026-01-31 --section 경제
+    python main.py search AI --profile it                   # 프로필 브리핑만 (--briefing-profiles 실행 결과)
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INDEX_PATH = os.path.join(BASE_DIR, ".cache", "report_index.sqlite3")
+DEFAULT_REPORTS_DIR = "reports"  # save_report와 같은 위치 (실행 디렉터리 기준)
+
+SCHEMA_VERSION = 2  # 바뀌면 색인을 지우고 리포트 파일에서 다시 만든다
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    day      TEXT NOT NULL,
+    profile  TEXT NOT NULL,
+    path     TEXT NOT NULL,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    PRIMARY KEY (day, profile)
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id      INTEGER PRIMARY KEY,
+    day     TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    section TEXT NOT NULL,
+    rank    INTEGER,
+    title   TEXT NOT NULL,
+    text    TEXT NOT NULL,
+    urls    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_day ON entries(day);
+CREATE TABLE IF NOT EXISTS postings (
+    term     TEXT NOT NULL,
+    entry_id INTEGER NOT NULL,
+    PRIMARY KEY (term, entry_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_entry ON postings(entry_id);
+"""
+
+_FILENAME_RE = re.compile(r"daily_report_(\d{4})(\d{2})(\d{2})(?:_([\w-]+))?\.txt$")
+_TOKEN_RE = re.compile(r"[가-힣]+|[a-z0-9]+")
+_ITEM_RE = re.compile(r"^\s*(\d+)\.\s+(.*)$")
+_BULLET_RE = re.compile(r"^[-*•]\s+")
+_LINK_RE = re.compile(r"\[([^\]]*)\]\((https?://[^)\s]+)\)")
+
+
+def tokenize(text):
+    """색인 term 집합 (한글 2-gram + 영문/숫자 단어)"""
+    terms = set()
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token[0].isascii() or len(token) == 1:
+            terms.add(token)
+        else:
+            terms.update(token[i:i + 2] for i in range(len(token) - 1))
+    return terms
+
+
+def _section_name(heading):
+    if "경제" in heading:
+        return "경제"
+    if "IT" in heading.upper():
+        return "IT"
+    return heading
+
+
+def parse_report(text):
+    """
+    리포트 텍스트 → 항목 목록
+
+    Returns:
+        list: {"section", "rank", "title", "text", "urls"} — rank는 번호 매긴 항목의 순위 (문단/목록 줄은 None)
+    """
+    entries = []
+    section = ""
+    current = None
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or set(line) <= {"=", "-"}:
+            current = None if current is not None and current["rank"] is None else current
+            continue
+        if line.startswith("#"):
+            section = _section_name(line.lstrip("#").strip())
+            current = None
+            continue
+
+        urls = [url for _, url in _LINK_RE.findall(line)]
+        body = _LINK_RE.sub(lambda m: "" if m.group(1) == "출처" else m.group(1), line).strip()
+        item = _ITEM_RE.match(body)
+        if item:
+            current = {"section": section, "rank": int(item.group(1)),
+                       "title": item.group(2).replace("**", "").strip(), "lines": [], "urls": []}
+            entries.append(current)
+        elif _BULLET_RE.match(body) and (current is None or current["rank"] is None):
+            # 번호 없는 목록(출처 링크, 트렌드 등)은 줄마다 항목 하나
+            body = _BULLET_RE.sub("", body)
+            current = {"section": section, "rank": None, "title": "", "lines": [], "urls": []}
+            entries.append(current)
+        elif current is None:
+            current = {"section": section, "rank": None, "title": "", "lines": [], "urls": []}
+            entries.append(current)
+        if not item and body:
+            current["lines"].append(body.replace("**", ""))
+        current["urls"].extend(urls)
+
+    for entry in entries:
+        entry["text"] = " ".join([entry["title"]] + entry.pop("lines")).strip()
+    return [entry for entry in entries if entry["text"]]
+
+
+def report_key(path):
+    """리포트 파일 이름 → ('YYYY-MM-DD', 프로필 이름 — 기본 리포트는 '') (형식이 다르면 None)"""
+    match = _FILENAME_RE.search(os.path.basename(path))
+    if match is None:
+        return None
+    year, month, day, profile = match.groups()
+    return f"{year}-{month}-{day}", profile or ""
+
+
+def open_index(path=DEFAULT_INDEX_PATH):
+    """색인 열기 (없으면 생성, 스키마 버전이 다르면 비우고 다시 생성)"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.executescript("DROP TABLE IF EXISTS postings; DROP TABLE IF EXISTS entries; DROP TABLE IF EXISTS reports;")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _remove_report(conn, day, profile):
+    conn.execute("DELETE FROM postings WHERE entry_id IN (SELECT id FROM entries WHERE day = ? AND profile = ?)",
+                 (day, profile))
+    conn.execute("DELETE FROM entries WHERE day = ? AND profile = ?", (day, profile))
+    conn.execute("DELETE FROM reports WHERE day = ? AND profile = ?", (day, profile))
+
+
+def index_report(conn, path):
+    """
+    리포트 파일 하나를 (다시) 색인
+
+    Returns:
+        int: 색인한 항목 수 (리포트 파일 이름 형식이 아니면 0)
+    """
+    key = report_key(path)
+    if key is None:
+        return 0
+    day, profile = key
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    stat = os.stat(path)
+    entries = parse_report(text)
+    with conn:
+        _remove_report(conn, day, profile)
+        conn.execute("INSERT INTO reports (day, profile, path, size, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+                     (day, profile, path, stat.st_size, stat.st_mtime_ns))
+        for entry in entries:
+            cursor = conn.execute(
+                "INSERT INTO entries (day, profile, section, rank, title, text, urls) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (day, profile, entry["section"], entry["rank"], entry["title"], entry["text"],
+                 json.dumps(list(dict.fromkeys(entry["urls"])), ensure_ascii=False)),
+            )
+            conn.executemany("INSERT INTO postings (term, entry_id) VALUES (?, ?)",
+                             ((term, cursor.lastrowid) for term in tokenize(entry["text"])))
+    return len(entries)
+
+
+def sync_reports(conn, directory=DEFAULT_REPORTS_DIR):
+    """
+    크기/수정 시각이 바뀌었거나 새로 생긴 리포트만 색인하고, 지워진 리포트는 색인에서 뺀다
+
+    Returns:
+        tuple: (다시 색인한 리포트 수, 뺀 리포트 수)
+    """
+    indexed = {(day, profile): (path, size, mtime_ns) for day, profile, path, size, mtime_ns
+               in conn.execute("SELECT day, profile, path, size, mtime_ns FROM reports")}
+    seen = set()
+    updated = 0
+    if os.path.isdir(directory):
+        for name in sorted(os.listdir(directory)):
+            key = report_key(name)
+            if key is None:
+                continue
+            path = os.path.join(directory, name)
+            stat = os.stat(path)
+            seen.add(key)
+            if indexed.get(key) != (path, stat.st_size, stat.st_mtime_ns):
+                index_report(conn, path)
+                updated += 1
+    removed = [key for key, (path, _, _) in indexed.items()
+               if key not in seen and os.path.dirname(path) == directory and not os.path.exists(path)]
+    with conn:
+        for key in removed:
+            _remove_report(conn, *key)
+    return updated, len(removed)
+
+
+def _candidate_ids(conn, terms):
+    """모든 term을 가진 항목 id 집합 (한 글자 한글은 그 글자를 포함한 2-gram, 영문/숫자는 단어 앞부분으로 찾음)"""
+    candidates = None
+    for term in sorted(terms, key=len, reverse=True):
+        if term[0].isascii():
+            rows = conn.execute("SELECT entry_id FROM postings WHERE term >= ? AND term < ?",
+                                (term, term + "\uffff"))
+        elif len(term) == 1:
+            rows = conn.execute("SELECT entry_id FROM postings WHERE instr(term, ?) > 0", (term,))
+        else:
+            rows = conn.execute("SELECT entry_id FROM postings WHERE term = ?", (term,))
+        ids = {row[0] for row in rows}
+        candidates = ids if candidates is None else candidates & ids
+        if not candidates:
+            return set()
+    return candidates or set()
+
+
+def _phrase_pattern(phrase):
+    pattern = re.escape(phrase.lower())
+    if phrase[0].isascii() and phrase[0].isalnum():
+        pattern = r"(?<![a-z0-9])" + pattern  # 영문/숫자 검색어는 단어 앞부분부터 일치
+    return re.compile(pattern)
+
+
+def search(conn, query, date_from=None, date_to=None, section=None, limit=None, profile=None):
+    """
+    검색어(공백으로 나눈 구절 모두 포함) 항목 검색 — 최근 날짜 순, 같은 날짜는 리포트 안 순서대로
+
+    Args:
+        profile (str): 지정하면 그 프로필 리포트만 ('' 이면 기본 리포트만)
+
+    Returns:
+        list: {"day", "profile", "section", "rank", "title", "text", "urls"}
+    """
+    phrases = query.split()
+    terms = set()
+    for phrase in phrases:
+        terms |= tokenize(phrase)
+    if not terms:
+        return []
+    ids = _candidate_ids(conn, terms)
+    if not ids:
+        return []
+
+    sql = (f"SELECT day, profile, section, rank, title, text, urls FROM entries "
+           f"WHERE id IN ({','.join('?' * len(ids))})")
+    params = list(ids)
+    if date_from:
+        sql += " AND day >= ?"
+        params.append(date_from)
+    if date_to:
+        sql += " AND day <= ?"
+        params.append(date_to)
+    if section:
+        sql += " AND section = ?"
+        params.append(section)
+    if profile is not None:
+        sql += " AND profile = ?"
+        params.append(profile)
+    sql += " ORDER BY day DESC, id"
+
+    patterns = [_phrase_pattern(phrase) for phrase in phrases]
+    results = []
+    for day, entry_profile, entry_section, rank, title, text, urls in conn.execute(sql, params):
+        lowered = text.lower()
+        if all(pattern.search(lowered) for pattern in patterns):
+            results.append({"day": day, "profile": entry_profile, "section": entry_section, "rank": rank,
+                            "title": title, "text": text, "urls": json.loads(urls)})
+            if limit and len(results) >= limit:
+                break
+    return results
+
+
+def search_main(argv=None):
+    """`python main.py search ...` 진입점"""
+    parser = argparse.ArgumentParser(prog="main.py search", description="지난 리포트 검색 (색인 사용)")
+    parser.add_argument("query", nargs="+", help="검색어 (여러 개면 모두 포함한 항목)")
+    parser.add_argument("--from", dest="from_date", default=None, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="to_date", default=None, help="끝 날짜 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--section", default=None, help="섹션 (경제 / IT)")
+    parser.add_argument("--profile", default=None, help="프로필 이름 (--briefing-profiles 실행 리포트만, 기본: 모든 리포트)")
+    parser.add_argument("--limit", type=int, default=20, help="최대 결과 수 (기본 20, 0이면 전체)")
+    parser.add_argument("--reports-dir", default=DEFAULT_REPORTS_DIR, help="리포트 디렉터리 (기본 reports)")
+    parser.add_argument("--rebuild", action="store_true", help="색인을 지우고 모든 리포트를 다시 색인")
+    args = parser.parse_args(argv)
+
+    conn = open_index()
+    if args.rebuild:
+        with conn:
+            for day, profile in conn.execute("SELECT day, profile FROM reports").fetchall():
+                _remove_report(conn, day, profile)
+    updated, removed = sync_reports(conn, args.reports_dir)
+    if updated or removed:
+        print(f"🗂️  리포트 색인 갱신: {updated}개 색인, {removed}개 제외")
+
+    query = " ".join(args.query)
+    results = search(conn, query, args.from_date, args.to_date, args.section, limit=args.limit or None,
+                     profile=args.profile)
+    conn.close()
+    if not results:
+        print(f"🔎 '{query}' 검색 결과 없음")
+        return results
+
+    more = "+" if args.limit and len(results) >= args.limit else ""
+    print(f"🔎 '{query}' {len(results)}{more}건 (가장 최근: {results[0]['day']})\n")
+    for result in results:
+        where = result["section"] + (f" #{result['rank']}" if result["rank"] is not None else "")
+        if result["profile"]:
+            where = f"{result['profile']} · {where}"
+        title = result["title"] or result["text"][:80] + ("…" if len(result["text"]) > 80 else "")
+        print(f"📅 {result['day']} [{where}] {title}")
+        for url in result["urls"]:
+            print(f"   🔗 {url}")
+    return results
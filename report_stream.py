@@ -0,0 +1,92 @@
+"""
+스트리밍 요약을 리포트 파일에 바로 기록
+
+토큰이 도착하는 대로 `<리포트>.part` 파일에 이어 쓰고, 완료되면 원자적으로
+최종 파일 이름으로 바꾼다. 마크다운 섹션(`#`로 시작하는 줄)이 끝날 때마다
+on_section 콜백을 호출해 Notion 변환 등을 응답 완료 전에 시작할 수 있게 한다.
+"""
+import os
+import time
+
+
+class ReportStreamWriter:
+    """
+    Args:
+        path (str): 최종 리포트 파일 경로
+        prefix (str): 본문 앞에 쓸 텍스트
+        suffix (str): 완료 시 본문 뒤에 쓸 텍스트
+        on_section (callable): 완료된 섹션 텍스트를 받는 콜백
+    """
+
+    def __init__(self, path, prefix="", suffix="", on_section=None):
+        self.path = path
+        self.part_path = f"{path}.part"
+        self.suffix = suffix
+        self.on_section = on_section
+        self.started = time.perf_counter()
+        self.first_token_at = None
+        self.finished_at = None
+        self._line = ""
+        self._section = []
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(self.part_path, "w", encoding="utf-8")
+        self._file.write(prefix)
+
+    def write(self, token):
+        if not token:
+            return
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self._file.write(token)
+        self._file.flush()
+
+        self._line += token
+        while "\n" in self._line:
+            line, self._line = self._line.split("\n", 1)
+            self._add_line(line)
+
+    def _add_line(self, line):
+        # 새 제목 줄이 시작되면 직전 섹션은 더 이상 바뀌지 않는다
+        if line.strip().startswith("#") and self._section:
+            self._emit_section()
+        self._section.append(line)
+
+    def _emit_section(self):
+        text = "\n".join(self._section)
+        self._section = []
+        if self.on_section is not None and text.strip():
+            self.on_section(text)
+
+    def finish(self):
+        """남은 섹션을 내보내고 파일을 최종 경로로 교체"""
+        if self._line:
+            self._add_line(self._line)
+            self._line = ""
+        self._emit_section()
+
+        self._file.write(self.suffix)
+        self._file.close()
+        os.replace(self.part_path, self.path)
+        self.finished_at = time.perf_counter()
+        return self.path
+
+    def abort(self):
+        """실패 시 .part 파일 삭제"""
+        if not self._file.closed:
+            self._file.close()
+        try:
+            os.remove(self.part_path)
+        except OSError:
+            pass
+
+    @property
+    def time_to_first_token(self):
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started
+
+    @property
+    def total_time(self):
+        end = self.finished_at or time.perf_counter()
+        return end - self.started
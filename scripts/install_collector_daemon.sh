@@ -0,0 +1,64 @@
+#!/bin/bash
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd -P)"
+PROJECT_DIR="$(cd "$SCRIPT_DIR/.." && pwd -P)"
+LABEL="com.news-summarizer.collector"
+PLIST_DIR="$HOME/Library/LaunchAgents"
+PLIST_PATH="$PLIST_DIR/$LABEL.plist"
+INTERVAL_MINUTES="${1:-15}"
+
+if [ -x "$PROJECT_DIR/venv/bin/python" ]; then
+  PYTHON_BIN="$PROJECT_DIR/venv/bin/python"
+elif [ -x "$PROJECT_DIR/nenv/bin/python" ]; then
+  PYTHON_BIN="$PROJECT_DIR/nenv/bin/python"
+else
+  PYTHON_BIN="$(command -v python3)"
+fi
+
+mkdir -p "$PLIST_DIR"
+mkdir -p "$PROJECT_DIR/logs"
+
+cat > "$PLIST_PATH" <<PLIST
+<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+  <key>Label</key>
+  <string>$LABEL</string>
+
+  <key>ProgramArguments</key>
+  <array>
+    <string>$PYTHON_BIN</string>
+    <string>-u</string>
+    <string>$PROJECT_DIR/main.py</string>
+    <string>--daemon</string>
+    <string>--interval</string>
+    <string>$INTERVAL_MINUTES</string>
+  </array>
+
+  <key>WorkingDirectory</key>
+  <string>$PROJECT_DIR</string>
+
+  <key>RunAtLoad</key>
+  <true/>
+
+  <key>KeepAlive</key>
+  <true/>
+
+  <key>StandardOutPath</key>
+  <string>$PROJECT_DIR/logs/collector.log</string>
+
+  <key>StandardErrorPath</key>
+  <string>$PROJECT_DIR/logs/collector.err.log</string>
+</dict>
+</plist>
+PLIST
+
+launchctl bootout "gui/$(id -u)/$LABEL" >/dev/null 2>&1 || true
+launchctl bootstrap "gui/$(id -u)" "$PLIST_PATH"
+launchctl enable "gui/$(id -u)/$LABEL"
+
+echo "Installed launchd job: $LABEL"
+echo "Plist path: $PLIST_PATH"
+echo "Polling: every $INTERVAL_MINUTES minutes (daily briefing now reads from the store)"
@@ -18,10 +18,17 @@ else
   exit 1
 fi
 
+# 수집 데몬이 설치되어 있으면 API로 다시 수집하지 않고 저장소에 모인 기사로 브리핑
+ARGS=(--resume)
+if [ -f "$HOME/Library/LaunchAgents/com.news-summarizer.collector.plist" ]; then
+  ARGS+=(--from-store)
+fi
+
 {
-  echo "[$(date '+%Y-%m-%d %H:%M:%S')] start: $PYTHON_BIN main.py"
+  echo "[$(date '+%Y-%m-%d %H:%M:%S')] start: $PYTHON_BIN main.py ${ARGS[*]}"
   cd "$PROJECT_DIR" || exit 1
-  "$PYTHON_BIN" main.py
+  # 같은 날 재실행되면 체크포인트가 있는 단계는 건너뜀
+  "$PYTHON_BIN" main.py "${ARGS[@]}"
   STATUS=$?
   echo "[$(date '+%Y-%m-%d %H:%M:%S')] end: status=$STATUS"
   exit "$STATUS"
@@ -0,0 +1,129 @@
+"""
+요약 프롬프트에 넣을 기사 선별 (토큰 예산 기반)
+
+중복 제거 이후 기사 목록은 사실상 키워드 루프 순서라서 앞에서 N개를 자르면
+특정 키워드/언론사에 치우친다. 여기서는 기사별 가치를 점수화해 토큰 예산 안에
+가장 가치 있는 조합을 채워 넣는다.
+
+점수 = (1 + log(묶인 기사 수)) × 최신성 × 언론사 다양성 페널티
+"""
+import heapq
+import math
+
+from article import Article
+from timestamps import parse_kst
+
+DEFAULT_TOKEN_BUDGET = 16000
+MIN_ARTICLES = 60  # 요약 길이를 줄여서라도 이 정도 개수는 담는다
+SUMMARY_CAPS = (1000, 500, 300, 200, 120, 60)  # 요약(summary) 글자 수 상한 후보, 큰 것부터 시도 (1000은 본문 보강 기사용)
+RECENCY_HALF_LIFE_HOURS = 12.0
+SOURCE_PENALTY = 0.5  # 같은 언론사 기사가 k개 선택돼 있으면 점수 / (1 + 0.5k)
+
+
+def format_article_line(article):
+    """프롬프트에 들어가는 기사 한 건의 텍스트"""
+    return (
+        f"[{article.get('source','')}] {article.get('title','')}\n"
+        f"- 요약: {article.get('summary','')}\n"
+        f"- 링크: {article.get('originallink') or article.get('link')}"
+    )
+
+
+def estimate_tokens(text):
+    """
+    토큰 수 추정 (tokenizer 없이)
+    ASCII는 약 4글자당 1토큰, 한글 등 그 외 문자는 글자당 약 0.8토큰으로 계산
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return int(ascii_chars / 4 + (len(text) - ascii_chars) * 0.8) + 1
+
+
+def _published_ts(article):
+    if isinstance(article, Article):
+        return article.timestamp  # 수집 단계에서 파싱해 둔 값
+    dt = parse_kst(article.get("published", ""))
+    return dt.timestamp() if dt is not None else None
+
+
+def _base_scores(articles):
+    timestamps = [_published_ts(a) for a in articles]
+    newest = max((ts for ts in timestamps if ts is not None), default=None)
+
+    scores = []
+    for a, ts in zip(articles, timestamps):
+        score = 1.0 + math.log(max(1, a.get("dup_count", 1)))
+        if newest is not None and ts is not None:
+            age_hours = max(0.0, (newest - ts) / 3600)
+            score *= 0.5 + 0.5 * math.pow(0.5, age_hours / RECENCY_HALF_LIFE_HOURS)
+        else:
+            score *= 0.5
+        if not a.get("summary"):
+            score *= 0.8
+        scores.append(score)
+    return scores
+
+
+def _trimmed(article, cap):
+    summary = article.get("summary", "")
+    if len(summary) <= cap:
+        return article
+    summary = summary[:cap].rstrip() + "…"
+    if isinstance(article, Article):
+        return article.replace(summary=summary)
+    return {**article, "summary": summary}
+
+
+def _pack(articles, scores, token_budget, cap):
+    """점수 높은 순으로 예산이 찰 때까지 담기 (언론사 페널티는 lazy greedy로 반영)"""
+    heap = [(-score, i, 0) for i, score in enumerate(scores)]
+    heapq.heapify(heap)
+    per_source = {}
+    chosen = []
+    used = 0
+
+    while heap:
+        neg_score, i, penalized_at = heapq.heappop(heap)
+        source = articles[i].get("source", "")
+        picked_from_source = per_source.get(source, 0)
+        if picked_from_source != penalized_at:
+            # 그 사이 같은 언론사 기사가 선택됨 → 점수 갱신 후 다시 넣기
+            adjusted = scores[i] / (1 + SOURCE_PENALTY * picked_from_source)
+            heapq.heappush(heap, (-adjusted, i, picked_from_source))
+            continue
+
+        candidate = _trimmed(articles[i], cap)
+        cost = estimate_tokens(format_article_line(candidate)) + 1
+        if used + cost > token_budget:
+            continue
+        used += cost
+        chosen.append(candidate)
+        per_source[source] = picked_from_source + 1
+
+    return chosen, used
+
+
+def select_articles(articles, token_budget=DEFAULT_TOKEN_BUDGET, min_articles=MIN_ARTICLES):
+    """
+    토큰 예산 안에서 요약 입력 기사 선별
+
+    전체가 예산에 들어가면 그대로(순서 유지) 반환하고, 아니면 summary 길이를
+    SUMMARY_CAPS 순서로 줄여가며 min_articles개 이상 담기는 첫 상한을 사용한다.
+
+    Returns:
+        tuple: (선택된 기사 list — 중요도 순, 추정 토큰 수)
+    """
+    if not articles:
+        return [], 0
+
+    total = sum(estimate_tokens(format_article_line(a)) + 1 for a in articles)
+    if total <= token_budget:
+        return list(articles), total
+
+    scores = _base_scores(articles)
+    target = min(len(articles), min_articles)
+    chosen, used = [], 0
+    for cap in SUMMARY_CAPS:
+        chosen, used = _pack(articles, scores, token_budget, cap)
+        if len(chosen) >= target:
+            break
+    return chosen, used
@@ -0,0 +1,119 @@
+"""
+수집 → 중복 제거 스트리밍 처리
+
+수집기가 페이지 단위로 내보내는 기사 묶음을 받는 즉시
+URL 중복 → (저장소 기준 이미 다룬 기사 제외) → 유사 기사 판정까지 처리한다.
+수집이 끝나기를 기다렸다가 전체를 한 번에 벡터화하는 대신 네트워크 대기 중에 중복 제거가 진행되고,
+유사도 인덱스(dedup.OnlineNearDuplicateIndex)는 고정 크기 해시 특성 공간과 최근 남긴 문서 수 상한으로
+메모리가 묶인다. 수집 원본/URL 중복 제거 결과는 on_collected/on_url_unique로 흘려보내고 보관하지 않는다.
+"""
+from article_store import article_key, known_title_keys, known_urls, title_key, upsert_articles
+from dedup import ONLINE_THRESHOLD, OnlineNearDuplicateIndex
+
+
+class StreamingDedup:
+    """
+    날짜 하나의 스트리밍 중복 제거
+
+    Args:
+        store: 기사 저장소 (None이면 저장/이력 제외 없음)
+        collected_day (str): 저장 시 collected_day 'YYYY-MM-DD'
+        exclude_window (tuple): 이미 다룬 기사 제외 구간 (since_day, before_day) 또는 None
+        summarized_only (bool): 제외 기준이 "요약됨"이면 True, "수집됨"이면 False
+        on_collected, on_url_unique (callable): 기사 묶음을 받는 콜백 (체크포인트 기록용)
+    """
+
+    def __init__(self, store=None, collected_day=None, exclude_window=None, summarized_only=True,
+                 threshold=ONLINE_THRESHOLD, on_collected=None, on_url_unique=None):
+        self.store = store
+        self.collected_day = collected_day
+        self.exclude_window = exclude_window
+        self.summarized_only = summarized_only
+        self.on_collected = on_collected
+        self.on_url_unique = on_url_unique
+        self.threshold = threshold
+        self._index = None
+        self._seen = set()
+        self.unique = []  # 남긴 기사 (OnlineNearDuplicateIndex id 순서와 같음)
+        self.collected = 0
+        self.url_unique = 0
+        self.skipped_history = 0
+        self.skipped_titles = 0
+        self.removed = 0
+        self.error = None
+
+    def add(self, articles):
+        """수집된 기사 묶음 하나 처리"""
+        if not articles:
+            return
+        self.collected += len(articles)
+        if self.on_collected:
+            self.on_collected(articles)
+        if self.store is not None:
+            upsert_articles(self.store, articles, collected_day=self.collected_day)
+
+        # 1) URL 중복 (+ 이전 실행에서 다룬 URL)
+        excluded = set()
+        if self.store is not None and self.exclude_window:
+            excluded = known_urls(self.store, (article_key(a) for a in articles), *self.exclude_window,
+                                  summarized_only=self.summarized_only)
+        fresh = []
+        for a in articles:
+            key = article_key(a)
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            if key in excluded:
+                self.skipped_history += 1
+                continue
+            fresh.append(a)
+        self.url_unique += len(fresh)
+        if self.on_url_unique:
+            self.on_url_unique(fresh)
+
+        # 2) 이전 실행에서 같은 제목으로 다룬 기사 (재송고)
+        if fresh and self.store is not None and self.exclude_window:
+            known = known_title_keys(self.store, (title_key(a.get("title", "")) for a in fresh),
+                                     *self.exclude_window, summarized_only=self.summarized_only)
+            if known:
+                before = len(fresh)
+                fresh = [a for a in fresh if title_key(a.get("title", "")) not in known]
+                self.skipped_titles += before - len(fresh)
+        if not fresh:
+            return
+
+        # 3) 유사 기사 (오류 시 이후 묶음은 유사도 판정 없이 그대로 남김 — 일괄 처리와 같은 폴백)
+        if self.error is None:
+            try:
+                if self._index is None:
+                    self._index = OnlineNearDuplicateIndex(threshold=self.threshold)
+                docs = [(a.get("title", "") + " " + a.get("summary", "")).strip() for a in fresh]
+                verdicts = self._index.add(docs)
+            except Exception as e:
+                self.error = str(e)
+                verdicts = None
+        else:
+            verdicts = None
+
+        if verdicts is None:
+            for a in fresh:
+                a["dup_count"] = 1
+            self.unique.extend(fresh)
+            return
+        for a, (kept, kept_id) in zip(fresh, verdicts):
+            if kept:
+                a["dup_count"] = 1  # 같은 이슈로 묶인 기사 수 (선별 단계의 중요도 신호)
+                self.unique.append(a)
+            else:
+                self.unique[kept_id]["dup_count"] += 1
+                self.removed += 1
+
+    def summary_lines(self):
+        lines = [f"수집 {self.collected}개 → URL 기준 {self.url_unique}개 → 고유 기사 {len(self.unique)}개 "
+                 f"(유사 기사 {self.removed}개 제거)"]
+        if self.skipped_history or self.skipped_titles:
+            lines.append(f"이전 실행에서 다룬 기사 제외: URL 기준 {self.skipped_history}개, "
+                         f"같은 제목 {self.skipped_titles}개")
+        if self.error:
+            lines.append(f"⚠️  유사 기사 판정 오류로 이후 기사는 그대로 사용: {self.error}")
+        return lines
@@ -0,0 +1,93 @@
+"""
+발행 시각 문자열 → KST 시각 정규화
+
+네이버 pubDate는 항상 RFC 822("Wed, 01 Oct 2026 09:30:00 +0900"), RSS는 RFC 822 또는 ISO 8601이라
+범용 파서(dateutil)를 매번 부를 필요가 없다. 기간 백필에서는 수만 건을 파싱하는데 같은 분(minute)에
+나온 기사가 많아 같은 문자열도 반복된다.
+  - 빠른 경로: RFC 822는 정규식 + 월 이름 표, ISO 8601은 datetime.fromisoformat
+  - 그 외 형식만 dateutil로 파싱 (필요할 때 import)
+  - 문자열별 결과는 LRU로 기억 (datetime은 불변이라 그대로 공유해도 안전)
+시간대가 없는 값은 KST로 본다.
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+KST = timezone(timedelta(hours=9))
+
+CACHE_SIZE = 8192
+
+_MONTHS = {name: index for index, name in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), start=1)}
+_ZONES = {"gmt": timezone.utc, "ut": timezone.utc, "utc": timezone.utc, "z": timezone.utc, "kst": KST}
+_RFC822_RE = re.compile(
+    r"^\s*(?:[A-Za-z]{3},?\s+)?(\d{1,2})\s+([A-Za-z]{3})[a-z]*\s+(\d{4})\s+"
+    r"(\d{1,2}):(\d{2})(?::(\d{2}))?\s*(?:([+-])(\d{2}):?(\d{2})|([A-Za-z]{1,3}))?\s*$"
+)
+
+
+def _parse_rfc822(value):
+    match = _RFC822_RE.match(value)
+    if match is None:
+        return None
+    day, month_name, year, hour, minute, second, sign, tz_hours, tz_minutes, zone_name = match.groups()
+    month = _MONTHS.get(month_name.lower())
+    if month is None:
+        return None
+    if sign:
+        offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes))
+        tz = timezone(-offset if sign == "-" else offset)
+    elif zone_name:
+        tz = _ZONES.get(zone_name.lower())
+        if tz is None:
+            return None  # EST 같은 이름 시간대는 dateutil에 맡김
+    else:
+        tz = KST
+    try:
+        return datetime(int(year), month, int(day), int(hour), int(minute), int(second or 0), tzinfo=tz)
+    except ValueError:
+        return None
+
+
+def _parse_iso(value):
+    value = value.strip()
+    if len(value) < 10 or value[4] != "-":
+        return None
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=KST)
+
+
+def _parse_fallback(value):
+    from dateutil import parser as date_parser
+
+    try:
+        dt = date_parser.parse(value)
+    except Exception:
+        return None
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=KST)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_kst(value):
+    """
+    발행 시각 문자열 → KST aware datetime (빈 값이나 파싱 실패는 None)
+    """
+    if not value:
+        return None
+    dt = _parse_rfc822(value) or _parse_iso(value) or _parse_fallback(value)
+    return dt.astimezone(KST) if dt is not None else None
+
+
+def struct_to_kst(parsed):
+    """feedparser의 *_parsed(UTC struct_time) → KST aware datetime"""
+    try:
+        return datetime(*parsed[:6], tzinfo=timezone.utc).astimezone(KST)
+    except (TypeError, ValueError):
+        return None
+
+
+def cache_info():
+    return parse_kst.cache_info()